@@ -0,0 +1,476 @@
+#!/usr/bin/env python3
+"""AppImage kütüphanesini tek bir sıkıştırılmış arşive aktarır ve geri yükler.
+
+Arşiv, bağımsız gzip üyelerinden oluşan bir .tar.gz dosyasıdır: veri 1 MB'lık
+bloklar halinde iş parçacıklarında paralel sıkıştırılır (pigz gibi) ve
+standart gzip araçlarıyla açılabilir. İlk üye `manifest.json`'dur; kaydı ve
+kaynak makinedeki kök dizinleri taşır. Hem aktarma hem geri yükleme akış
+halinde çalışır; bellek kullanımı kütüphane boyutundan bağımsızdır.
+
+Geri yüklemede dosyalar yeni ev dizinine göre yerleştirilir, kayıttaki ve
+.desktop dosyalarındaki yollar yeniden yazılır. Üyeler yalnızca kütüphane
+dizinlerine yazılabilir; sembolik bağlar yalnızca sabit yoldan sürüm
+dizinine göreli bağlar olarak kabul edilir; kayıttaki yollar da aynı
+dizinlerle sınırlıdır. Hedefte aynı boyutta bir
+dosya varsa gelen veri diskteki ile karşılaştırılır; içerik aynıysa dosya
+hiç yazılmadan atlanır.
+"""
+import os
+import io
+import re
+import json
+import time
+import zlib
+import gzip
+import logging
+import tarfile
+from collections import deque
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+import appimage_core as core
+
+FORMAT_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+BLOCK_SIZE = 1024 * 1024
+COMPRESS_LEVEL = 6
+# Bu kadarlık örnek %95'in altına sıkışmıyorsa blok sıkıştırılmadan saklanır
+SAMPLE_SIZE = 64 * 1024
+INCOMPRESSIBLE_RATIO = 0.95
+
+
+class ArchiveError(Exception):
+    pass
+
+
+class ArchiveStats:
+    def __init__(self):
+        self.files = 0
+        self.skipped = 0
+        self.size = 0            # Arşivlenen/açılan veri (sıkıştırılmamış)
+        self.archive_size = 0    # Arşiv dosyasının boyutu
+        self.seconds = 0.0
+
+    @property
+    def throughput(self):
+        return self.size / max(self.seconds, 1e-6)
+
+    def to_dict(self):
+        return dict(vars(self))
+
+    @classmethod
+    def from_dict(cls, data):
+        stats = cls()
+        vars(stats).update(data)
+        return stats
+
+    def format(self):
+        from appimage_gc import format_size
+
+        ratio = f", oran {self.archive_size / self.size:.0%}" if self.size else ""
+        skipped = f", {self.skipped} aynı dosya atlandı" if self.skipped else ""
+        return (f"{self.files} dosya{skipped}, {format_size(self.size)} -> {format_size(self.archive_size)}"
+                f"{ratio}; {self.seconds:.2f} sn, {format_size(self.throughput)}/s")
+
+
+def library_roots():
+    """Arşiv içindeki kök adlarını bu makinedeki dizinlere eşler"""
+    return {
+        "appimages": core.APPIMAGES_DIR,
+        "applications": core.APPLICATIONS_DIR,
+        "icons": core.ICON_DIR,
+        "desktop": core.DESKTOP_DIR,
+    }
+
+
+def _archive_name(path, roots):
+    """Yolu en uzun eşleşen köke göre arşiv adına çevirir; kök dışındaysa None"""
+    for root_name, root in sorted(roots.items(), key=lambda item: -len(item[1])):
+        if path.startswith(root + os.sep):
+            return f"{root_name}/{os.path.relpath(path, root)}"
+    return None
+
+
+def _inside(path, root):
+    return path.startswith(root + os.sep)
+
+
+def _local_path(name, roots):
+    """Arşiv adını yerel yola çevirir; kök dışına çıkan adları reddeder"""
+    root_name, _, relative = name.partition("/")
+    if root_name not in roots or not relative:
+        raise ArchiveError(f"Beklenmeyen arşiv üyesi: {name}")
+    root = roots[root_name]
+    path = os.path.normpath(os.path.join(root, relative))
+    if not _inside(path, root):
+        raise ArchiveError(f"Güvensiz arşiv üyesi: {name}")
+    # Diskteki (ya da arşivden gelen) bir bağ üzerinden kök dışına yazılmasın
+    parent = os.path.realpath(os.path.dirname(path))
+    real_root = os.path.realpath(root)
+    if parent != real_root and not _inside(parent, real_root):
+        raise ArchiveError(f"Güvensiz arşiv üyesi (bağ kök dışına çıkıyor): {name}")
+    return path
+
+
+def _check_symlink(name, target):
+    """Yalnızca appimages/<dosya> -> versions/... biçimindeki göreli bağlar kabul edilir"""
+    root_name, _, relative = name.partition("/")
+    if root_name != "appimages" or "/" in relative or os.path.isabs(target):
+        raise ArchiveError(f"Güvensiz sembolik bağ: {name} -> {target}")
+    resolved = os.path.normpath(os.path.join(core.APPIMAGES_DIR, target))
+    if not _inside(resolved, core.VERSIONS_DIR):
+        raise ArchiveError(f"Güvensiz sembolik bağ: {name} -> {target}")
+
+
+def _path_mapping(manifest):
+    """Kaynak makinedeki yolları bu makinedekilere eşleyen (eski, yeni) listesi"""
+    roots = library_roots()
+    mapping = [(old, roots[name]) for name, old in manifest["roots"].items() if name in roots]
+    mapping.append((manifest["default_icon"], core.DEFAULT_ICON))
+    if manifest.get("launcher"):
+        # .desktop dosyalarındaki başlatıcı bu makinedeki kopyayı göstersin
+        mapping.append((manifest["launcher"], core.LAUNCHER))
+    if manifest.get("home"):
+        # Kütüphane dışındaki yollar yalnızca kayıtta yeniden yazılır, dosyaları arşivde yoktur
+        mapping.append((manifest["home"], os.path.expanduser("~")))
+    # Önce en özel yol denensin
+    return sorted(mapping, key=lambda item: -len(item[0]))
+
+
+def rewrite_path(path, mapping):
+    for old, new in mapping:
+        if path == old or path.startswith(old + os.sep):
+            return new + path[len(old):]
+    return path
+
+
+def _rewrite_registry(value, mapping):
+    if isinstance(value, dict):
+        return {key: _rewrite_registry(item, mapping) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_rewrite_registry(item, mapping) for item in value]
+    if isinstance(value, str) and value.startswith(os.sep):
+        return rewrite_path(value, mapping)
+    return value
+
+
+def _check_registry(apps):
+    """Kayıttaki yollar kütüphane dışını göstermesin; kaldırma bu yolları siler"""
+    for app_name, app_info in apps.items():
+        if not app_name or os.sep in app_name or app_name.startswith("."):
+            raise ArchiveError(f"Geçersiz uygulama adı: {app_name}")
+        path = os.path.normpath(app_info.get('path') or "")
+        if os.path.dirname(path) != core.APPIMAGES_DIR:
+            raise ArchiveError(f"{app_name}: kütüphane dışında yol: {app_info.get('path')}")
+        for version in app_info.get('versions', []):
+            if not _inside(os.path.normpath(version.get('path') or ""), core.VERSIONS_DIR):
+                raise ArchiveError(f"{app_name}: kütüphane dışında sürüm: {version.get('path')}")
+        icon = app_info.get('icon')
+        if icon and icon != core.DEFAULT_ICON and not _inside(os.path.normpath(icon), core.ICON_DIR):
+            raise ArchiveError(f"{app_name}: kütüphane dışında ikon: {icon}")
+
+
+def _rewrite_text(text, mapping):
+    """Metindeki eski yolları tek geçişte değiştirir.
+
+    Sırayla str.replace yeni yolun eski yolla başladığı durumda (/home/a ->
+    /home/ab) aynı yolu iki kez yeniden yazardı. Eşleşme yol sınırında biter.
+    """
+    if not mapping:
+        return text
+    replacements = dict(mapping)
+    # mapping en uzun yol önce sıralı; alternasyon da bu sırayla denenir
+    pattern = re.compile("|".join(re.escape(old) for old, _ in mapping) + r"""(?=[/\s"';]|$)""",
+                         re.MULTILINE)
+    return pattern.sub(lambda match: replacements[match.group(0)], text)
+
+
+class ParallelGzipWriter:
+    """Blokları bağımsız gzip üyeleri olarak paralel sıkıştırıp sırayla yazar.
+
+    zlib sıkıştırırken GIL'i bıraktığı için iş parçacıkları gerçekten paralel
+    çalışır. Bekleyen blok sayısı sınırlı olduğundan bellek kullanımı sabittir.
+    """
+
+    def __init__(self, fileobj, level=COMPRESS_LEVEL, workers=None, block_size=BLOCK_SIZE):
+        self.fileobj = fileobj
+        self.level = level
+        self.block_size = block_size
+        workers = workers or os.cpu_count() or 1
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.max_pending = 2 * workers
+        self.pending = deque()
+        self.buffer = bytearray()
+        self.size = 0
+        self.compressed_size = 0
+
+    def _compress(self, data):
+        level = self.level
+        # AppImage yükü zaten sıkıştırılmış squashfs; boşuna yeniden sıkıştırma
+        sample = data[:SAMPLE_SIZE]
+        if level and sample and len(zlib.compress(sample, 1)) > len(sample) * INCOMPRESSIBLE_RATIO:
+            level = 0
+        compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        return compressor.compress(data) + compressor.flush()
+
+    def _write_oldest(self):
+        data = self.pending.popleft().result()
+        self.fileobj.write(data)
+        self.compressed_size += len(data)
+
+    def _submit(self, block):
+        self.pending.append(self.executor.submit(self._compress, block))
+        while len(self.pending) > self.max_pending:
+            self._write_oldest()
+
+    def write(self, data):
+        self.buffer += data
+        self.size += len(data)
+        while len(self.buffer) >= self.block_size:
+            self._submit(bytes(self.buffer[:self.block_size]))
+            del self.buffer[:self.block_size]
+        return len(data)
+
+    def close(self):
+        if self.buffer or not self.compressed_size:
+            self._submit(bytes(self.buffer))
+            self.buffer.clear()
+        while self.pending:
+            self._write_oldest()
+        self.executor.shutdown()
+        self.fileobj.flush()
+
+
+class _CountingReader:
+    def __init__(self, fileobj, on_read=None):
+        self.fileobj = fileobj
+        self.on_read = on_read
+        self.count = 0
+
+    def read(self, size=-1):
+        data = self.fileobj.read(size)
+        self.count += len(data)
+        if self.on_read:
+            self.on_read(len(data))
+        return data
+
+
+def _app_paths(app_info):
+    """Bir uygulamaya ait dosyalar: sürümler, sabit yol, ikon ve .desktop dosyaları"""
+    paths = [version['path'] for version in app_info.get('versions', [])]
+    paths.append(app_info['path'])
+    if app_info.get('icon') and app_info['icon'] != core.DEFAULT_ICON:
+        paths.append(app_info['icon'])
+    return paths
+
+
+def export_library(fileobj, names=None, level=COMPRESS_LEVEL, workers=None, progress=None):
+    """Kaydı ve uygulama dosyalarını fileobj'e akış halinde yazar; ArchiveStats döndürür"""
+    started = time.perf_counter()
+    installed_apps = core.load_installed_apps()
+    if names:
+        missing = [name for name in names if name not in installed_apps]
+        if missing:
+            raise KeyError(", ".join(missing))
+        installed_apps = {name: installed_apps[name] for name in names}
+
+    roots = library_roots()
+    members = {}
+    for app_name, app_info in installed_apps.items():
+        paths = _app_paths(app_info) + list(core.desktop_file_paths(app_name))
+        for path in paths:
+            if not os.path.lexists(path) or path in members:
+                continue
+            name = _archive_name(path, roots)
+            if name is None:
+                logging.warning(f"Arşive alınmadı, kütüphane dizinleri dışında: {path}")
+                continue
+            members[path] = name
+
+    total_size = sum(os.path.getsize(path) for path in members if not os.path.islink(path))
+    manifest = {
+        "format": FORMAT_VERSION,
+        "created": datetime.now().isoformat(),
+        "roots": roots,
+        "home": os.path.expanduser("~"),
+        "default_icon": core.DEFAULT_ICON,
+        "launcher": core.LAUNCHER,
+        "total_size": total_size,
+        "apps": installed_apps,
+    }
+
+    stats = ArchiveStats()
+    writer = ParallelGzipWriter(fileobj, level=level, workers=workers)
+    with tarfile.open(fileobj=writer, mode="w|", format=tarfile.PAX_FORMAT, bufsize=BLOCK_SIZE) as tar:
+        data = json.dumps(manifest, indent=2).encode()
+        info = tarfile.TarInfo(MANIFEST_NAME)
+        info.size = len(data)
+        info.mtime = int(time.time())
+        tar.addfile(info, io.BytesIO(data))
+
+        done = [0]
+
+        def on_read(count):
+            done[0] += count
+            if progress:
+                progress(done[0], total_size)
+
+        for path, name in members.items():
+            info = tar.gettarinfo(path, arcname=name)
+            info.uid = info.gid = 0
+            info.uname = info.gname = ""
+            if info.isfile():
+                with open(path, "rb") as f:
+                    tar.addfile(info, _CountingReader(f, on_read))
+            else:
+                tar.addfile(info)
+            stats.files += 1
+    writer.close()
+
+    stats.size = total_size
+    stats.archive_size = writer.compressed_size
+    stats.seconds = time.perf_counter() - started
+    logging.info(f"Kütüphane dışa aktarıldı: {stats.format()}")
+    return stats
+
+
+def _copy_prefix(source, dest, size):
+    while size > 0:
+        block = source.read(min(BLOCK_SIZE, size))
+        if not block:
+            raise ArchiveError("Mevcut dosya okunurken beklenmedik son")
+        dest.write(block)
+        size -= len(block)
+
+
+def _extract_file(source, size, dest_path, mode, on_read=None):
+    """Üyeyi yazar; hedefte aynı içerik varsa hiç yazmadan atlar. Atlandıysa True"""
+    existing = None
+    if (os.path.isfile(dest_path) and not os.path.islink(dest_path)
+            and os.path.getsize(dest_path) == size):
+        existing = open(dest_path, "rb")
+    out = None
+    tmp_path = f"{dest_path}.{os.getpid()}.import"
+    try:
+        if existing is None:
+            out = open(tmp_path, "wb")
+        while True:
+            block = source.read(BLOCK_SIZE)
+            if not block:
+                break
+            if on_read:
+                on_read(len(block))
+            if out is None:
+                offset = existing.tell()
+                if existing.read(len(block)) == block:
+                    continue
+                # İçerik ayrıştı: şimdiye kadar eşleşen kısmı kopyalayıp yazmaya geç
+                out = open(tmp_path, "wb")
+                existing.seek(0)
+                _copy_prefix(existing, out, offset)
+            out.write(block)
+
+        if out is None:
+            return True
+        out.close()
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, dest_path)
+        return False
+    except BaseException:
+        if out:
+            out.close()
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    finally:
+        if existing:
+            existing.close()
+
+
+def _extract_text(source, dest_path, mode, mapping):
+    """.desktop dosyasını yolları yeniden yazarak yerleştirir; içerik aynıysa atlar"""
+    content = _rewrite_text(source.read().decode("utf-8", errors="replace"), mapping)
+    if os.path.isfile(dest_path):
+        with open(dest_path, "r", errors="replace") as f:
+            if f.read() == content:
+                return True
+    tmp_path = f"{dest_path}.{os.getpid()}.import"
+    with open(tmp_path, "w") as f:
+        f.write(content)
+    os.chmod(tmp_path, mode)
+    os.replace(tmp_path, dest_path)
+    return False
+
+
+def import_library(fileobj, progress=None):
+    """export_library ile yazılmış bir arşivi geri yükler; ArchiveStats döndürür.
+
+    Arşivdeki uygulamalar yerel kayıtta aynı adlı girdilerin yerine geçer,
+    diğer yerel uygulamalara dokunulmaz. Kayıt en sonda tek seferde yazılır.
+    """
+    started = time.perf_counter()
+    roots = library_roots()
+    counter = _CountingReader(fileobj)
+    stats = ArchiveStats()
+
+    try:
+        source = gzip.GzipFile(fileobj=counter, mode="rb")
+        with tarfile.open(fileobj=source, mode="r|", bufsize=BLOCK_SIZE) as tar:
+            first = tar.next()
+            if first is None or first.name != MANIFEST_NAME:
+                raise ArchiveError("Arşivde manifest.json bulunamadı")
+            manifest = json.load(tar.extractfile(first))
+            if manifest.get("format") != FORMAT_VERSION:
+                raise ArchiveError(f"Desteklenmeyen arşiv sürümü: {manifest.get('format')}")
+            mapping = _path_mapping(manifest)
+            # Kayıt, dosyalardan önce denetlenir; geçersizse hiçbir şey yazılmaz
+            apps = _rewrite_registry(manifest["apps"], mapping)
+            _check_registry(apps)
+            total_size = manifest.get("total_size", 0)
+            done = [0]
+
+            def on_read(count):
+                done[0] += count
+                if progress:
+                    progress(done[0], total_size)
+
+            # Akış kipinde `for member in tar` manifest'i de yeniden verir
+            for member in iter(tar.next, None):
+                dest_path = _local_path(member.name, roots)
+                if member.name.startswith("desktop/") and not os.path.isdir(core.DESKTOP_DIR):
+                    # Masaüstü dizini olmayan makinede kısayol oluşturulmaz (kurulumdaki gibi)
+                    on_read(member.size)
+                    continue
+                if member.issym():
+                    _check_symlink(member.name, member.linkname)
+                os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+                if member.issym():
+                    target = member.linkname
+                    if os.path.islink(dest_path) and os.readlink(dest_path) == target:
+                        stats.skipped += 1
+                    else:
+                        core.replace_symlink(target, dest_path)
+                elif member.isfile():
+                    data = tar.extractfile(member)
+                    if member.name.endswith(".desktop"):
+                        skipped = _extract_text(data, dest_path, member.mode, mapping)
+                        on_read(member.size)
+                    else:
+                        skipped = _extract_file(data, member.size, dest_path, member.mode, on_read)
+                    stats.skipped += skipped
+                else:
+                    raise ArchiveError(f"Desteklenmeyen arşiv üyesi: {member.name}")
+                stats.files += 1
+    except (tarfile.TarError, OSError, EOFError, zlib.error, ValueError) as e:
+        raise ArchiveError(f"Arşiv okunamadı: {str(e)}") from e
+
+    installed_apps = core.load_installed_apps()
+    installed_apps.update(apps)
+    core.write_installed_apps(installed_apps)
+    core.refresh_desktop_databases()
+
+    stats.size = done[0]
+    stats.archive_size = counter.count
+    stats.seconds = time.perf_counter() - started
+    logging.info(f"Kütüphane içe aktarıldı: {stats.format()}")
+    return stats
@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""AppImage Yükleyici komut satırı arayüzü.
+
+Örnekler:
+    python3 appimage_cli.py list
+    python3 appimage_cli.py remove uygulama1 uygulama2
+    python3 appimage_cli.py edit uygulama1 uygulama2 --comment "Geliştirme araçları"
+    python3 appimage_cli.py gc --reclaim --budget 2G
+    python3 appimage_cli.py install Uygulama.AppImage
+    python3 appimage_cli.py rollback uygulama1
+    python3 appimage_cli.py install-url https://example.com/Uygulama.AppImage --checksum sha256:...
+    python3 appimage_cli.py service start
+    python3 appimage_cli.py export - | ssh yeni-makine python3 appimage_cli.py import -
+
+Servis (appimage_service.py) çalışıyorsa komutlar ona iletilir; --local ile
+her zaman yerel olarak çalıştırılır.
+"""
+import os
+import sys
+import time
+import logging
+import argparse
+
+import appimage_core as core
+
+logging.basicConfig(
+    filename='appimage_installer.log',
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+
+
+def print_progress(done, total, app_name):
+    print(f"[{done}/{total}] {app_name}", file=sys.stderr)
+
+
+def byte_progress():
+    """Bayt tabanlı ilerlemeyi en fazla yarım saniyede bir, hızıyla birlikte yazar"""
+    started = time.perf_counter()
+    state = {'last': 0.0}
+
+    def show_progress(done, total):
+        now = time.perf_counter()
+        if now - state['last'] < 0.5 and done != total:
+            return
+        state['last'] = now
+        speed = done / max(now - started, 1e-6) / (1024 * 1024)
+        percent = f"%{done * 100 // total} " if total else ""
+        print(f"\r{percent}{done / (1024 * 1024):.1f} MB ({speed:.1f} MB/s)", end="", file=sys.stderr)
+
+    return show_progress
+
+
+def get_backend(args):
+    """Servis çalışıyorsa istemcisini, çalışmıyorsa çekirdek modülü döndürür"""
+    import appimage_service
+
+    service = None if args.local else appimage_service.connect_if_running()
+    if service:
+        return service
+    # Kaydı yalnızca servis yokken (ya da --local ile) kendimiz işleriz
+    core.recover_transactions()
+    return core
+
+
+def cmd_list(args):
+    import appimage_search
+
+    installed_apps = get_backend(args).load_installed_apps()
+    index = appimage_search.SearchIndex(installed_apps)
+    for app_name in index.search(args.search or "", args.sort):
+        print(f"{app_name}\t{installed_apps[app_name].get('path', '')}")
+    return 0
+
+
+def cmd_remove(args):
+    backend = get_backend(args)
+    installed_apps = backend.load_installed_apps()
+    backend.remove_apps(installed_apps, args.names, print_progress)
+    print(f"{len(args.names)} uygulama kaldırıldı.")
+    return 0
+
+
+def cmd_edit(args):
+    if args.name and len(args.names) > 1:
+        print("--name yalnızca tek bir uygulama ile kullanılabilir.", file=sys.stderr)
+        return 2
+    if args.name is None and args.comment is None and args.icon is None:
+        print("Değiştirilecek bir alan belirtin (--name, --comment, --icon).", file=sys.stderr)
+        return 2
+
+    edits = {}
+    for app_name in args.names:
+        new_info = {'name': args.name or app_name}
+        if args.comment is not None:
+            new_info['comment'] = args.comment
+        if args.icon:
+            new_info['new_icon_path'] = os.path.abspath(args.icon)
+        edits[app_name] = new_info
+
+    backend = get_backend(args)
+    installed_apps = backend.load_installed_apps()
+    backend.edit_apps(installed_apps, edits, print_progress)
+    print(f"{len(edits)} uygulama güncellendi.")
+    return 0
+
+
+def cmd_install(args):
+    backend = get_backend(args)
+    installed_apps = backend.load_installed_apps()
+    for file_path in args.files:
+        invalid_reason = core.check_appimage_file(file_path)
+        if invalid_reason:
+            print(f"{file_path}: geçerli bir AppImage değil ({invalid_reason})", file=sys.stderr)
+            return 1
+        app_name = backend.install_appimage(file_path, installed_apps, no_sandbox=not args.sandbox, keep=args.keep)
+        backend.write_installed_apps(installed_apps)
+        print(f"{app_name} yüklendi ({installed_apps[app_name]['active_version']}).")
+    return 0
+
+
+def cmd_install_url(args):
+    import appimage_download
+
+    backend = get_backend(args)
+    installed_apps = backend.load_installed_apps()
+    install_from_url = appimage_download.install_from_url if backend is core else backend.install_from_url
+    try:
+        app_name = install_from_url(
+            args.url, installed_apps, checksum=args.checksum, connections=args.connections,
+            no_sandbox=not args.sandbox, progress=byte_progress()
+        )
+    except appimage_download.DownloadError as e:
+        print(f"\nİndirme hatası: {e}", file=sys.stderr)
+        return 1
+    print(file=sys.stderr)
+    backend.write_installed_apps(installed_apps)
+    print(f"{app_name} yüklendi ({installed_apps[app_name]['active_version']}).")
+    return 0
+
+
+def cmd_versions(args):
+    app_info = get_backend(args).load_installed_apps()[args.name]
+    for version in app_info.get('versions', []):
+        marker = "*" if version['id'] == app_info.get('active_version') else " "
+        print(f"{marker} {version['id']}\t{version.get('file_name', '')}\t{version.get('size', 0)}")
+    return 0
+
+
+def cmd_switch(args):
+    backend = get_backend(args)
+    installed_apps = backend.load_installed_apps()
+    version = backend.switch_version(installed_apps, args.name, args.version)
+    print(f"{args.name}: {version['id']} sürümü etkin.")
+    return 0
+
+
+def cmd_rollback(args):
+    backend = get_backend(args)
+    installed_apps = backend.load_installed_apps()
+    version = backend.rollback_version(installed_apps, args.name)
+    print(f"{args.name}: {version['id']} sürümüne dönüldü.")
+    return 0
+
+
+def cmd_prune(args):
+    backend = get_backend(args)
+    installed_apps = backend.load_installed_apps()
+    removed = backend.prune_versions(args.name, installed_apps[args.name], args.keep)
+    backend.write_installed_apps(installed_apps)
+    print(f"{args.name}: {len(removed)} eski sürüm silindi.")
+    return 0
+
+
+def cmd_gc(args):
+    import appimage_gc
+
+    backend = get_backend(args)
+    if backend is core:
+        report = appimage_gc.analyze(max_workers=args.workers)
+    else:
+        report = appimage_gc.GarbageReport.from_dict(backend.call("gc_analyze"))
+    print(report.format())
+    if not args.reclaim:
+        return 0
+
+    budget = appimage_gc.parse_size(args.budget) if args.budget else None
+    if backend is core:
+        freed, removed = appimage_gc.reclaim(report, budget)
+    else:
+        # Servis, kayıt kilidi altında yeniden analiz eder; yalnızca burada
+        # raporlanan ve hâlâ gereksiz olan yolları siler
+        paths = [c.path for c in report.candidates if c.reclaimable]
+        result = backend.call("gc_reclaim", {"budget": budget, "paths": paths})
+        freed, removed = result["freed"], result["removed"]
+    print(f"{len(removed)} öğe silindi, {appimage_gc.format_size(freed)} yer açıldı.")
+    return 0
+
+
+def cmd_export(args):
+    import appimage_archive
+
+    progress = None if args.quiet else byte_progress()
+    if args.output == "-":
+        stats = appimage_archive.export_library(sys.stdout.buffer, args.apps, args.level, args.workers, progress)
+    else:
+        # Yarım arşiv bırakmamak için önce geçici ada yaz
+        tmp_path = args.output + ".part"
+        try:
+            with open(tmp_path, "wb") as f:
+                stats = appimage_archive.export_library(f, args.apps, args.level, args.workers, progress)
+            os.replace(tmp_path, args.output)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    if progress:
+        print(file=sys.stderr)
+    print(f"Dışa aktarıldı: {stats.format()}", file=sys.stderr)
+    return 0
+
+
+def cmd_import(args):
+    import appimage_archive
+    import appimage_service
+
+    backend = get_backend(args)
+    progress = None if args.quiet else byte_progress()
+    try:
+        if backend is not core:
+            # Kayıt servisin elinde; birleştirme onun kayıt kilidi altında yapılır
+            if args.input == "-":
+                print("Servis çalışırken standart girdiden içe aktarılamaz; "
+                      "bir arşiv dosyası verin ya da --local kullanın.", file=sys.stderr)
+                return 1
+            stats = appimage_archive.ArchiveStats.from_dict(backend.import_library(args.input, progress))
+        elif args.input == "-":
+            stats = appimage_archive.import_library(sys.stdin.buffer, progress)
+        else:
+            with open(args.input, "rb") as f:
+                stats = appimage_archive.import_library(f, progress)
+    except (appimage_archive.ArchiveError, appimage_service.ServiceError) as e:
+        print(f"\nİçe aktarma hatası: {e}", file=sys.stderr)
+        return 1
+    if progress:
+        print(file=sys.stderr)
+    print(f"İçe aktarıldı: {stats.format()}", file=sys.stderr)
+    return 0
+
+
+def cmd_service(args):
+    import appimage_service
+
+    client = appimage_service.connect_if_running()
+    if args.action == "start":
+        if client:
+            print(f"Servis zaten çalışıyor: {appimage_service.SOCKET_PATH}")
+            return 0
+        appimage_service.start_service()
+        print(f"Servis başlatıldı: {appimage_service.SOCKET_PATH}")
+    elif not client:
+        print("Servis çalışmıyor.")
+        return 1 if args.action == "status" else 0
+    elif args.action == "stop":
+        client.call("shutdown")
+        print("Servis durduruldu.")
+    else:
+        status = client.call("status")
+        print(f"PID {status['pid']}, {status['apps']} uygulama, kuyrukta {status['queued']} iş")
+        for job in status['running']:
+            print(f"  #{job['job_id']} {job['method']}")
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="AppImage Yükleyici komut satırı arayüzü")
+    parser.add_argument("--local", action="store_true", help="Çalışan servisi kullanmadan yerel olarak çalıştır")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    list_parser = subparsers.add_parser("list", help="Yüklü uygulamaları listele")
+    list_parser.add_argument("search", nargs="?", help="Ad, açıklama ve kategorilerde bulanık arama")
+    list_parser.add_argument("--sort", choices=["relevance", "name", "install_date", "size", "last_launch"])
+    list_parser.set_defaults(func=cmd_list)
+
+    remove_parser = subparsers.add_parser("remove", help="Uygulamaları tek işlemde kaldır")
+    remove_parser.add_argument("names", nargs="+")
+    remove_parser.set_defaults(func=cmd_remove)
+
+    edit_parser = subparsers.add_parser("edit", help="Uygulamaları tek işlemde düzenle")
+    edit_parser.add_argument("names", nargs="+")
+    edit_parser.add_argument("--name", help="Yeni ad (tek uygulama)")
+    edit_parser.add_argument("--comment", help="Yeni açıklama")
+    edit_parser.add_argument("--icon", help="128x128 PNG ikon dosyası")
+    edit_parser.set_defaults(func=cmd_edit)
+
+    install_parser = subparsers.add_parser("install", help="AppImage yükle veya yeni sürüm ekle")
+    install_parser.add_argument("files", nargs="+")
+    install_parser.add_argument("--sandbox", action="store_true", help="--no-sandbox parametresi ekleme")
+    install_parser.add_argument("--keep", type=int, default=core.KEEP_VERSIONS, help="Saklanacak sürüm sayısı")
+    install_parser.set_defaults(func=cmd_install)
+
+    url_parser = subparsers.add_parser("install-url", help="AppImage'ı URL'den indirip yükle")
+    url_parser.add_argument("url")
+    url_parser.add_argument("--checksum", help="Beklenen özet (ör. sha256:abcd...); verilmezse yayımlanmış özet aranır")
+    url_parser.add_argument("--connections", type=int, default=4)
+    url_parser.add_argument("--sandbox", action="store_true", help="--no-sandbox parametresi ekleme")
+    url_parser.set_defaults(func=cmd_install_url)
+
+    versions_parser = subparsers.add_parser("versions", help="Bir uygulamanın sürümlerini listele")
+    versions_parser.add_argument("name")
+    versions_parser.set_defaults(func=cmd_versions)
+
+    switch_parser = subparsers.add_parser("switch", help="Etkin sürümü değiştir")
+    switch_parser.add_argument("name")
+    switch_parser.add_argument("version")
+    switch_parser.set_defaults(func=cmd_switch)
+
+    rollback_parser = subparsers.add_parser("rollback", help="Bir önceki sürüme dön")
+    rollback_parser.add_argument("name")
+    rollback_parser.set_defaults(func=cmd_rollback)
+
+    prune_parser = subparsers.add_parser("prune", help="Eski sürümleri sil")
+    prune_parser.add_argument("name")
+    prune_parser.add_argument("--keep", type=int, default=core.KEEP_VERSIONS)
+    prune_parser.set_defaults(func=cmd_prune)
+
+    gc_parser = subparsers.add_parser("gc", help="Disk kullanımını analiz et ve gereksiz dosyaları temizle")
+    gc_parser.add_argument("--reclaim", action="store_true", help="Raporlanan dosyaları sil (varsayılan: kuru çalıştırma)")
+    gc_parser.add_argument("--budget", help="En az bu kadar yer açınca dur (ör. 500M, 2G)")
+    gc_parser.add_argument("--workers", type=int, default=8)
+    gc_parser.set_defaults(func=cmd_gc)
+
+    export_parser = subparsers.add_parser("export", help="Kütüphaneyi sıkıştırılmış arşive aktar")
+    export_parser.add_argument("output", help="Arşiv dosyası (.tar.gz) veya standart çıktı için -")
+    export_parser.add_argument("--apps", nargs="+", help="Yalnızca bu uygulamalar")
+    export_parser.add_argument("--level", type=int, default=6, choices=range(0, 10), metavar="0-9",
+                               help="gzip sıkıştırma düzeyi")
+    export_parser.add_argument("--workers", type=int, help="Sıkıştırma iş parçacığı sayısı (varsayılan: çekirdek sayısı)")
+    export_parser.add_argument("--quiet", action="store_true", help="İlerlemeyi gösterme")
+    export_parser.set_defaults(func=cmd_export)
+
+    import_parser = subparsers.add_parser("import", help="Arşivden kütüphaneyi geri yükle")
+    import_parser.add_argument("input", help="Arşiv dosyası veya standart girdi için -")
+    import_parser.add_argument("--quiet", action="store_true", help="İlerlemeyi gösterme")
+    import_parser.set_defaults(func=cmd_import)
+
+    service_parser = subparsers.add_parser("service", help="Arka plan servisini yönet")
+    service_parser.add_argument("action", choices=["start", "stop", "status"])
+    service_parser.set_defaults(func=cmd_service)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    import appimage_service
+
+    try:
+        return args.func(args)
+    except appimage_service.ServiceError as e:
+        print(f"Servis hatası: {e}", file=sys.stderr)
+        return 1
+    except core.BulkOperationError as e:
+        print(f"Hata, hiçbir değişiklik yapılmadı: {e}", file=sys.stderr)
+        return 1
+    except KeyError as e:
+        print(f"Uygulama bulunamadı: {e}", file=sys.stderr)
+        return 1
+    except (ValueError, OSError) as e:
+        print(f"Hata: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,677 @@
+#!/usr/bin/env python3
+"""AppImage kayıt defteri, kurulum, masaüstü girdisi ve ikon çözümleme işlemleri.
+
+Bu modül Qt'yi hiçbir zaman içe aktarmaz; GUI ve komut satırı aynı mantığı
+paylaşır. Ağ ve görüntü işleme gibi ağır bağımlılıklar ilk kullanımda yüklenir.
+"""
+import os
+import json
+import time
+import fcntl
+import shutil
+import logging
+import subprocess
+import tempfile
+from datetime import datetime
+
+# Dizinler
+APPIMAGES_DIR = os.path.expanduser("~/.local/share/appimages")
+APPS_FILE = os.path.join(APPIMAGES_DIR, "installed_apps.json")
+VERSIONS_DIR = os.path.join(APPIMAGES_DIR, "versions")
+APPLICATIONS_DIR = os.path.expanduser("~/.local/share/applications")
+ICON_DIR = os.path.expanduser("~/.local/share/icons/hicolor/128x128/apps")
+DESKTOP_DIR = os.path.expanduser("~/Desktop")
+DEFAULT_ICON = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app_icon.png")
+# .desktop girdileri AppImage'ı bu başlatıcı üzerinden çalıştırır; son çalıştırma zamanı kayda yazılır
+LAUNCHER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "appimage_launch.py")
+DEFAULT_COMMENT = "AppImage uygulaması"
+# Etkin sürüm dahil saklanan en fazla sürüm sayısı
+KEEP_VERSIONS = 3
+TRANSACTION_PREFIX = ".transaction-"
+JOURNAL_NAME = "journal.json"
+
+
+def load_installed_apps():
+    """Yüklü uygulamalar kaydını diskten okur"""
+    if os.path.exists(APPS_FILE):
+        try:
+            with open(APPS_FILE, 'r') as f:
+                return json.load(f)
+        except Exception as e:
+            logging.error(f"Yüklü uygulamalar yüklenirken hata: {str(e)}")
+    return {}
+
+
+def write_installed_apps(installed_apps):
+    """Kaydı geçici dosyaya yazıp atomik olarak yerine taşır; hataları yükseltir"""
+    os.makedirs(APPIMAGES_DIR, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=APPIMAGES_DIR, prefix=".installed_apps.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(installed_apps, f, indent=2)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, APPS_FILE)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def save_installed_apps(installed_apps):
+    try:
+        write_installed_apps(installed_apps)
+    except Exception as e:
+        logging.error(f"Yüklü uygulamalar kaydedilirken hata: {str(e)}")
+
+
+class FileTransaction:
+    """Dosya silme ve yazma işlemlerini yedekleyerek yapar.
+
+    commit() yedekleri siler, rollback() tüm değişiklikleri ters sırayla geri alır.
+    Her adım önce yedek dizinindeki günlüğe yazılır; süreç yarıda kalırsa
+    recover_transactions() işlemi günlükten geri alır. İşlem sürdükçe yedek
+    dizini kilitli tutulur.
+    """
+
+    def __init__(self):
+        os.makedirs(APPIMAGES_DIR, exist_ok=True)
+        self.backup_dir = tempfile.mkdtemp(dir=APPIMAGES_DIR, prefix=TRANSACTION_PREFIX)
+        self.lock_fd = os.open(self.backup_dir, os.O_RDONLY)
+        fcntl.flock(self.lock_fd, fcntl.LOCK_EX)
+        self.undo = []
+        self.empty_dirs = []
+        self._save_journal()
+
+    def _save_journal(self):
+        journal_path = os.path.join(self.backup_dir, JOURNAL_NAME)
+        with open(journal_path + ".tmp", 'w') as f:
+            json.dump([[path, backup_path and os.path.basename(backup_path)]
+                       for path, backup_path in self.undo], f)
+        os.replace(journal_path + ".tmp", journal_path)
+
+    def _log(self, path, backup_path):
+        # Önce günlük: yarıda kalan bir adım da geri alınabilsin
+        self.undo.append((path, backup_path))
+        self._save_journal()
+
+    def _backup(self, path):
+        backup_path = os.path.join(self.backup_dir, str(len(self.undo)))
+        self._log(path, backup_path)
+        shutil.move(path, backup_path)
+
+    def remove(self, path):
+        if os.path.lexists(path):
+            self._backup(path)
+
+    def keep(self, path):
+        """Yerinde (atomik) değiştirilecek dosyanın kopyasını yedekler"""
+        if os.path.lexists(path):
+            backup_path = os.path.join(self.backup_dir, str(len(self.undo)))
+            self._log(path, backup_path)
+            shutil.copy2(path, backup_path)
+        else:
+            self._log(path, None)
+
+    def write(self, path, content, mode=None):
+        if os.path.lexists(path):
+            self._backup(path)
+        else:
+            self._log(path, None)
+        with open(path, 'w') as f:
+            f.write(content)
+        if mode is not None:
+            os.chmod(path, mode)
+
+    def copy(self, src, dst):
+        if os.path.lexists(dst):
+            self._backup(dst)
+        else:
+            self._log(dst, None)
+        shutil.copy2(src, dst)
+
+    def remove_dir_if_empty(self, path):
+        """Dizin işlem onaylanınca boşsa silinir; geri almada dosyalar yerine dönebilsin"""
+        self.empty_dirs.append(path)
+
+    def commit(self):
+        # Günlüğün silinmesi onay noktasıdır; sonrası yalnızca yedek temizliği
+        try:
+            os.remove(os.path.join(self.backup_dir, JOURNAL_NAME))
+        except OSError:
+            pass
+        shutil.rmtree(self.backup_dir, ignore_errors=True)
+        for path in self.empty_dirs:
+            _remove_dir_if_empty(path)
+        self.undo = []
+        self.empty_dirs = []
+        if self.lock_fd is not None:
+            os.close(self.lock_fd)
+            self.lock_fd = None
+
+    def rollback(self):
+        _undo(self.undo)
+        self.empty_dirs = []
+        self.commit()
+
+
+def _undo(entries):
+    for path, backup_path in reversed(entries):
+        try:
+            if backup_path and not os.path.lexists(backup_path):
+                # Yedeğe taşınmadan kesilmiş adım; dosya yerinde duruyor
+                continue
+            if os.path.lexists(path):
+                os.remove(path)
+            if backup_path:
+                shutil.move(backup_path, path)
+        except Exception as e:
+            logging.error(f"Geri alma hatası ({path}): {str(e)}")
+
+
+def recover_transactions():
+    """Önceki çalışmalardan yarım kalmış işlemleri günlüklerinden geri alır.
+
+    Günlüğü duran işlem onaylanmamıştır ve geri alınır; günlüğü olmayanın
+    yalnızca yedekleri kalmıştır. Başka bir sürecin süren işlemi kilitli
+    olduğundan atlanır. Geri alınan işlem sayısını döndürür.
+    """
+    if not os.path.isdir(APPIMAGES_DIR):
+        return 0
+    recovered = 0
+    for name in os.listdir(APPIMAGES_DIR):
+        backup_dir = os.path.join(APPIMAGES_DIR, name)
+        if not name.startswith(TRANSACTION_PREFIX) or not os.path.isdir(backup_dir):
+            continue
+        # Yeni oluşturulmuş ve henüz kilitlenmemiş bir işleme dokunma
+        if time.time() - os.path.getmtime(backup_dir) < 60:
+            continue
+        lock_fd = os.open(backup_dir, os.O_RDONLY)
+        try:
+            try:
+                fcntl.flock(lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                continue
+            journal_path = os.path.join(backup_dir, JOURNAL_NAME)
+            if os.path.exists(journal_path):
+                try:
+                    with open(journal_path) as f:
+                        entries = [(path, backup_name and os.path.join(backup_dir, backup_name))
+                                   for path, backup_name in json.load(f)]
+                except (OSError, ValueError) as e:
+                    logging.error(f"İşlem günlüğü okunamadı ({backup_dir}): {str(e)}")
+                    continue
+                _undo(entries)
+                recovered += 1
+                logging.warning(f"Yarım kalmış işlem geri alındı: {backup_dir}")
+            shutil.rmtree(backup_dir, ignore_errors=True)
+        finally:
+            os.close(lock_fd)
+    return recovered
+
+
+def _remove_dir_if_empty(path):
+    try:
+        os.rmdir(path)
+    except OSError:
+        pass
+
+
+def desktop_file_paths(app_name):
+    """Uygulamanın masaüstü kısayolu ve menü girdisi yollarını döndürür"""
+    return (os.path.join(DESKTOP_DIR, f"{app_name}.desktop"),
+            os.path.join(APPLICATIONS_DIR, f"{app_name}.desktop"))
+
+
+def build_desktop_entry(app_name, exec_path, icon_path, sandbox_param="", comment=DEFAULT_COMMENT):
+    return f"""[Desktop Entry]
+Version=1.0
+Name={app_name}
+Comment={comment}
+Exec=python3 {LAUNCHER} {exec_path} {sandbox_param}
+Icon={icon_path}
+Terminal=false
+Type=Application
+Categories=Utility;Application;
+"""
+
+
+def record_launch(installed_apps, app_path):
+    """Sabit yolu app_path olan uygulamanın son çalıştırma zamanını işler; adını döndürür"""
+    for app_name, app_info in installed_apps.items():
+        if app_info.get('path') == app_path:
+            app_info['last_launch'] = datetime.now().isoformat()
+            return app_name
+    return None
+
+
+def write_desktop_files(app_name, content):
+    """Menü girdisini ve masaüstü kısayolunu yazar"""
+    desktop_shortcut, desktop_file_path = desktop_file_paths(app_name)
+    os.makedirs(APPLICATIONS_DIR, exist_ok=True)
+    with open(desktop_file_path, "w") as f:
+        f.write(content)
+    os.chmod(desktop_file_path, 0o755)
+
+    if os.path.isdir(DESKTOP_DIR):
+        shutil.copy2(desktop_file_path, desktop_shortcut)
+        os.chmod(desktop_shortcut, 0o755)
+
+
+def set_desktop_key(content, key, value):
+    """.desktop içeriğinde bir anahtarı değiştirir, yoksa [Desktop Entry] altına ekler"""
+    if f"\n{key}=" in content:
+        start = content.find(f"\n{key}=") + 1
+        end = content.find("\n", start)
+        return content[:start] + f"{key}={value}" + (content[end:] if end >= 0 else "\n")
+    return content.replace("[Desktop Entry]", f"[Desktop Entry]\n{key}={value}", 1)
+
+
+def update_desktop_files(old_name, new_info, transaction=None):
+    """Yeniden adlandırma ve açıklama değişikliklerini .desktop dosyalarına yansıtır"""
+    old_paths = desktop_file_paths(old_name)
+    new_paths = desktop_file_paths(new_info['name'])
+
+    for old_path, new_path in zip(old_paths, new_paths):
+        if os.path.exists(old_path):
+            with open(old_path, 'r') as f:
+                content = f.read()
+
+            content = content.replace(f"Name={old_name}", f"Name={new_info['name']}")
+            if new_info.get('comment'):
+                content = set_desktop_key(content, "Comment", new_info['comment'])
+            if new_info.get('icon'):
+                content = set_desktop_key(content, "Icon", new_info['icon'])
+
+            if transaction:
+                transaction.write(new_path, content, 0o755)
+                if old_path != new_path:
+                    transaction.remove(old_path)
+                continue
+
+            with open(new_path, 'w') as f:
+                f.write(content)
+
+            if old_path != new_path:
+                os.remove(old_path)
+
+
+def remove_app_files(app_name, app_info, transaction=None):
+    """AppImage dosyasını, tüm sürümleri, ikonu ve .desktop dosyalarını siler"""
+    versions = app_info.get('versions', [])
+    paths = [app_info['path']] + [v['path'] for v in versions]
+    if app_info.get('icon') and app_info['icon'] != DEFAULT_ICON:
+        paths.append(app_info['icon'])
+    paths.extend(desktop_file_paths(app_name))
+    # Yeniden adlandırılan uygulamaların sürümleri eski ad altındaki dizinde kalır ve
+    # o adı sonradan alan başka bir uygulamayla paylaşılabilir; dizin yalnızca boşsa silinir
+    version_dirs = sorted({os.path.dirname(v['path']) for v in versions})
+
+    for path in paths:
+        if transaction:
+            transaction.remove(path)
+        elif os.path.lexists(path):
+            os.remove(path)
+    for path in version_dirs:
+        if transaction:
+            transaction.remove_dir_if_empty(path)
+        else:
+            _remove_dir_if_empty(path)
+
+
+def refresh_desktop_databases():
+    """Menü ve ikon veritabanlarını (araçlar kuruluysa) bir kez yeniler"""
+    commands = [
+        ["update-desktop-database", APPLICATIONS_DIR],
+        ["gtk-update-icon-cache", "-f", "-t", os.path.dirname(os.path.dirname(os.path.dirname(ICON_DIR)))],
+    ]
+    for command in commands:
+        if shutil.which(command[0]):
+            try:
+                subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=30)
+            except Exception as e:
+                logging.warning(f"{command[0]} çalıştırılamadı: {str(e)}")
+
+
+class BulkOperationError(Exception):
+    """Toplu işlem başarısız oldu ve tüm değişiklikler geri alındı"""
+
+    def __init__(self, app_name, error):
+        super().__init__(f"{app_name}: {error}")
+        self.app_name = app_name
+        self.error = error
+
+
+def _run_bulk(installed_apps, names, apply, progress=None):
+    """Her uygulama için apply(kayıt, ad, işlem) çağırır ve tek seferde işler.
+
+    Başarılı olursa yeni kayıt diske yazılır ve döndürülür; herhangi bir adım
+    başarısız olursa dosyalar ve kayıt değişmeden kalır.
+    """
+    new_apps = json.loads(json.dumps(installed_apps))
+    transaction = FileTransaction()
+    current = None
+    try:
+        for index, current in enumerate(names):
+            if current not in new_apps:
+                raise ValueError("kayıtlı değil")
+            apply(new_apps, current, transaction)
+            if progress:
+                progress(index + 1, len(names), current)
+        current = None
+        transaction.keep(APPS_FILE)
+        write_installed_apps(new_apps)
+    except Exception as e:
+        transaction.rollback()
+        logging.error(f"Toplu işlem geri alındı ({current}): {str(e)}")
+        raise BulkOperationError(current or "kayıt", e)
+
+    transaction.commit()
+    refresh_desktop_databases()
+    return new_apps
+
+
+def remove_apps(installed_apps, names, progress=None):
+    """Uygulamaları tek bir işlemde kaldırır ve yeni kaydı döndürür"""
+    def apply(apps, app_name, transaction):
+        remove_app_files(app_name, apps.pop(app_name), transaction)
+        logging.info(f"Uygulama kaldırıldı: {app_name}")
+
+    return _run_bulk(installed_apps, names, apply, progress)
+
+
+def edit_apps(installed_apps, edits, progress=None):
+    """{eski ad: yeni bilgi} eşlemesini tek bir işlemde uygular.
+
+    Yeni bilgi 'name', 'comment' ve isteğe bağlı olarak 128 piksele
+    ölçeklenmiş bir PNG'yi gösteren 'new_icon_path' içerebilir.
+    """
+    def apply(apps, app_name, transaction):
+        new_info = dict(edits[app_name])
+        new_info.setdefault('name', app_name)
+        if new_info['name'] != app_name and new_info['name'] in apps:
+            raise ValueError(f"{new_info['name']} zaten yüklü")
+        app_info = apps.pop(app_name)
+
+        if 'new_icon_path' in new_info:
+            os.makedirs(ICON_DIR, exist_ok=True)
+            new_icon_path = os.path.join(ICON_DIR, f"{new_info['name']}.png")
+            if app_info.get('icon') not in (None, new_icon_path, DEFAULT_ICON):
+                transaction.remove(app_info['icon'])
+            transaction.copy(new_info['new_icon_path'], new_icon_path)
+            app_info['icon'] = new_info['icon'] = new_icon_path
+
+        update_desktop_files(app_name, new_info, transaction)
+        if new_info.get('comment') is not None:
+            app_info['comment'] = new_info['comment']
+        apps[new_info['name']] = app_info
+        logging.info(f"Uygulama güncellendi: {app_name} -> {new_info['name']}")
+
+    return _run_bulk(installed_apps, list(edits), apply, progress)
+
+
+def extract_embedded_icon(app_path, icon_path):
+    """AppImage içindeki ilk PNG ikonu geçici bir dizine çıkarıp kopyalar"""
+    with tempfile.TemporaryDirectory(prefix="appimage_icon_") as work_dir:
+        subprocess.run([app_path, "--appimage-extract", "*.png"],
+                       cwd=work_dir,
+                       stdout=subprocess.DEVNULL,
+                       stderr=subprocess.DEVNULL,
+                       timeout=10)
+        squashfs_root = os.path.join(work_dir, "squashfs-root")
+        for root, _, files in os.walk(squashfs_root):
+            for file in files:
+                if file.endswith('.png'):
+                    shutil.copy2(os.path.join(root, file), icon_path)
+                    return True
+    return False
+
+
+def read_embedded_metadata(app_path):
+    """AppImage içindeki .desktop dosyasından arama için meta verileri okur"""
+    metadata = {}
+    try:
+        with tempfile.TemporaryDirectory(prefix="appimage_meta_") as work_dir:
+            subprocess.run([app_path, "--appimage-extract", "*.desktop"],
+                           cwd=work_dir,
+                           stdout=subprocess.DEVNULL,
+                           stderr=subprocess.DEVNULL,
+                           timeout=10)
+            squashfs_root = os.path.join(work_dir, "squashfs-root")
+            if not os.path.isdir(squashfs_root):
+                return metadata
+            desktop_files = sorted(name for name in os.listdir(squashfs_root) if name.endswith('.desktop'))
+            if not desktop_files:
+                return metadata
+            with open(os.path.join(squashfs_root, desktop_files[0]), 'r', errors='replace') as f:
+                for line in f:
+                    if line.startswith('[') and metadata:
+                        break  # Yalnızca [Desktop Entry] bölümü
+                    key, sep, value = line.strip().partition('=')
+                    if sep and key in ('GenericName', 'Categories', 'Keywords'):
+                        metadata[key] = value
+    except Exception as e:
+        logging.warning(f"Gömülü meta veri okunamadı ({app_path}): {str(e)}")
+    return metadata
+
+
+def get_icon_path(app_name, app_path=None):
+    try:
+        # İkon dizinini oluştur
+        os.makedirs(ICON_DIR, exist_ok=True)
+        icon_path = os.path.join(ICON_DIR, f"{app_name}.png")
+
+        # Önce yerel AppImage'dan ikon çıkarmayı dene
+        if app_path and os.path.exists(app_path):
+            try:
+                if extract_embedded_icon(app_path, icon_path):
+                    return icon_path
+            except Exception:
+                pass
+
+        # İkon indirmeyi dene (birden fazla API ile)
+        import requests
+
+        apis = [
+            f"https://api.duckduckgo.com/?q={app_name}+icon&format=json&pretty=1",
+            f"https://iconfinder-api.com/v4/icons/search?query={app_name}&count=1"
+        ]
+
+        headers = {
+            'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko)'
+        }
+
+        for api_url in apis:
+            try:
+                response = requests.get(api_url, headers=headers, timeout=5)
+                if response.status_code == 200:
+                    data = response.json()
+
+                    # DuckDuckGo API
+                    if 'Image' in data and data['Image']:
+                        img_url = data['Image']
+                    # Iconfinder API
+                    elif 'icons' in data and data['icons']:
+                        img_url = data['icons'][0]['raster_sizes'][-1]['formats'][0]['preview_url']
+                    else:
+                        continue
+
+                    img_response = requests.get(img_url, headers=headers, timeout=5)
+                    if img_response.status_code == 200:
+                        with open(icon_path, 'wb') as f:
+                            f.write(img_response.content)
+                        return icon_path
+            except Exception:
+                continue
+
+        # Varsayılan ikonu kullan
+        shutil.copy2(DEFAULT_ICON, icon_path)
+        return icon_path
+
+    except Exception as e:
+        logging.error(f"İkon indirme hatası: {str(e)}")
+        return DEFAULT_ICON
+
+
+def check_appimage_file(file_path):
+    """Dosya geçerli bir AppImage değilse nedenini, geçerliyse None döndürür"""
+    from appimage_validator import validate_appimage
+
+    info = validate_appimage(file_path)
+    return None if info.valid else info.reason
+
+
+def version_dir(app_name):
+    return os.path.join(VERSIONS_DIR, app_name)
+
+
+def replace_symlink(target, link_path):
+    """Sembolik bağı geçici bir bağ üzerinden atomik olarak değiştirir"""
+    tmp_link = f"{link_path}.{os.getpid()}.tmp"
+    if os.path.lexists(tmp_link):
+        os.remove(tmp_link)
+    os.symlink(target, tmp_link)
+    os.replace(tmp_link, link_path)
+
+
+def _new_version_id(app_name):
+    version_id = datetime.now().strftime("%Y%m%d-%H%M%S")
+    candidate, suffix = version_id, 2
+    while os.path.lexists(os.path.join(version_dir(app_name), f"{candidate}.AppImage")):
+        candidate = f"{version_id}-{suffix}"
+        suffix += 1
+    return candidate
+
+
+def add_version(app_name, app_info, source_path, move=False):
+    """Dosyayı sürüm dizinine ekler ve kayda işler; etkinleştirmez"""
+    os.makedirs(version_dir(app_name), exist_ok=True)
+    version_id = _new_version_id(app_name)
+    version_path = os.path.join(version_dir(app_name), f"{version_id}.AppImage")
+
+    if move:
+        shutil.move(source_path, version_path)
+    else:
+        # Yarım kopyalar sürüm olarak görünmesin diye önce geçici ada kopyala
+        tmp_path = version_path + ".part"
+        shutil.copy2(source_path, tmp_path)
+        os.replace(tmp_path, version_path)
+    os.chmod(version_path, 0o755)
+
+    version = {
+        'id': version_id,
+        'path': version_path,
+        'file_name': os.path.basename(source_path),
+        'size': os.path.getsize(version_path),
+        'install_date': datetime.now().isoformat()
+    }
+    app_info.setdefault('versions', []).append(version)
+    return version
+
+
+def migrate_to_versions(app_name, app_info):
+    """Yerinde kopyalanmış eski kurulumları sürüm düzenine taşır"""
+    stable_path = app_info['path']
+    if app_info.get('versions') or os.path.islink(stable_path) or not os.path.isfile(stable_path):
+        return
+    version = add_version(app_name, app_info, stable_path, move=True)
+    version['install_date'] = app_info.get('install_date', version['install_date'])
+    activate_version(app_name, app_info, version['id'])
+    logging.info(f"Eski kurulum sürüm düzenine taşındı: {app_name}")
+
+
+def activate_version(app_name, app_info, version_id):
+    """Sabit yolu verilen sürüme bağlar; .desktop dosyaları değişmez"""
+    version = next((v for v in app_info.get('versions', []) if v['id'] == version_id), None)
+    if version is None:
+        raise ValueError(f"{app_name} için {version_id} sürümü yok")
+    if not os.path.exists(version['path']):
+        raise FileNotFoundError(version['path'])
+
+    target = os.path.relpath(version['path'], os.path.dirname(app_info['path']))
+    replace_symlink(target, app_info['path'])
+    app_info['active_version'] = version_id
+    logging.info(f"Sürüm etkinleştirildi: {app_name} -> {version_id}")
+    return version
+
+
+def switch_version(installed_apps, app_name, version_id):
+    """Etkin sürümü değiştirir ve kaydı yazar"""
+    app_info = installed_apps[app_name]
+    migrate_to_versions(app_name, app_info)
+    version = activate_version(app_name, app_info, version_id)
+    write_installed_apps(installed_apps)
+    return version
+
+
+def rollback_version(installed_apps, app_name):
+    """Etkin sürümden bir önceki sürüme döner"""
+    app_info = installed_apps[app_name]
+    version_ids = [v['id'] for v in app_info.get('versions', [])]
+    if app_info.get('active_version') not in version_ids:
+        raise ValueError(f"{app_name} için etkin sürüm bilinmiyor")
+    index = version_ids.index(app_info['active_version'])
+    if index == 0:
+        raise ValueError(f"{app_name} için daha eski bir sürüm yok")
+    return switch_version(installed_apps, app_name, version_ids[index - 1])
+
+
+def prune_versions(app_name, app_info, keep=KEEP_VERSIONS):
+    """Etkin sürüm ve en yeni keep-1 sürüm dışındakileri siler"""
+    versions = app_info.get('versions', [])
+    active = app_info.get('active_version')
+    others = [v for v in versions if v['id'] != active]
+    stale = others[:max(0, len(others) - (keep - 1))]
+    for version in stale:
+        if os.path.exists(version['path']):
+            os.remove(version['path'])
+        versions.remove(version)
+        logging.info(f"Eski sürüm silindi: {app_name} {version['id']}")
+    return stale
+
+
+def find_app_by_file_name(installed_apps, file_name):
+    """Sabit yolu bu dosya adını kullanan (yeniden adlandırılmış olabilir) uygulamayı bulur"""
+    stable_path = os.path.join(APPIMAGES_DIR, file_name)
+    for app_name, app_info in installed_apps.items():
+        if app_info.get('path') == stable_path:
+            return app_name
+    return None
+
+
+def install_appimage(file_path, installed_apps, no_sandbox=True, move=False, keep=KEEP_VERSIONS):
+    """AppImage'ı yeni bir sürüm olarak ekler ve etkinleştirir.
+
+    Uygulama zaten yüklüyse .desktop dosyaları ve ikon korunur; yalnızca
+    sabit yol yeni sürüme bağlanır ve eski sürümler saklama politikasına
+    göre budanır. Kaydı diske yazmak çağıranın sorumluluğundadır.
+    """
+    file_name = os.path.basename(file_path)
+    app_name = find_app_by_file_name(installed_apps, file_name) or os.path.splitext(file_name)[0]
+
+    app_info = installed_apps.get(app_name)
+    if app_info:
+        migrate_to_versions(app_name, app_info)
+        version = add_version(app_name, app_info, file_path, move)
+        activate_version(app_name, app_info, version['id'])
+        prune_versions(app_name, app_info, keep)
+        app_info['metadata'] = read_embedded_metadata(version['path'])
+        logging.info(f"Uygulama güncellendi: {app_name} ({version['id']})")
+        return app_name
+
+    os.makedirs(APPIMAGES_DIR, exist_ok=True)
+    app_info = {
+        'path': os.path.join(APPIMAGES_DIR, file_name),
+        'install_date': datetime.now().isoformat(),
+        'comment': DEFAULT_COMMENT
+    }
+    version = add_version(app_name, app_info, file_path, move)
+    activate_version(app_name, app_info, version['id'])
+
+    sandbox_param = "--no-sandbox" if no_sandbox else ""
+    app_info['icon'] = get_icon_path(app_name, app_info['path'])
+    app_info['metadata'] = read_embedded_metadata(app_info['path'])
+    write_desktop_files(app_name, build_desktop_entry(app_name, app_info['path'], app_info['icon'], sandbox_param))
+
+    installed_apps[app_name] = app_info
+    logging.info(f"Uygulama yüklendi: {app_name}")
+    return app_name
@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+"""AppImage'ları doğrudan URL'den, paralel HTTP aralık istekleriyle indirir.
+
+Dosya AppImage deposundaki `downloads` dizinine `.part` uzantısıyla yazılır;
+tamamlanan parçalar `.part.json` durum dosyasına işlendiği için kesilen bir
+indirme kaldığı yerden sürer. İndirme sürdükçe `.part` dosyası kilitli
+tutulur; çöp toplama ve aynı dosyanın ikinci bir indirmesi buna bakar. Durum, yönlendirmelerden önceki özgün URL ile
+boyut ve ETag/Last-Modified'a bağlıdır; GitHub gibi her istekte yeni imzalı
+adrese yönlendiren sunucularda da sürdürme çalışır. Özet, parçalar tamamlandıkça ayrı bir iş
+parçacığında sırayla hesaplanır; indirme bitince ikinci bir okuma gerekmez.
+"""
+import os
+import re
+import json
+import fcntl
+import queue
+import hashlib
+import logging
+import threading
+from urllib.parse import urljoin, urlparse, unquote
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import appimage_core as core
+
+DOWNLOADS_DIR = os.path.join(core.APPIMAGES_DIR, "downloads")
+CHUNK_SIZE = 8 * 1024 * 1024
+READ_SIZE = 256 * 1024
+CONNECTIONS = 4
+RETRIES = 3
+TIMEOUT = 30
+USER_AGENT = "AppImages-to-Desktop"
+
+# Onaltılık uzunluğa göre özet algoritması
+HASH_BY_LENGTH = {32: "md5", 40: "sha1", 64: "sha256", 128: "sha512"}
+CHECKSUM_SUFFIXES = (".sha256", ".sha256sum", ".sha512", ".DIGEST")
+CHECKSUM_LISTS = ("SHA256SUMS", "SHA256SUMS.txt", "sha256sums.txt", "checksums.txt")
+
+
+class DownloadError(Exception):
+    pass
+
+
+class DownloadCancelled(DownloadError):
+    pass
+
+
+def parse_checksum(text):
+    """'sha256:abc...' veya çıplak onaltılık özeti (algoritma, özet) olarak döndürür"""
+    text = text.strip()
+    algorithm, sep, digest = text.partition(":")
+    if not sep:
+        algorithm, digest = None, text
+    digest = digest.lower()
+    if not re.fullmatch(r"[0-9a-f]+", digest):
+        raise ValueError(f"Geçersiz özet: {text}")
+    algorithm = (algorithm or HASH_BY_LENGTH.get(len(digest), "")).lower()
+    if algorithm not in hashlib.algorithms_available:
+        raise ValueError(f"Bilinmeyen özet algoritması: {text}")
+    return algorithm, digest
+
+
+def _find_in_checksum_list(text, file_name):
+    for line in text.splitlines():
+        parts = line.strip().split()
+        if not parts:
+            continue
+        digest = parts[0].lower()
+        if len(parts) == 1 and len(digest) in HASH_BY_LENGTH:
+            return digest
+        if len(parts) >= 2 and parts[-1].lstrip("*") == file_name and len(digest) in HASH_BY_LENGTH:
+            return digest
+    return None
+
+
+def find_published_checksum(session, url, file_name):
+    """Sürümle birlikte yayımlanmış bir özet dosyası arar"""
+    candidates = [url + suffix for suffix in CHECKSUM_SUFFIXES]
+    candidates += [urljoin(url, name) for name in CHECKSUM_LISTS]
+    for checksum_url in candidates:
+        try:
+            response = session.get(checksum_url, timeout=TIMEOUT)
+            if response.status_code != 200 or len(response.content) > 1024 * 1024:
+                continue
+            digest = _find_in_checksum_list(response.text, file_name)
+            if digest:
+                logging.info(f"Yayımlanmış özet bulundu: {checksum_url}")
+                return parse_checksum(digest)
+        except Exception:
+            continue
+    return None
+
+
+def _file_name_from_response(url, response):
+    disposition = response.headers.get("Content-Disposition", "")
+    match = re.search(r"filename\*?=(?:UTF-8'')?\"?([^\";]+)\"?", disposition)
+    name = unquote(match.group(1)) if match else unquote(os.path.basename(urlparse(response.url or url).path))
+    name = os.path.basename(name) or "download.AppImage"
+    return name if name.endswith(".AppImage") else name + ".AppImage"
+
+
+class _StreamHasher(threading.Thread):
+    """Tamamlanan parçaları dosya sırasıyla özetler"""
+
+    def __init__(self, fd, chunk_count, chunk_size, total_size, algorithm):
+        super().__init__(daemon=True)
+        self.fd = fd
+        self.chunk_count = chunk_count
+        self.chunk_size = chunk_size
+        self.total_size = total_size
+        self.hash = hashlib.new(algorithm)
+        self.completed = queue.Queue()
+        self.error = None
+
+    def run(self):
+        ready = set()
+        cursor = 0
+        try:
+            while cursor < self.chunk_count:
+                index = self.completed.get()
+                if index is None:
+                    return
+                ready.add(index)
+                while cursor in ready:
+                    offset = cursor * self.chunk_size
+                    end = min(offset + self.chunk_size, self.total_size)
+                    while offset < end:
+                        data = os.pread(self.fd, min(READ_SIZE, end - offset), offset)
+                        if not data:
+                            raise DownloadError("Parça diskte eksik")
+                        self.hash.update(data)
+                        offset += len(data)
+                    ready.discard(cursor)
+                    cursor += 1
+        except Exception as e:
+            self.error = e
+
+
+class Download:
+    """Tek bir URL'nin indirilmesi.
+
+    progress(indirilen, toplam) iş parçacıklarından çağrılır; toplam
+    bilinmiyorsa 0'dır. cancel() indirmeyi durdurur, .part dosyası korunur.
+    """
+
+    def __init__(self, url, checksum=None, connections=CONNECTIONS, chunk_size=CHUNK_SIZE,
+                 dest_dir=DOWNLOADS_DIR, progress=None):
+        self.url = url
+        self.resolved_url = url  # Yönlendirme sonrası adres; her çalıştırmada yeniden çözülür
+        self.checksum = parse_checksum(checksum) if checksum else None
+        self.connections = max(1, connections)
+        self.chunk_size = chunk_size
+        self.dest_dir = dest_dir
+        self.progress = progress
+        self.cancel_event = threading.Event()
+        self.downloaded = 0
+        self.total_size = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def _session(self):
+        import requests
+
+        if not hasattr(self._local, "session"):
+            self._local.session = requests.Session()
+            self._local.session.headers["User-Agent"] = USER_AGENT
+        return self._local.session
+
+    def _add_progress(self, count):
+        with self._lock:
+            self.downloaded += count
+            downloaded = self.downloaded
+        if self.progress:
+            self.progress(downloaded, self.total_size)
+
+    def _probe(self):
+        """Boyutu, aralık desteğini ve dosya adını öğrenir"""
+        response = self._session().get(self.url, headers={"Range": "bytes=0-0"},
+                                       stream=True, timeout=TIMEOUT, allow_redirects=True)
+        try:
+            if response.status_code not in (200, 206):
+                raise DownloadError(f"HTTP {response.status_code}: {self.url}")
+            self.resolved_url = response.url or self.url
+            file_name = _file_name_from_response(self.resolved_url, response)
+            validator = response.headers.get("ETag") or response.headers.get("Last-Modified", "")
+            if response.status_code == 206:
+                match = re.search(r"/(\d+)$", response.headers.get("Content-Range", ""))
+                if match:
+                    return file_name, int(match.group(1)), True, validator
+            return file_name, int(response.headers.get("Content-Length") or 0), False, validator
+        finally:
+            response.close()
+
+    def _check_header(self, data):
+        if len(data) >= 11 and (data[:4] != b"\x7fELF" or data[8:10] != b"AI"):
+            raise DownloadError("İndirilen dosya bir AppImage değil")
+
+    def _write_stream(self, response, fd, offset, end=None):
+        """Yanıt gövdesini verilen konumdan itibaren dosyaya yazar"""
+        for data in response.iter_content(READ_SIZE):
+            if self.cancel_event.is_set():
+                raise DownloadCancelled("İndirme iptal edildi")
+            if end is not None:
+                data = data[:end - offset]
+            if offset == 0:
+                self._check_header(data)
+            os.pwrite(fd, data, offset)
+            offset += len(data)
+            self._add_progress(len(data))
+            if end is not None and offset >= end:
+                break
+        return offset
+
+    def _fetch_chunk(self, fd, index):
+        start = index * self.chunk_size
+        end = min(start + self.chunk_size, self.total_size)
+        offset = start
+        for attempt in range(RETRIES):
+            if self.cancel_event.is_set():
+                raise DownloadCancelled("İndirme iptal edildi")
+            try:
+                headers = {"Range": f"bytes={offset}-{end - 1}"}
+                with self._session().get(self.resolved_url, headers=headers, stream=True,
+                                         timeout=TIMEOUT) as response:
+                    if response.status_code != 206:
+                        raise DownloadError(f"Aralık isteği reddedildi: HTTP {response.status_code}")
+                    offset = self._write_stream(response, fd, offset, end)
+                if offset >= end:
+                    return index
+            except DownloadError:
+                raise
+            except Exception as e:
+                logging.warning(f"Parça {index} indirilemedi (deneme {attempt + 1}): {str(e)}")
+        raise DownloadError(f"Parça {index} {RETRIES} denemede indirilemedi")
+
+    def _load_state(self, state_path, part_path, expected):
+        try:
+            with open(state_path) as f:
+                state = json.load(f)
+            if all(state.get(key) == value for key, value in expected.items()) and os.path.exists(part_path):
+                return set(state.get("done", []))
+        except (OSError, ValueError):
+            pass
+        return set()
+
+    def _save_state(self, state_path, expected, done):
+        tmp_path = state_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(dict(expected, done=sorted(done)), f)
+        os.replace(tmp_path, state_path)
+
+    def _download_ranges(self, part_path, state_path, validator, algorithm):
+        chunk_count = (self.total_size + self.chunk_size - 1) // self.chunk_size
+        expected = {"url": self.url, "size": self.total_size, "validator": validator,
+                    "chunk_size": self.chunk_size}
+        done = self._load_state(state_path, part_path, expected)
+        if done:
+            logging.info(f"İndirme sürdürülüyor: {len(done)}/{chunk_count} parça hazır")
+
+        fd = os.open(part_path, os.O_RDWR | os.O_CREAT, 0o644)
+        hasher = None
+        try:
+            os.ftruncate(fd, self.total_size)
+            hasher = _StreamHasher(fd, chunk_count, self.chunk_size, self.total_size, algorithm)
+            hasher.start()
+            for index in sorted(done):
+                hasher.completed.put(index)
+            self._add_progress(sum(min(self.chunk_size, self.total_size - i * self.chunk_size) for i in done))
+
+            remaining = [index for index in range(chunk_count) if index not in done]
+            with ThreadPoolExecutor(max_workers=self.connections) as executor:
+                futures = [executor.submit(self._fetch_chunk, fd, index) for index in remaining]
+                try:
+                    for future in as_completed(futures):
+                        index = future.result()
+                        done.add(index)
+                        hasher.completed.put(index)
+                        self._save_state(state_path, expected, done)
+                except BaseException:
+                    # Diğer parçaları durdur; bitenler durum dosyasında kalır
+                    self.cancel_event.set()
+                    raise
+
+            hasher.join()
+            if hasher.error:
+                raise DownloadError(str(hasher.error))
+            return hasher.hash.hexdigest()
+        except BaseException:
+            if hasher:
+                hasher.completed.put(None)
+            raise
+        finally:
+            os.close(fd)
+
+    def _download_single(self, part_path, algorithm):
+        """Aralık desteği olmayan sunucular için tek akışlı indirme"""
+        digest = hashlib.new(algorithm)
+        self.downloaded = 0
+        fd = os.open(part_path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            with self._session().get(self.resolved_url, stream=True, timeout=TIMEOUT) as response:
+                if response.status_code != 200:
+                    raise DownloadError(f"HTTP {response.status_code}: {self.url}")
+                offset = 0
+                for data in response.iter_content(READ_SIZE):
+                    if self.cancel_event.is_set():
+                        raise DownloadCancelled("İndirme iptal edildi")
+                    if offset == 0:
+                        self._check_header(data)
+                    os.pwrite(fd, data, offset)
+                    digest.update(data)
+                    offset += len(data)
+                    self._add_progress(len(data))
+        finally:
+            os.close(fd)
+        return digest.hexdigest()
+
+    def run(self, validate=True):
+        """İndirir, özeti doğrular ve tamamlanan dosyanın yolunu döndürür"""
+        file_name, self.total_size, ranges, validator = self._probe()
+        os.makedirs(self.dest_dir, exist_ok=True)
+        final_path = os.path.join(self.dest_dir, file_name)
+        part_path = final_path + ".part"
+        state_path = part_path + ".json"
+
+        lock_fd = os.open(part_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(lock_fd)
+            raise DownloadError(f"Bu dosya zaten indiriliyor: {file_name}")
+        try:
+            return self._run_locked(final_path, part_path, state_path, file_name, ranges, validator, validate)
+        finally:
+            os.close(lock_fd)
+
+    def _run_locked(self, final_path, part_path, state_path, file_name, ranges, validator, validate):
+        checksum = self.checksum or find_published_checksum(self._session(), self.url, file_name)
+        algorithm = checksum[0] if checksum else "sha256"
+        logging.info(f"İndirme başlıyor: {self.url} ({self.total_size} bayt, "
+                     f"{self.connections if ranges else 1} bağlantı)")
+
+        if ranges and self.total_size and self.connections > 1:
+            digest = self._download_ranges(part_path, state_path, validator, algorithm)
+        else:
+            digest = self._download_single(part_path, algorithm)
+
+        if checksum and digest != checksum[1]:
+            for path in (part_path, state_path):
+                if os.path.exists(path):
+                    os.remove(path)
+            raise DownloadError(f"Özet uyuşmuyor ({algorithm}): beklenen {checksum[1]}, bulunan {digest}")
+
+        if validate:
+            from appimage_validator import validate_appimage
+
+            info = validate_appimage(part_path)
+            if not info.valid:
+                raise DownloadError(f"İndirilen dosya geçerli bir AppImage değil: {info.reason}")
+
+        os.replace(part_path, final_path)
+        if os.path.exists(state_path):
+            os.remove(state_path)
+        self.digest = (algorithm, digest, bool(checksum))
+        logging.info(f"İndirme tamamlandı: {final_path} ({algorithm}={digest})")
+        return final_path
+
+
+def install_from_url(url, installed_apps, checksum=None, connections=CONNECTIONS,
+                     no_sandbox=True, progress=None):
+    """İndirilen dosyayı kopyalamadan sürüm dizinine taşıyarak yükler"""
+    path = Download(url, checksum, connections, progress=progress).run()
+    return core.install_appimage(path, installed_apps, no_sandbox=no_sandbox, move=True)
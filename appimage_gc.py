@@ -0,0 +1,426 @@
+#!/usr/bin/env python3
+"""AppImage kütüphanesi ve önbellekleri için disk kullanımı analizi ve çöp toplama.
+
+Dizinler paralel os.scandir ile taranır; yalnızca aynı boyuttaki
+AppImage'ların içeriği özetlenir. Varsayılan çalışma kuru çalıştırmadır
+(yalnızca rapor); reclaim() isteğe bağlı bir bütçeyle yer açar.
+"""
+import os
+import re
+import time
+import fcntl
+import shutil
+import hashlib
+import logging
+import threading
+from collections import defaultdict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+import appimage_core as core
+
+CACHE_DIR = os.path.expanduser("~/.cache/appimage_installer")
+# Eski get_icon_path sürümleri squashfs-root'u çalışma dizinine çıkarıyordu
+STRAY_EXTRACT_ROOTS = [os.path.expanduser("~"), os.getcwd(), os.path.dirname(os.path.abspath(__file__))]
+# Yarım indirmeler sürdürülebilir; ancak bu kadar süre dokunulmamışsa çöp sayılır
+STALE_DOWNLOAD_AGE = 24 * 60 * 60
+DOWNLOAD_SUFFIXES = (".part.json.tmp", ".part.json", ".part")
+HASH_BLOCK_SIZE = 1024 * 1024
+
+FileEntry = namedtuple("FileEntry", ["path", "size", "mtime"])
+Candidate = namedtuple("Candidate", ["kind", "path", "size", "reason", "reclaimable"])
+
+# Rapordaki aday türleri
+ORPHAN_APPIMAGE = "orphan_appimage"
+ORPHAN_ICON = "orphan_icon"
+STALE_DESKTOP = "stale_desktop"
+STRAY_EXTRACT = "stray_extract"
+TEMP_FILES = "temp_files"
+DUPLICATE = "duplicate"
+
+KIND_LABELS = {
+    ORPHAN_APPIMAGE: "Kayıtsız AppImage",
+    ORPHAN_ICON: "Sahipsiz ikon",
+    STALE_DESKTOP: "Geçersiz .desktop",
+    STRAY_EXTRACT: "Artık squashfs-root",
+    TEMP_FILES: "Geçici dosya",
+    DUPLICATE: "Yinelenen AppImage",
+}
+
+
+class GarbageReport:
+    def __init__(self):
+        self.usage = {}          # {uygulama adı: bayt}
+        self.candidates = []     # Candidate listesi
+        self.total_size = 0      # Taranan tüm dosyaların boyutu
+        self.scan_seconds = 0.0
+
+    @property
+    def reclaimable_size(self):
+        return sum(c.size for c in self.candidates if c.reclaimable)
+
+    def to_dict(self):
+        return {
+            "usage": self.usage,
+            "candidates": [c._asdict() for c in self.candidates],
+            "total_size": self.total_size,
+            "scan_seconds": self.scan_seconds,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        report = cls()
+        report.usage = data["usage"]
+        report.candidates = [Candidate(**c) for c in data["candidates"]]
+        report.total_size = data["total_size"]
+        report.scan_seconds = data["scan_seconds"]
+        return report
+
+    def format(self):
+        lines = [f"Taranan toplam: {format_size(self.total_size)} ({self.scan_seconds:.2f} sn)", ""]
+        lines.append("Uygulama başına kullanım:")
+        for app_name, size in sorted(self.usage.items(), key=lambda item: -item[1]):
+            lines.append(f"  {format_size(size):>10}  {app_name}")
+        lines.append("")
+        if not self.candidates:
+            lines.append("Temizlenecek bir şey bulunamadı.")
+        for candidate in sorted(self.candidates, key=lambda c: -c.size):
+            marker = " " if candidate.reclaimable else "!"
+            lines.append(f"{marker} {format_size(candidate.size):>10}  {KIND_LABELS[candidate.kind]}: "
+                         f"{candidate.path} ({candidate.reason})")
+        lines.append("")
+        lines.append(f"Geri kazanılabilir: {format_size(self.reclaimable_size)}")
+        return "\n".join(lines)
+
+
+def format_size(size):
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+
+
+def parse_size(text):
+    """'500M', '2G', '1024' gibi bir boyutu bayta çevirir"""
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([KMGT]?)B?\s*", text.upper())
+    if not match:
+        raise ValueError(f"Geçersiz boyut: {text}")
+    return int(float(match.group(1)) * 1024 ** " KMGT".index(match.group(2) or " "))
+
+
+def _disk_usage(st):
+    return st.st_blocks * 512 if hasattr(st, "st_blocks") else st.st_size
+
+
+def scan_tree(roots, max_workers=8, skip_dirs=()):
+    """Dizin ağaçlarını paralel olarak tarar; {kök: [FileEntry]} döndürür"""
+    results = defaultdict(list)
+    condition = threading.Condition()
+    pending = [0]
+
+    def submit(root, path):
+        with condition:
+            pending[0] += 1
+        executor.submit(scan_dir, root, path)
+
+    def scan_dir(root, path):
+        files = []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in skip_dirs:
+                                submit(root, entry.path)
+                        else:
+                            st = entry.stat(follow_symlinks=False)
+                            files.append(FileEntry(entry.path, _disk_usage(st), st.st_mtime))
+                    except OSError:
+                        continue
+        except OSError as e:
+            logging.warning(f"Dizin taranamadı ({path}): {str(e)}")
+        # Alt dizinler bu dizin bitmeden kuyruğa eklendiği için sayaç erken sıfırlanmaz
+        with condition:
+            results[root].extend(files)
+            pending[0] -= 1
+            condition.notify_all()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for root in roots:
+            if os.path.isdir(root):
+                submit(root, root)
+        with condition:
+            while pending[0]:
+                condition.wait()
+    return results
+
+
+def dir_size(path, max_workers=4):
+    return sum(entry.size for entries in scan_tree([path], max_workers).values() for entry in entries)
+
+
+def _read_desktop_entry(path):
+    entry = {}
+    try:
+        with open(path, "r", errors="replace") as f:
+            for line in f:
+                key, sep, value = line.partition("=")
+                if sep and key.strip() not in entry:
+                    entry[key.strip()] = value.strip()
+    except OSError:
+        pass
+    return entry
+
+
+def _exec_target(exec_line):
+    """Exec satırının çalıştırdığı AppImage; başlatıcı üzerindense onun argümanı"""
+    args = [arg.strip('"') for arg in exec_line.split()] if exec_line else []
+    if len(args) > 2 and os.path.basename(args[1]) == os.path.basename(core.LAUNCHER):
+        return args[2]
+    return args[0] if args else ""
+
+
+def _file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def find_duplicates(paths, max_workers=4):
+    """Aynı içerikteki dosyaları gruplar; yalnızca boyutu çakışanları özetler"""
+    by_size = defaultdict(list)
+    for path in paths:
+        try:
+            by_size[os.path.getsize(path)].append(path)
+        except OSError:
+            continue
+    suspects = [path for group in by_size.values() if len(group) > 1 for path in group]
+    if not suspects:
+        return []
+
+    by_hash = defaultdict(list)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for path, digest in zip(suspects, executor.map(_file_hash, suspects)):
+            by_hash[digest].append(path)
+    return [sorted(group) for group in by_hash.values() if len(group) > 1]
+
+
+def _download_in_progress(path):
+    """Süren bir indirme .part dosyasını kilitli tutar (appimage_download)"""
+    name = os.path.basename(path)
+    for suffix in DOWNLOAD_SUFFIXES:
+        if name.endswith(suffix):
+            path = path[:-len(suffix)]
+            break
+    try:
+        fd = os.open(path + ".part", os.O_RDONLY)
+    except OSError:
+        return False
+    try:
+        fcntl.flock(fd, fcntl.LOCK_SH | fcntl.LOCK_NB)
+        return False
+    except OSError:
+        return True
+    finally:
+        os.close(fd)
+
+
+def _is_icon_extract(path):
+    """Eski ikon çıkarma `--appimage-extract '*.png'` ile yalnızca PNG dosyaları bırakırdı"""
+    found = False
+    for _, _, files in os.walk(path):
+        for name in files:
+            if not name.endswith(".png"):
+                return False
+            found = True
+    return found
+
+
+def _own_app_names(installed_apps):
+    """Bu aracın kullandığı ya da kullanmış olduğu uygulama adları.
+
+    Kayıttakilere ek olarak sürüm dizinleri yeniden adlandırılmış uygulamaların
+    eski adlarını, kütüphanedeki dosyalar da kaydı bozulmuş kurulumları taşır.
+    """
+    names = set(installed_apps)
+    for directory in (core.VERSIONS_DIR, core.APPIMAGES_DIR):
+        if os.path.isdir(directory):
+            names.update(os.path.splitext(name)[0] for name in os.listdir(directory))
+    return names
+
+
+def _owned_paths(app_name, app_info):
+    """Uygulamanın kayıtta sahip olduğu dosyaların gerçek yolları"""
+    owned = [app_info.get('path'), app_info.get('icon')] + list(core.desktop_file_paths(app_name))
+    owned += [version['path'] for version in app_info.get('versions', [])]
+    return [os.path.realpath(path) for path in owned if path]
+
+
+def analyze(installed_apps=None, max_workers=8):
+    """Kuru çalıştırma: hiçbir şeyi silmeden bir GarbageReport üretir"""
+    started = time.perf_counter()
+    if installed_apps is None:
+        installed_apps = core.load_installed_apps()
+    report = GarbageReport()
+
+    roots = [core.APPIMAGES_DIR, core.ICON_DIR, core.APPLICATIONS_DIR, CACHE_DIR]
+    scanned = scan_tree(roots, max_workers)
+    sizes = {entry.path: entry.size for entries in scanned.values() for entry in entries}
+    report.total_size = sum(sizes.values())
+
+    # Uygulama başına kullanım
+    referenced = set()
+    for app_name, app_info in installed_apps.items():
+        owned = _owned_paths(app_name, app_info)
+        referenced.update(owned)
+        report.usage[app_name] = sum(sizes.get(path, 0) for path in set(owned))
+
+    # .desktop dosyaları: geçersiz girdiler ve kullanılan ikonlar
+    desktop_files = [entry.path for entry in scanned[core.APPLICATIONS_DIR] if entry.path.endswith(".desktop")]
+    if os.path.isdir(core.DESKTOP_DIR):
+        with os.scandir(core.DESKTOP_DIR) as entries:
+            desktop_files.extend(entry.path for entry in entries if entry.name.endswith(".desktop"))
+    used_icons = set()
+    for path in desktop_files:
+        entry = _read_desktop_entry(path)
+        icon = entry.get("Icon", "")
+        used_icons.add(os.path.realpath(icon) if os.path.isabs(icon) else icon)
+        target = _exec_target(entry.get("Exec"))
+        if target.startswith(core.APPIMAGES_DIR + os.sep) and not os.path.exists(target):
+            report.candidates.append(Candidate(STALE_DESKTOP, path, os.path.getsize(path),
+                                               f"hedef yok: {target}", True))
+
+    # Kayıtsız AppImage'lar
+    appimages = []
+    downloads = []
+    for entry in scanned[core.APPIMAGES_DIR]:
+        relative = os.path.relpath(entry.path, core.APPIMAGES_DIR)
+        # Yarım kalmış işlemler çöp değildir; core.recover_transactions() geri alır
+        if relative.startswith(core.TRANSACTION_PREFIX) or relative.startswith(".installed_apps."):
+            continue
+        if relative.startswith("downloads" + os.sep):
+            downloads.append(entry)
+            continue
+        if entry.path == core.APPS_FILE:
+            continue
+        real_path = os.path.realpath(entry.path)
+        appimages.append(real_path)
+        if real_path not in referenced:
+            report.candidates.append(Candidate(ORPHAN_APPIMAGE, entry.path, entry.size,
+                                               "kayıtta yok", True))
+
+    # Yarım kalmış indirmeler: .part ve durum dosyası birlikte değerlendirilir;
+    # süren ya da yakın zamanda kesilmiş (sürdürülebilir) indirmeler silinmez
+    now = time.time()
+    groups = defaultdict(list)
+    for entry in downloads:
+        key = entry.path
+        for suffix in DOWNLOAD_SUFFIXES:
+            if key.endswith(suffix):
+                key = key[:-len(suffix)]
+                break
+        groups[key].append(entry)
+    for key, entries in groups.items():
+        if _download_in_progress(key):
+            reason, reclaimable = "indirme sürüyor", False
+        elif now - max(entry.mtime for entry in entries) < STALE_DOWNLOAD_AGE:
+            reason, reclaimable = "yakın zamanda kesilmiş indirme, sürdürülebilir", False
+        else:
+            reason, reclaimable = "yarım kalmış indirme", True
+        for entry in entries:
+            report.candidates.append(Candidate(TEMP_FILES, entry.path, entry.size, reason, reclaimable))
+
+    # Sahipsiz ikonlar: ne kayıtta ne de herhangi bir .desktop dosyasında geçiyor.
+    # İkon dizini diğer programlarla paylaşılır; yalnızca bu aracın <uygulama>.png
+    # adıyla yazdığı ikonlar silinebilir, gerisi yalnızca raporlanır.
+    own_names = _own_app_names(installed_apps)
+    for entry in scanned[core.ICON_DIR]:
+        stem, ext = os.path.splitext(os.path.basename(entry.path))
+        real_path = os.path.realpath(entry.path)
+        if real_path in referenced or real_path in used_icons or stem in used_icons:
+            continue
+        if ext == ".png" and stem in own_names:
+            report.candidates.append(Candidate(ORPHAN_ICON, entry.path, entry.size,
+                                               "hiçbir uygulama kullanmıyor", True))
+        else:
+            report.candidates.append(Candidate(ORPHAN_ICON, entry.path, entry.size,
+                                               "hiçbir .desktop girdisinde yok, başka bir programa ait olabilir",
+                                               False))
+
+    # Geçici ikon önbelleği
+    for entry in scanned[CACHE_DIR]:
+        report.candidates.append(Candidate(TEMP_FILES, entry.path, entry.size, "ikon arama önbelleği", True))
+
+    # Eski sürümlerden kalan squashfs-root dizinleri. Elle `--appimage-extract`
+    # ile açılmış dizinler de aynı adı taşır; yalnızca PNG içerenler silinebilir.
+    for root in dict.fromkeys(STRAY_EXTRACT_ROOTS):
+        stray = os.path.join(root, "squashfs-root")
+        if os.path.isdir(stray) and not os.path.islink(stray):
+            if _is_icon_extract(stray):
+                report.candidates.append(Candidate(STRAY_EXTRACT, stray, dir_size(stray),
+                                                   "ikon çıkarmadan kalmış", True))
+            else:
+                report.candidates.append(Candidate(STRAY_EXTRACT, stray, dir_size(stray),
+                                                   "elle açılmış olabilir, silinmez", False))
+
+    # Yinelenenler: kayıtlı kopyalar korunur, yalnızca raporlanır
+    # (kayıtsız kopyalar zaten kayıtsız AppImage olarak listelendi)
+    for group in find_duplicates(list(dict.fromkeys(appimages))):
+        registered = [path for path in group if path in referenced]
+        for path in registered[1:]:
+            report.candidates.append(Candidate(DUPLICATE, path, sizes.get(path, 0),
+                                               f"{registered[0]} ile aynı içerik", False))
+
+    report.scan_seconds = time.perf_counter() - started
+    return report
+
+
+def reclaim(report, budget=None, kinds=None, paths=None, installed_apps=None):
+    """Geri kazanılabilir adayları büyükten küçüğe siler.
+
+    budget (bayt) verilirse en az bu kadar yer açıldığında durur.
+    paths verilirse yalnızca bu yollardaki adaylar silinir (onaylanan liste).
+    Rapor eskimiş olabilir; sahipsiz sayılan dosyalar güncel kayıtta (verilmezse
+    diskteki kayıt) bir uygulamaya aitse silinmez.
+    (silinen bayt, [silinen yollar]) döndürür.
+    """
+    if installed_apps is None:
+        installed_apps = core.load_installed_apps()
+    referenced = set()
+    for app_name, app_info in installed_apps.items():
+        referenced.update(_owned_paths(app_name, app_info))
+
+    freed = 0
+    removed = []
+    candidates = [c for c in report.candidates if c.reclaimable and (kinds is None or c.kind in kinds)]
+    if paths is not None:
+        paths = set(paths)
+        candidates = [c for c in candidates if c.path in paths]
+    for candidate in sorted(candidates, key=lambda c: -c.size):
+        if budget is not None and freed >= budget:
+            break
+        if (candidate.kind in (ORPHAN_APPIMAGE, ORPHAN_ICON, STALE_DESKTOP)
+                and os.path.realpath(candidate.path) in referenced):
+            logging.info(f"Çöp toplama: {candidate.path} atlandı, artık kayıtlı")
+            continue
+        if candidate.path.endswith(DOWNLOAD_SUFFIXES) and _download_in_progress(candidate.path):
+            logging.info(f"Çöp toplama: {candidate.path} atlandı, indirme sürüyor")
+            continue
+        try:
+            if os.path.isdir(candidate.path) and not os.path.islink(candidate.path):
+                shutil.rmtree(candidate.path)
+            elif os.path.lexists(candidate.path):
+                os.remove(candidate.path)
+            else:
+                continue
+        except OSError as e:
+            logging.error(f"Silinemedi ({candidate.path}): {str(e)}")
+            continue
+        freed += candidate.size
+        removed.append(candidate.path)
+        logging.info(f"Çöp toplama: {candidate.path} silindi ({format_size(candidate.size)})")
+
+    if any(c.kind in (STALE_DESKTOP, ORPHAN_ICON) for c in candidates if c.path in removed):
+        core.refresh_desktop_databases()
+    return freed, removed
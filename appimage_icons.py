@@ -0,0 +1,432 @@
+#!/usr/bin/env python3
+"""Çevrimiçi ikon arama (Qt içermez).
+
+GUI'deki IconSearchWorker ve arka plan servisi aynı arama mantığını kullanır.
+aiohttp ve asyncio yalnızca bir arama başladığında yüklenir.
+
+İndirilen ikonlar bellekte biriktirilmez: yanıt gövdesi parça parça bir
+IconResultStore dizinine yazılır ve dinleyicilere yalnızca dosya yolu iletilir.
+Bir aramada tutulabilecek sonuç sayısı ve toplam boyut sınırlıdır. Dosya
+yazma ve SVG dönüştürme olay döngüsünü bekletmemek için iş parçacığında
+yapılır; dosya adları benzersizdir, aynı dizini paylaşan aramalar çakışmaz.
+"""
+import os
+import logging
+import tempfile
+from collections import namedtuple
+
+MAX_RESULTS = 500
+MAX_SESSION_BYTES = 64 * 1024 * 1024
+MAX_ICON_BYTES = 4 * 1024 * 1024
+DOWNLOAD_CHUNK = 64 * 1024
+# Her açık bağlantı okunmamış gövdeyi aiohttp tamponunda biriktirir; tepe
+# bellek aynı anda indirilen ikon sayısıyla orantılıdır
+PARALLEL_DOWNLOADS = 8
+SVG_RENDER_SIZE = 128
+
+IconResult = namedtuple("IconResult", ["url", "source", "path", "size"])
+
+
+class IconTooLarge(Exception):
+    pass
+
+
+def sniff_image_type(header):
+    """İlk baytlardan dosya uzantısını tahmin eder; tanınmazsa None"""
+    if header.startswith(b"\x89PNG\r\n\x1a\n"):
+        return ".png"
+    if header.startswith(b"\xff\xd8\xff"):
+        return ".jpg"
+    if header[:6] in (b"GIF87a", b"GIF89a"):
+        return ".gif"
+    if header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+        return ".webp"
+    if header.startswith(b"\x00\x00\x01\x00"):
+        return ".ico"
+    text = header.lstrip()[:256].lower()
+    if text.startswith(b"<?xml") or text.startswith(b"<svg") or b"<svg" in text:
+        return ".svg"
+    return None
+
+
+def _unique_path(directory, suffix):
+    fd, path = tempfile.mkstemp(dir=directory, prefix="icon_", suffix=suffix)
+    os.close(fd)
+    return path
+
+
+class _PendingIcon:
+    """İndirilmekte olan tek bir ikon; write() ve finish() engelleyicidir"""
+
+    def __init__(self, store, url):
+        self.store = store
+        self.url = url
+        self.size = 0
+        fd, self.part_path = tempfile.mkstemp(dir=store.directory, prefix="icon_", suffix=".part")
+        self.file = os.fdopen(fd, "wb")
+
+    def write(self, chunk):
+        self.size += len(chunk)
+        if self.size > self.store.max_icon_bytes:
+            raise IconTooLarge(f"{self.url}: {self.size} bayttan büyük")
+        self.file.write(chunk)
+
+    def discard(self):
+        self.file.close()
+        if os.path.exists(self.part_path):
+            os.remove(self.part_path)
+
+    def finish(self):
+        """Biçimi belirleyip dosyayı kalıcı adına taşır; kullanılamıyorsa None"""
+        self.file.close()
+        with open(self.part_path, "rb") as f:
+            extension = sniff_image_type(f.read(512))
+        if extension is None:
+            self.discard()
+            logging.warning(f"Tanınmayan ikon biçimi: {self.url}")
+            return None
+
+        path = _unique_path(self.store.directory, extension)
+        os.replace(self.part_path, path)
+        if extension == ".svg":
+            path = _render_svg(path)
+        return path
+
+    def commit(self, source, path):
+        """finish() sonucunu depoya ekler; olay döngüsünde çağrılır"""
+        if path is None:
+            return None
+        # Eşzamanlı indirmeler sürerken oturum dolmuş olabilir
+        if self.store.full:
+            os.remove(path)
+            return None
+        return self.store._add(IconResult(self.url, source, path, os.path.getsize(path)))
+
+
+def _render_svg(svg_path):
+    """SVG'yi Qt'nin doğrudan okuyabileceği PNG'ye çevirir; kaynak dosya silinir"""
+    png_path = _unique_path(os.path.dirname(svg_path), ".png")
+    try:
+        from cairosvg import svg2png
+
+        svg2png(url=svg_path, write_to=png_path, output_width=SVG_RENDER_SIZE, output_height=SVG_RENDER_SIZE)
+        return png_path
+    except Exception as e:
+        logging.error(f"SVG dönüştürme hatası: {str(e)}")
+        os.remove(png_path)
+        return None
+    finally:
+        os.remove(svg_path)
+
+
+class IconResultStore:
+    """Bir arama oturumunun sonuçları: içerik diskte, bellekte yalnızca yollar.
+
+    Sonuç sayısı ve toplam boyut sınırına ulaşıldığında yeni ikonlar
+    indirilmeden reddedilir.
+    """
+
+    def __init__(self, directory, max_results=MAX_RESULTS, max_bytes=MAX_SESSION_BYTES,
+                 max_icon_bytes=MAX_ICON_BYTES):
+        self.directory = directory
+        self.max_results = max_results
+        self.max_bytes = max_bytes
+        self.max_icon_bytes = max_icon_bytes
+        self.results = []
+        self.total_bytes = 0
+        self.urls = set()
+        os.makedirs(directory, exist_ok=True)
+
+    def __len__(self):
+        return len(self.results)
+
+    @property
+    def full(self):
+        return len(self.results) >= self.max_results or self.total_bytes >= self.max_bytes
+
+    def open(self, url):
+        """Yeni bir ikon için yazıcı döndürür; oturum doluysa veya URL zaten varsa None"""
+        if self.full or url in self.urls:
+            return None
+        self.urls.add(url)
+        return _PendingIcon(self, url)
+
+    def _add(self, result):
+        self.results.append(result)
+        self.total_bytes += result.size
+        return result
+
+    def clear(self):
+        for result in self.results:
+            if os.path.exists(result.path):
+                os.remove(result.path)
+        self.results = []
+        self.total_bytes = 0
+        self.urls = set()
+
+
+class IconSearcher:
+    """Birden fazla kaynakta ikon arar; her ikon store'a yazılır ve
+    on_found(IconResult) çağrılır"""
+
+    def __init__(self, search_term, store, on_found):
+        self.search_term = search_term
+        self.store = store
+        self.on_found = on_found
+        self.session = None
+        self.download_slots = None
+
+    async def check_github_rate_limit(self, session):
+        try:
+            async with session.get('https://api.github.com/rate_limit') as response:
+                if response.status == 200:
+                    data = await response.json()
+                    return data['resources']['search']['remaining'] > 0
+                return False
+        except:
+            return False
+
+    async def fetch_icon(self, session, url, source, headers=None):
+        import asyncio
+
+        if self.download_slots is None:
+            self.download_slots = asyncio.Semaphore(PARALLEL_DOWNLOADS)
+        async with self.download_slots:
+            return await self._fetch_icon(session, url, source, headers)
+
+    async def _fetch_icon(self, session, url, source, headers):
+        import asyncio
+        import aiohttp
+
+        try:
+            pending = self.store.open(url)
+        except OSError as e:
+            logging.error(f"İkon önbelleğine yazılamadı: {str(e)}")
+            return False
+        if pending is None:
+            return False
+        try:
+            logging.info(f"{source}'dan ikon indiriliyor: {url}")
+            async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=10)) as response:
+                if response.status == 200:
+                    # Gövde belleğe alınmadan parça parça diske yazılır; disk işleri
+                    # (ve SVG dönüştürme) olay döngüsünü bekletmesin
+                    loop = asyncio.get_running_loop()
+                    async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK):
+                        await loop.run_in_executor(None, pending.write, chunk)
+                    result = pending.commit(source, await loop.run_in_executor(None, pending.finish))
+                    if result:
+                        logging.info(f"İkon başarıyla indirildi: {source} - {response.headers.get('content-type', '')}")
+                        self.on_found(result)
+                        return True
+                    return False
+                else:
+                    logging.warning(f"İkon indirme hatası - {source}: HTTP {response.status}")
+        except Exception as e:
+            logging.error(f"İkon indirme hatası ({source}): {str(e)}")
+        pending.discard()
+        return False
+
+    async def fetch_duckduckgo(self, session):
+        encoded_term = self.search_term.replace(' ', '+')
+        url = "https://duckduckgo.com/i.js"
+        headers = {
+            'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            'Accept': 'application/json, text/javascript, */*; q=0.01',
+            'Accept-Language': 'tr-TR,tr;q=0.9,en-US;q=0.8,en;q=0.7',
+            'Referer': 'https://duckduckgo.com/',
+            'Origin': 'https://duckduckgo.com',
+            'Sec-Fetch-Dest': 'empty',
+            'Sec-Fetch-Mode': 'cors',
+            'Sec-Fetch-Site': 'same-origin'
+        }
+        params = {
+            'q': f"{encoded_term} icon",
+            'o': 'json',
+            'vqd': '3-0',
+            't': 'D',
+            'l': 'us-en',
+            'f': ',,,,,',
+            'ia': 'images'
+        }
+        try:
+            logging.info(f"DuckDuckGo API'sine istek gönderiliyor: {url}")
+            async with session.get(url, headers=headers, params=params) as response:
+                logging.info(f"DuckDuckGo yanıt kodu: {response.status}")
+                if response.status == 200:
+                    try:
+                        data = await response.json()
+                        logging.info(f"DuckDuckGo yanıtı alındı")
+                        if 'results' in data:
+                            for result in data['results'][:20]:
+                                if 'image' in result:
+                                    await self.fetch_icon(session, result['image'], "DuckDuckGo")
+                        else:
+                            logging.warning("DuckDuckGo'dan ikon bulunamadı")
+                    except Exception as e:
+                        logging.error(f"DuckDuckGo JSON ayrıştırma hatası: {str(e)}")
+                else:
+                    logging.warning(f"DuckDuckGo API yanıt hatası: {response.status}")
+        except Exception as e:
+            logging.error(f"DuckDuckGo API hatası: {str(e)}")
+
+    async def fetch_icon_finder_free(self, session):
+        """IconFinder'ın ücretsiz API'si"""
+        search_term = self.search_term.replace(' ', '%20')
+        url = f"https://api.iconify.design/search?query={search_term}&limit=5"
+        try:
+            logging.info(f"Iconify API'sine istek gönderiliyor: {url}")
+            async with session.get(url) as response:
+                logging.info(f"Iconify yanıt kodu: {response.status}")
+                if response.status == 200:
+                    try:
+                        data = await response.json()
+                        if isinstance(data, list) and len(data) > 0:
+                            for icon in data[:5]:
+                                if isinstance(icon, dict) and 'prefix' in icon and 'name' in icon:
+                                    icon_url = f"https://api.iconify.design/{icon['prefix']}/{icon['name']}.svg"
+                                    await self.fetch_icon(session, icon_url, "Iconify")
+                    except Exception as e:
+                        logging.error(f"Iconify JSON ayrıştırma hatası: {str(e)}")
+                else:
+                    logging.warning(f"Iconify API yanıt hatası: {response.status}")
+        except Exception as e:
+            logging.error(f"Iconify API hatası: {str(e)}")
+
+    async def fetch_flaticon(self, session):
+        """Flaticon'un web sitesinden doğrudan arama"""
+        search_term = self.search_term.replace(' ', '+')
+        url = f"https://www.flaticon.com/free-icons/{search_term}"
+        headers = {
+            'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
+            'Accept-Language': 'tr-TR,tr;q=0.9,en-US;q=0.8,en;q=0.7',
+            'Referer': 'https://www.flaticon.com/',
+            'DNT': '1',
+            'Connection': 'keep-alive',
+            'Upgrade-Insecure-Requests': '1',
+            'Sec-Fetch-Dest': 'document',
+            'Sec-Fetch-Mode': 'navigate',
+            'Sec-Fetch-Site': 'same-origin',
+            'Sec-Fetch-User': '?1'
+        }
+        try:
+            logging.info(f"Flaticon'a istek gönderiliyor: {url}")
+            async with session.get(url, headers=headers) as response:
+                logging.info(f"Flaticon yanıt kodu: {response.status}")
+                if response.status == 200:
+                    html = await response.text()
+                    # İkon URL'lerini bul
+                    import re
+                    icon_urls = re.findall(r'https://cdn-icons-png.flaticon.com/[^"\']+\.png', html)
+                    logging.info(f"Flaticon'dan bulunan ikon sayısı: {len(icon_urls)}")
+                    # İlk 20 ikonu al
+                    for icon_url in icon_urls[:20]:
+                        await self.fetch_icon(session, icon_url, "Flaticon")
+                else:
+                    logging.warning(f"Flaticon yanıt hatası: {response.status}")
+        except Exception as e:
+            logging.error(f"Flaticon hatası: {str(e)}")
+
+    async def fetch_simpleicons(self, session):
+        search_term = self.search_term.lower().replace(" ", "")
+        url = f"https://raw.githubusercontent.com/simple-icons/simple-icons/develop/icons/{search_term}.svg"
+        try:
+            logging.info(f"SimpleIcons'a istek gönderiliyor: {url}")
+            async with session.get(url) as response:
+                logging.info(f"SimpleIcons yanıt kodu: {response.status}")
+                if response.status == 200:
+                    await self.fetch_icon(session, url, "SimpleIcons")
+                else:
+                    logging.warning("SimpleIcons'dan ikon bulunamadı")
+        except Exception as e:
+            logging.error(f"SimpleIcons hatası: {str(e)}")
+
+    async def fetch_openmoji(self, session):
+        url = f"https://openmoji.org/data/color/svg/{self.search_term.lower()}.svg"
+        try:
+            async with session.get(url) as response:
+                if response.status == 200:
+                    await self.fetch_icon(session, url, "OpenMoji")
+        except Exception as e:
+            logging.error(f"OpenMoji API hatası: {str(e)}")
+
+    async def fetch_wikimedia(self, session):
+        url = "https://commons.wikimedia.org/w/api.php"
+        params = {
+            "action": "query",
+            "format": "json",
+            "list": "search",
+            "srsearch": f"{self.search_term} icon filetype:png|svg",
+            "srnamespace": "6",
+            "srlimit": "20"
+        }
+        try:
+            logging.info(f"Wikimedia API'sine istek gönderiliyor: {url}")
+            async with session.get(url, params=params) as response:
+                logging.info(f"Wikimedia yanıt kodu: {response.status}")
+                if response.status == 200:
+                    data = await response.json()
+                    results = data.get('query', {}).get('search', [])
+                    logging.info(f"Wikimedia sonuç sayısı: {len(results)}")
+                    for item in results:
+                        title = item['title'].replace(' ', '_')
+                        image_url = f"https://commons.wikimedia.org/wiki/Special:FilePath/{title}"
+                        await self.fetch_icon(session, image_url, "Wikimedia")
+                else:
+                    logging.warning(f"Wikimedia API yanıt hatası: {response.status}")
+        except Exception as e:
+            logging.error(f"Wikimedia API hatası: {str(e)}")
+
+    async def search_icons(self):
+        # Ağ yığını yalnızca ilk aramada yüklenir
+        import asyncio
+        import aiohttp
+
+        async with aiohttp.ClientSession() as session:
+            self.session = session
+            tasks = []
+
+            # Flaticon'dan ara (öncelikli)
+            tasks.append(self.fetch_flaticon(session))
+
+            # DuckDuckGo API
+            tasks.append(self.fetch_duckduckgo(session))
+
+            # GitHub API (rate limit kontrolü ile)
+            if await self.check_github_rate_limit(session):
+                tasks.append(self.fetch_github(session))
+
+            # SimpleIcons API
+            tasks.append(self.fetch_simpleicons(session))
+
+            # Wikimedia Commons API
+            tasks.append(self.fetch_wikimedia(session))
+
+            await asyncio.gather(*tasks)
+
+    async def fetch_github(self, session):
+        url = f"https://api.github.com/search/repositories?q={self.search_term}&per_page=20"
+        headers = {
+            'Accept': 'application/vnd.github.v3+json',
+            'User-Agent': 'Mozilla/5.0'
+        }
+        try:
+            logging.info(f"GitHub API'sine istek gönderiliyor: {url}")
+            async with session.get(url, headers=headers) as response:
+                logging.info(f"GitHub yanıt kodu: {response.status}")
+                if response.status == 200:
+                    data = await response.json()
+                    logging.info(f"GitHub sonuç sayısı: {len(data.get('items', []))}")
+                    for repo in data.get('items', []):
+                        if 'owner' in repo and 'avatar_url' in repo['owner']:
+                            await self.fetch_icon(session, repo['owner']['avatar_url'], "GitHub")
+                else:
+                    logging.warning(f"GitHub API yanıt hatası: {response.status}")
+        except Exception as e:
+            logging.error(f"GitHub API hatası: {str(e)}")
+
+    def run(self):
+        import asyncio
+
+        asyncio.run(self.search_icons())
@@ -1,21 +1,20 @@
 #!/usr/bin/env python3
 import os
 import sys
-import json
 import shutil
-import magic
 import logging
-import subprocess
-import requests
-import asyncio
-import aiohttp
-from datetime import datetime
+from collections import OrderedDict
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QPushButton, QLabel,
                            QVBoxLayout, QWidget, QFileDialog, QMessageBox,
                            QListWidget, QHBoxLayout, QDialog, QLineEdit,
-                           QProgressBar)
-from PyQt5.QtCore import Qt, QSize, QThread, pyqtSignal
-from PyQt5.QtGui import QIcon, QPixmap
+                           QProgressBar, QInputDialog, QAbstractItemView,
+                           QListWidgetItem, QComboBox, QStyledItemDelegate,
+                           QStyleOptionViewItem)
+from PyQt5.QtCore import Qt, QSize, QThread, QTimer, pyqtSignal
+from PyQt5.QtGui import QIcon, QPixmap, QPixmapCache, QImageReader
+
+import appimage_core as core
+import appimage_search
 
 # Log ayarları
 logging.basicConfig(
@@ -24,246 +23,220 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 
+# Küçük resimler 48x48 (~9 KB); önbellekte en fazla bu kadarı tutulur
+THUMBNAIL_SIZE = 48
+THUMBNAIL_CACHE_ENTRIES = 96
+
 class IconSearchWorker(QThread):
-    icon_found = pyqtSignal(str, str, bytes)
+    icon_found = pyqtSignal(str, str, str)  # url, kaynak, diskteki dosya
     search_completed = pyqtSignal()
     error_occurred = pyqtSignal(str)
 
-    def __init__(self, search_term):
+    def __init__(self, search_term, store, service=None):
         super().__init__()
         self.search_term = search_term
-        self.session = None
+        self.store = store
+        self.service = service
 
-    async def check_github_rate_limit(self, session):
-        try:
-            async with session.get('https://api.github.com/rate_limit') as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return data['resources']['search']['remaining'] > 0
-                return False
-        except:
-            return False
-
-    async def fetch_icon(self, session, url, source, headers=None):
-        try:
-            logging.info(f"{source}'dan ikon indiriliyor: {url}")
-            async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=10)) as response:
-                if response.status == 200:
-                    content = await response.read()
-                    content_type = response.headers.get('content-type', '')
-                    logging.info(f"İkon başarıyla indirildi: {source} - {content_type}")
-                    self.icon_found.emit(url, source, content)
-                    return True
-                else:
-                    logging.warning(f"İkon indirme hatası - {source}: HTTP {response.status}")
-        except Exception as e:
-            logging.error(f"İkon indirme hatası ({source}): {str(e)}")
-        return False
-
-    async def fetch_duckduckgo(self, session):
-        encoded_term = self.search_term.replace(' ', '+')
-        url = "https://duckduckgo.com/i.js"
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'application/json, text/javascript, */*; q=0.01',
-            'Accept-Language': 'tr-TR,tr;q=0.9,en-US;q=0.8,en;q=0.7',
-            'Referer': 'https://duckduckgo.com/',
-            'Origin': 'https://duckduckgo.com',
-            'Sec-Fetch-Dest': 'empty',
-            'Sec-Fetch-Mode': 'cors',
-            'Sec-Fetch-Site': 'same-origin'
-        }
-        params = {
-            'q': f"{encoded_term} icon",
-            'o': 'json',
-            'vqd': '3-0',
-            't': 'D',
-            'l': 'us-en',
-            'f': ',,,,,',
-            'ia': 'images'
-        }
-        try:
-            logging.info(f"DuckDuckGo API'sine istek gönderiliyor: {url}")
-            async with session.get(url, headers=headers, params=params) as response:
-                logging.info(f"DuckDuckGo yanıt kodu: {response.status}")
-                if response.status == 200:
-                    try:
-                        data = await response.json()
-                        logging.info(f"DuckDuckGo yanıtı alındı")
-                        if 'results' in data:
-                            for result in data['results'][:20]:
-                                if 'image' in result:
-                                    await self.fetch_icon(session, result['image'], "DuckDuckGo")
-                        else:
-                            logging.warning("DuckDuckGo'dan ikon bulunamadı")
-                    except Exception as e:
-                        logging.error(f"DuckDuckGo JSON ayrıştırma hatası: {str(e)}")
-                else:
-                    logging.warning(f"DuckDuckGo API yanıt hatası: {response.status}")
-        except Exception as e:
-            logging.error(f"DuckDuckGo API hatası: {str(e)}")
+    def run(self):
+        from appimage_icons import IconSearcher
 
-    async def fetch_icon_finder_free(self, session):
-        """IconFinder'ın ücretsiz API'si"""
-        search_term = self.search_term.replace(' ', '%20')
-        url = f"https://api.iconify.design/search?query={search_term}&limit=5"
-        try:
-            logging.info(f"Iconify API'sine istek gönderiliyor: {url}")
-            async with session.get(url) as response:
-                logging.info(f"Iconify yanıt kodu: {response.status}")
-                if response.status == 200:
-                    try:
-                        data = await response.json()
-                        if isinstance(data, list) and len(data) > 0:
-                            for icon in data[:5]:
-                                if isinstance(icon, dict) and 'prefix' in icon and 'name' in icon:
-                                    icon_url = f"https://api.iconify.design/{icon['prefix']}/{icon['name']}.svg"
-                                    await self.fetch_icon(session, icon_url, "Iconify")
-                    except Exception as e:
-                        logging.error(f"Iconify JSON ayrıştırma hatası: {str(e)}")
-                else:
-                    logging.warning(f"Iconify API yanıt hatası: {response.status}")
-        except Exception as e:
-            logging.error(f"Iconify API hatası: {str(e)}")
-
-    async def fetch_flaticon(self, session):
-        """Flaticon'un web sitesinden doğrudan arama"""
-        search_term = self.search_term.replace(' ', '+')
-        url = f"https://www.flaticon.com/free-icons/{search_term}"
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
-            'Accept-Language': 'tr-TR,tr;q=0.9,en-US;q=0.8,en;q=0.7',
-            'Referer': 'https://www.flaticon.com/',
-            'DNT': '1',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Sec-Fetch-Dest': 'document',
-            'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'same-origin',
-            'Sec-Fetch-User': '?1'
-        }
         try:
-            logging.info(f"Flaticon'a istek gönderiliyor: {url}")
-            async with session.get(url, headers=headers) as response:
-                logging.info(f"Flaticon yanıt kodu: {response.status}")
-                if response.status == 200:
-                    html = await response.text()
-                    # İkon URL'lerini bul
-                    import re
-                    icon_urls = re.findall(r'https://cdn-icons-png.flaticon.com/[^"\']+\.png', html)
-                    logging.info(f"Flaticon'dan bulunan ikon sayısı: {len(icon_urls)}")
-                    # İlk 20 ikonu al
-                    for icon_url in icon_urls[:20]:
-                        await self.fetch_icon(session, icon_url, "Flaticon")
-                else:
-                    logging.warning(f"Flaticon yanıt hatası: {response.status}")
+            if self.service:
+                # Servis sonuçları kendi disk önbelleğine yazar; yalnızca yollar gelir
+                self.service.icon_search(self.search_term, self.icon_found.emit)
+            else:
+                IconSearcher(self.search_term, self.store,
+                             lambda result: self.icon_found.emit(result.url, result.source, result.path)).run()
         except Exception as e:
-            logging.error(f"Flaticon hatası: {str(e)}")
+            self.error_occurred.emit(str(e))
+        finally:
+            self.search_completed.emit()
 
-    async def fetch_simpleicons(self, session):
-        search_term = self.search_term.lower().replace(" ", "")
-        url = f"https://raw.githubusercontent.com/simple-icons/simple-icons/develop/icons/{search_term}.svg"
-        try:
-            logging.info(f"SimpleIcons'a istek gönderiliyor: {url}")
-            async with session.get(url) as response:
-                logging.info(f"SimpleIcons yanıt kodu: {response.status}")
-                if response.status == 200:
-                    await self.fetch_icon(session, url, "SimpleIcons")
-                else:
-                    logging.warning("SimpleIcons'dan ikon bulunamadı")
-        except Exception as e:
-            logging.error(f"SimpleIcons hatası: {str(e)}")
+class BulkOperationWorker(QThread):
+    progress = pyqtSignal(int, int, str)
+    finished_ok = pyqtSignal(dict)
+    failed = pyqtSignal(str)
 
-    async def fetch_openmoji(self, session):
-        url = f"https://openmoji.org/data/color/svg/{self.search_term.lower()}.svg"
-        try:
-            async with session.get(url) as response:
-                if response.status == 200:
-                    await self.fetch_icon(session, url, "OpenMoji")
-        except Exception as e:
-            logging.error(f"OpenMoji API hatası: {str(e)}")
-
-    async def fetch_wikimedia(self, session):
-        url = "https://commons.wikimedia.org/w/api.php"
-        params = {
-            "action": "query",
-            "format": "json",
-            "list": "search",
-            "srsearch": f"{self.search_term} icon filetype:png|svg",
-            "srnamespace": "6",
-            "srlimit": "20"
-        }
+    def __init__(self, operation, installed_apps, targets):
+        super().__init__()
+        self.operation = operation
+        self.installed_apps = installed_apps
+        self.targets = targets
+
+    def run(self):
         try:
-            logging.info(f"Wikimedia API'sine istek gönderiliyor: {url}")
-            async with session.get(url, params=params) as response:
-                logging.info(f"Wikimedia yanıt kodu: {response.status}")
-                if response.status == 200:
-                    data = await response.json()
-                    results = data.get('query', {}).get('search', [])
-                    logging.info(f"Wikimedia sonuç sayısı: {len(results)}")
-                    for item in results:
-                        title = item['title'].replace(' ', '_')
-                        image_url = f"https://commons.wikimedia.org/wiki/Special:FilePath/{title}"
-                        await self.fetch_icon(session, image_url, "Wikimedia")
-                else:
-                    logging.warning(f"Wikimedia API yanıt hatası: {response.status}")
+            installed_apps = self.operation(self.installed_apps, self.targets, self.progress.emit)
+            self.finished_ok.emit(installed_apps)
         except Exception as e:
-            logging.error(f"Wikimedia API hatası: {str(e)}")
+            self.failed.emit(str(e))
+        finally:
+            # Hazırlanan geçici ikonları temizle
+            if isinstance(self.targets, dict):
+                for new_info in self.targets.values():
+                    staged_path = new_info.get('new_icon_path', '')
+                    if staged_path.startswith(EditAppDialog.STAGED_ICON_DIR) and os.path.exists(staged_path):
+                        os.remove(staged_path)
+
+class DownloadWorker(QThread):
+    progress = pyqtSignal(int, int)
+    download_completed = pyqtSignal(str)
+    download_cancelled = pyqtSignal()
+    error_occurred = pyqtSignal(str)
 
-    async def search_icons(self):
-        async with aiohttp.ClientSession() as session:
-            self.session = session
-            tasks = []
+    def __init__(self, url, checksum=None, service=None):
+        import appimage_download
+        import appimage_service
 
-            # Flaticon'dan ara (öncelikli)
-            tasks.append(self.fetch_flaticon(session))
+        super().__init__()
+        self.cancelled = False
+        # Servis çalışıyorsa bağlantısı kapanan indirme iptal edilir; ayrı bir istemci
+        # kullanılır ki iptal diğer servis çağrılarını kesmesin
+        self.client = appimage_service.ServiceClient(service.socket_path) if service else None
+        self.download = None if service else appimage_download.Download(url, checksum,
+                                                                         progress=self.progress.emit)
+        self.url = url
+        self.checksum = checksum
 
-            # DuckDuckGo API
-            tasks.append(self.fetch_duckduckgo(session))
+    def run(self):
+        try:
+            if self.client:
+                self.download_completed.emit(self.client.download(self.url, self.checksum, self.progress.emit))
+            else:
+                self.download_completed.emit(self.download.run())
+        except Exception as e:
+            if self.cancelled:
+                logging.info(f"İndirme iptal edildi: {self.url}")
+                self.download_cancelled.emit()
+                return
+            logging.error(f"İndirme hatası: {str(e)}")
+            self.error_occurred.emit(str(e))
 
-            # GitHub API (rate limit kontrolü ile)
-            if await self.check_github_rate_limit(session):
-                tasks.append(self.fetch_github(session))
+    def cancel(self):
+        self.cancelled = True
+        if self.client:
+            self.client.abort()
+        else:
+            self.download.cancel()
 
-            # SimpleIcons API
-            tasks.append(self.fetch_simpleicons(session))
+class GarbageScanWorker(QThread):
+    report_ready = pyqtSignal(object)
+    reclaimed = pyqtSignal(int, int)
 
-            # Wikimedia Commons API
-            tasks.append(self.fetch_wikimedia(session))
+    def __init__(self, reclaim_report=None, service=None):
+        super().__init__()
+        self.reclaim_report = reclaim_report
+        self.service = service
 
-            await asyncio.gather(*tasks)
+    def run(self):
+        import appimage_gc
 
-    async def fetch_github(self, session):
-        url = f"https://api.github.com/search/repositories?q={self.search_term}&per_page=20"
-        headers = {
-            'Accept': 'application/vnd.github.v3+json',
-            'User-Agent': 'Mozilla/5.0'
-        }
         try:
-            logging.info(f"GitHub API'sine istek gönderiliyor: {url}")
-            async with session.get(url, headers=headers) as response:
-                logging.info(f"GitHub yanıt kodu: {response.status}")
-                if response.status == 200:
-                    data = await response.json()
-                    logging.info(f"GitHub sonuç sayısı: {len(data.get('items', []))}")
-                    for repo in data.get('items', []):
-                        if 'owner' in repo and 'avatar_url' in repo['owner']:
-                            await self.fetch_icon(session, repo['owner']['avatar_url'], "GitHub")
+            if self.service:
+                if self.reclaim_report is not None:
+                    # Servis yalnızca kullanıcının onayladığı yolları siler
+                    paths = [c.path for c in self.reclaim_report.candidates if c.reclaimable]
+                    result = self.service.call("gc_reclaim", {"paths": paths})
+                    self.reclaimed.emit(result['freed'], len(result['removed']))
                 else:
-                    logging.warning(f"GitHub API yanıt hatası: {response.status}")
+                    self.report_ready.emit(appimage_gc.GarbageReport.from_dict(self.service.call("gc_analyze")))
+            elif self.reclaim_report is not None:
+                freed, removed = appimage_gc.reclaim(self.reclaim_report)
+                self.reclaimed.emit(freed, len(removed))
+            else:
+                # Kayıt diskten okunur; pencerenin bellekteki kopyası geri kalmış olabilir
+                self.report_ready.emit(appimage_gc.analyze())
         except Exception as e:
-            logging.error(f"GitHub API hatası: {str(e)}")
+            logging.error(f"Çöp toplama hatası: {str(e)}")
+
+class ServiceEventWorker(QThread):
+    registry_changed = pyqtSignal()
+
+    def __init__(self, service):
+        super().__init__()
+        self.service = service
 
     def run(self):
+        def on_event(event, *args):
+            if event == "registry_changed":
+                self.registry_changed.emit()
+
         try:
-            asyncio.run(self.search_icons())
+            self.service.subscribe(on_event)
         except Exception as e:
-            self.error_occurred.emit(str(e))
+            logging.error(f"Servis olay bağlantısı koptu: {str(e)}")
+
+class ThumbnailCache:
+    """Küçük resimler için QPixmapCache üzerinde sınırlı bir LRU.
+
+    Tam çözünürlüklü veri diskte kalır; küçük resim ilk çizimde ölçeklenerek
+    okunur ve sınır aşılınca en eski girdi önbellekten çıkarılır.
+    """
+
+    def __init__(self, max_entries=THUMBNAIL_CACHE_ENTRIES, size=THUMBNAIL_SIZE):
+        self.max_entries = max_entries
+        self.size = size
+        self.keys = OrderedDict()
+
+    def get(self, path):
+        key = f"appimage-thumbnail:{self.size}:{path}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is not None and not pixmap.isNull():
+            self.keys[key] = None
+            self.keys.move_to_end(key)
+            return pixmap
+
+        reader = QImageReader(path)
+        image_size = reader.size()
+        if image_size.isValid() and (image_size.width() > self.size or image_size.height() > self.size):
+            # Büyük resimler belleğe tam boyutta açılmadan ölçeklenir
+            reader.setScaledSize(image_size.scaled(self.size, self.size, Qt.KeepAspectRatio))
+        pixmap = QPixmap.fromImage(reader.read())
+        if pixmap.isNull():
+            return pixmap
+
+        QPixmapCache.insert(key, pixmap)
+        self.keys[key] = None
+        self.keys.move_to_end(key)
+        while len(self.keys) > self.max_entries:
+            old_key, _ = self.keys.popitem(last=False)
+            QPixmapCache.remove(old_key)
+        return pixmap
+
+    def clear(self):
+        for key in self.keys:
+            QPixmapCache.remove(key)
+        self.keys.clear()
+
+class ThumbnailDelegate(QStyledItemDelegate):
+    """Liste öğeleri yalnızca dosya yolunu tutar; küçük resim çizim anında önbellekten alınır"""
+
+    def __init__(self, thumbnails, parent=None):
+        super().__init__(parent)
+        self.thumbnails = thumbnails
+        self.painting = False
+
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        option.features |= QStyleOptionViewItem.HasDecoration
+        option.decorationSize = QSize(THUMBNAIL_SIZE, THUMBNAIL_SIZE)
+        # Boyut hesabı için resmi açmaya gerek yok; yalnızca görünen öğeler yüklenir
+        if self.painting:
+            path = index.data(Qt.UserRole)
+            if path:
+                option.icon = QIcon(self.thumbnails.get(path))
+
+    def paint(self, painter, option, index):
+        self.painting = True
+        try:
+            super().paint(painter, option, index)
         finally:
-            self.search_completed.emit()
+            self.painting = False
 
 class EditAppDialog(QDialog):
+    STAGED_ICON_DIR = os.path.expanduser("~/.cache/appimage_installer/staged")
+
+
     def __init__(self, app_name, app_info, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Uygulama Düzenle")
@@ -316,8 +289,11 @@ class EditAppDialog(QDialog):
         found_icons_layout = QVBoxLayout()
         found_icons_label = QLabel("Bulunan İkonlar:")
         self.found_icons_list = QListWidget()
-        self.found_icons_list.setIconSize(QSize(48, 48))
+        self.found_icons_list.setIconSize(QSize(THUMBNAIL_SIZE, THUMBNAIL_SIZE))
         self.found_icons_list.setViewMode(QListWidget.IconMode)
+        self.found_icons_list.setUniformItemSizes(True)
+        self.thumbnails = ThumbnailCache()
+        self.found_icons_list.setItemDelegate(ThumbnailDelegate(self.thumbnails, self.found_icons_list))
         self.found_icons_list.setSpacing(10)
         self.found_icons_list.itemClicked.connect(self.select_found_icon)
         found_icons_layout.addWidget(found_icons_label)
@@ -349,69 +325,47 @@ class EditAppDialog(QDialog):
         self.setLayout(layout)
         self.new_icon_path = None
         self.temp_icon_dir = os.path.expanduser("~/.cache/appimage_installer/icons")
-        os.makedirs(self.temp_icon_dir, exist_ok=True)
+        self.worker = None
+        
+        from appimage_icons import IconResultStore
+        self.icon_store = IconResultStore(self.temp_icon_dir)
     
     def search_icon(self):
         search_term = self.icon_search_edit.text().strip()
         if not search_term:
             QMessageBox.warning(self, "Uyarı", "Lütfen bir arama terimi girin!")
             return
+        if self.worker and self.worker.isRunning():
+            return
         
+        # Önceki aramanın sonuçları diskten ve önbellekten atılır
         self.found_icons_list.clear()
+        self.thumbnails.clear()
+        self.icon_store.clear()
         self.progress_bar.setVisible(True)
         self.progress_bar.setRange(0, 0)  # Belirsiz ilerleme
         
-        self.worker = IconSearchWorker(search_term)
+        self.worker = IconSearchWorker(search_term, self.icon_store, getattr(self.parent(), 'service', None))
         self.worker.icon_found.connect(self.add_icon_to_list)
         self.worker.search_completed.connect(self.search_completed)
         self.worker.error_occurred.connect(self.search_error)
         self.worker.start()
     
-    def add_icon_to_list(self, url, source, content):
-        try:
-            logging.info(f"İkon listeye ekleniyor: {source} - {url}")
-            # Geçici dosya oluştur
-            file_ext = '.png' if 'png' in url.lower() else '.svg'
-            temp_icon_path = os.path.join(self.temp_icon_dir, f"temp_icon_{len(self.found_icons_list.findItems('', Qt.MatchContains))}{file_ext}")
-            
-            with open(temp_icon_path, 'wb') as f:
-                f.write(content)
-            
-            # SVG dosyasını PNG'ye çevir
-            if file_ext == '.svg':
-                try:
-                    from cairosvg import svg2png
-                    png_path = temp_icon_path.replace('.svg', '.png')
-                    svg2png(url=temp_icon_path, write_to=png_path, output_width=128, output_height=128)
-                    temp_icon_path = png_path
-                    logging.info(f"SVG başarıyla PNG'ye dönüştürüldü: {png_path}")
-                except Exception as e:
-                    logging.error(f"SVG dönüştürme hatası: {str(e)}")
-                    if os.path.exists(temp_icon_path):
-                        os.remove(temp_icon_path)
-                    return
-            
-            # Listeye ekle
-            pixmap = QPixmap(temp_icon_path)
-            if not pixmap.isNull():
-                try:
-                    from PyQt5.QtWidgets import QListWidgetItem
-                    item = QListWidgetItem()
-                    item.setIcon(QIcon(pixmap))
-                    item.setData(Qt.UserRole, temp_icon_path)
-                    item.setText(f"{source}")
-                    self.found_icons_list.addItem(item)
-                    logging.info(f"İkon başarıyla listeye eklendi: {source}")
-                except Exception as e:
-                    logging.error(f"Liste öğesi oluşturma hatası: {str(e)}")
-            else:
-                logging.error(f"Geçersiz ikon dosyası: {temp_icon_path}")
-                if os.path.exists(temp_icon_path):
-                    os.remove(temp_icon_path)
-        except Exception as e:
-            logging.error(f"İkon ekleme hatası: {str(e)}")
-            if 'temp_icon_path' in locals() and os.path.exists(temp_icon_path):
-                os.remove(temp_icon_path)
+    def add_icon_to_list(self, url, source, path):
+        from appimage_icons import MAX_RESULTS
+
+        # Servis kullanılırken sonuç sınırı burada uygulanır
+        if self.found_icons_list.count() >= MAX_RESULTS:
+            return
+        # Yalnızca başlık okunur; resim çizilene kadar belleğe açılmaz
+        if not QImageReader(path).canRead():
+            logging.error(f"Geçersiz ikon dosyası: {path}")
+            return
+        item = QListWidgetItem(source)
+        item.setData(Qt.UserRole, path)
+        item.setToolTip(url)
+        self.found_icons_list.addItem(item)
+        logging.info(f"İkon listeye eklendi: {source} - {url}")
     
     def search_completed(self):
         self.progress_bar.setVisible(False)
@@ -450,6 +404,7 @@ class EditAppDialog(QDialog):
                 QMessageBox.critical(self, "Hata", f"İkon yüklenirken bir hata oluştu:\n{str(e)}")
     
     def cleanup_temp_icons(self):
+        self.thumbnails.clear()
         try:
             if os.path.exists(self.temp_icon_dir):
                 shutil.rmtree(self.temp_icon_dir)
@@ -457,6 +412,13 @@ class EditAppDialog(QDialog):
             logging.error(f"Geçici ikonları temizleme hatası: {str(e)}")
     
     def accept(self):
+        # Seçilen ikonu geçici dizin silinmeden önce 128 piksele ölçekleyip ayır
+        if self.new_icon_path:
+            os.makedirs(self.STAGED_ICON_DIR, exist_ok=True)
+            staged_path = os.path.join(self.STAGED_ICON_DIR, f"{os.getpid()}_{id(self)}.png")
+            pixmap = QPixmap(self.new_icon_path)
+            pixmap.scaled(128, 128, Qt.KeepAspectRatio, Qt.SmoothTransformation).save(staged_path, "PNG")
+            self.new_icon_path = staged_path
         self.cleanup_temp_icons()
         super().accept()
     
@@ -473,6 +435,45 @@ class EditAppDialog(QDialog):
             info['new_icon_path'] = self.new_icon_path
         return info
 
+class VersionsDialog(QDialog):
+    def __init__(self, app_name, app_info, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle(f"{app_name} Sürümleri")
+        self.setGeometry(200, 200, 450, 300)
+        self.app_name = app_name
+        self.app_info = app_info
+        self.selected_version = None
+        
+        layout = QVBoxLayout()
+        self.version_list = QListWidget()
+        for version in reversed(app_info.get('versions', [])):
+            size_mb = version.get('size', 0) / (1024 * 1024)
+            label = f"{version['id']}  ({version.get('file_name', '')}, {size_mb:.1f} MB)"
+            if version['id'] == app_info.get('active_version'):
+                label += "  [etkin]"
+            item = QListWidgetItem(label)
+            item.setData(Qt.UserRole, version['id'])
+            self.version_list.addItem(item)
+        self.version_list.itemDoubleClicked.connect(lambda item: self.activate_selected())
+        layout.addWidget(self.version_list)
+        
+        button_layout = QHBoxLayout()
+        activate_button = QPushButton("Seçili Sürümü Etkinleştir")
+        activate_button.clicked.connect(self.activate_selected)
+        close_button = QPushButton("Kapat")
+        close_button.clicked.connect(self.reject)
+        button_layout.addWidget(activate_button)
+        button_layout.addWidget(close_button)
+        layout.addLayout(button_layout)
+        
+        self.setLayout(layout)
+    
+    def activate_selected(self):
+        items = self.version_list.selectedItems()
+        if items:
+            self.selected_version = items[0].data(Qt.UserRole)
+            self.accept()
+
 class AppImageInstaller(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -480,10 +481,24 @@ class AppImageInstaller(QMainWindow):
         self.setGeometry(100, 100, 600, 400)
         self.setWindowIcon(QIcon('app_icon.png'))
         
+        # Servis çalışıyorsa kayıt ve uzun işler ona bırakılır
+        import appimage_service
+        self.service = appimage_service.connect_if_running()
+        self.backend = self.service or core
+        if not self.service:
+            core.recover_transactions()
+        
         # Yüklü uygulamalar listesi
         self.installed_apps = {}
         self.load_installed_apps()
         
+        # Aynı anda tek bir çöp toplama iş parçacığı çalışır, sonraki iş kuyruğa alınır
+        self.gc_worker = None
+        self.gc_rescan_pending = False
+        self.bulk_worker = None
+        self.download_worker = None
+        self.garbage_report = None
+        
         # Ana widget ve layout
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -502,6 +517,11 @@ class AppImageInstaller(QMainWindow):
         self.select_button.clicked.connect(self.select_file)
         button_layout.addWidget(self.select_button)
         
+        # URL'den yükleme butonu
+        self.url_button = QPushButton("URL'den Yükle")
+        self.url_button.clicked.connect(self.select_url)
+        button_layout.addWidget(self.url_button)
+        
         # Düzenle butonu
         self.edit_button = QPushButton("Seçili Uygulamayı Düzenle")
         self.edit_button.clicked.connect(self.edit_selected_app)
@@ -514,119 +534,124 @@ class AppImageInstaller(QMainWindow):
         self.remove_button.setEnabled(False)
         button_layout.addWidget(self.remove_button)
         
+        # Sürümler butonu
+        self.versions_button = QPushButton("Sürümler")
+        self.versions_button.clicked.connect(self.show_versions)
+        self.versions_button.setEnabled(False)
+        button_layout.addWidget(self.versions_button)
+        
+        # Disk temizliği butonu
+        self.cleanup_button = QPushButton("Disk Temizliği")
+        self.cleanup_button.clicked.connect(self.show_garbage_report)
+        button_layout.addWidget(self.cleanup_button)
+        
         layout.addLayout(button_layout)
         
+        # Arama kutusu ve sıralama
+        search_layout = QHBoxLayout()
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText("Ara (ad, açıklama, kategori)...")
+        self.search_edit.setClearButtonEnabled(True)
+        self.search_edit.textChanged.connect(self.refresh_app_list)
+        search_layout.addWidget(self.search_edit)
+        
+        self.sort_combo = QComboBox()
+        for sort_key, label in appimage_search.SORT_LABELS.items():
+            self.sort_combo.addItem(label, sort_key)
+        self.sort_combo.currentIndexChanged.connect(self.refresh_app_list)
+        search_layout.addWidget(self.sort_combo)
+        layout.addLayout(search_layout)
+        
         # Yüklü uygulamalar listesi
+        self.search_index = appimage_search.SearchIndex()
         self.app_list = QListWidget()
+        self.app_list.setSelectionMode(QAbstractItemView.ExtendedSelection)
         self.app_list.itemSelectionChanged.connect(self.on_selection_changed)
         layout.addWidget(self.app_list)
         self.update_app_list()
         
+        # Toplu işlem ilerleme çubuğu
+        progress_layout = QHBoxLayout()
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setVisible(False)
+        progress_layout.addWidget(self.progress_bar)
+        
+        # İndirme iptal butonu
+        self.cancel_download_button = QPushButton("İndirmeyi İptal Et")
+        self.cancel_download_button.clicked.connect(self.cancel_download)
+        self.cancel_download_button.setVisible(False)
+        progress_layout.addWidget(self.cancel_download_button)
+        layout.addLayout(progress_layout)
+        
         # Durum etiketi
         self.status_label = QLabel("")
         self.status_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(self.status_label)
+        
+        # Liste çizildikten sonra arka planda disk kullanımını analiz et
+        QTimer.singleShot(0, self.start_garbage_scan)
+        
+        # Başka istemcilerin yaptığı değişiklikleri izle
+        if self.service:
+            self.service_worker = ServiceEventWorker(self.service)
+            self.service_worker.registry_changed.connect(self.on_registry_changed)
+            self.service_worker.start()
 
-    def get_icon_path(self, app_name):
-        try:
-            # İkon dizinini oluştur
-            icon_dir = os.path.expanduser("~/.local/share/icons/hicolor/128x128/apps")
-            os.makedirs(icon_dir, exist_ok=True)
-            icon_path = os.path.join(icon_dir, f"{app_name}.png")
-
-            # Önce yerel AppImage'dan ikon çıkarmayı dene
-            app_path = self.installed_apps.get(app_name, {}).get('path')
-            if app_path and os.path.exists(app_path):
-                try:
-                    # AppImage'dan ikon çıkarma
-                    subprocess.run([app_path, "--appimage-extract", "*.png"], 
-                                stdout=subprocess.DEVNULL, 
-                                stderr=subprocess.DEVNULL,
-                                timeout=10)
-                    squashfs_root = "squashfs-root"
-                    if os.path.exists(squashfs_root):
-                        for root, _, files in os.walk(squashfs_root):
-                            for file in files:
-                                if file.endswith('.png'):
-                                    png_path = os.path.join(root, file)
-                                    shutil.copy2(png_path, icon_path)
-                                    shutil.rmtree(squashfs_root)
-                                    return icon_path
-                        shutil.rmtree(squashfs_root)
-                except:
-                    pass
-
-            # İkon indirmeyi dene (birden fazla API ile)
-            apis = [
-                f"https://api.duckduckgo.com/?q={app_name}+icon&format=json&pretty=1",
-                f"https://iconfinder-api.com/v4/icons/search?query={app_name}&count=1"
-            ]
-
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko)'
-            }
-
-            for api_url in apis:
-                try:
-                    response = requests.get(api_url, headers=headers, timeout=5)
-                    if response.status_code == 200:
-                        data = response.json()
-                        
-                        # DuckDuckGo API
-                        if 'Image' in data and data['Image']:
-                            img_url = data['Image']
-                        # Iconfinder API
-                        elif 'icons' in data and data['icons']:
-                            img_url = data['icons'][0]['raster_sizes'][-1]['formats'][0]['preview_url']
-                        else:
-                            continue
-
-                        img_response = requests.get(img_url, headers=headers, timeout=5)
-                        if img_response.status_code == 200:
-                            with open(icon_path, 'wb') as f:
-                                f.write(img_response.content)
-                            return icon_path
-                except:
-                    continue
-
-            # Varsayılan ikonu kullan
-            default_icon = os.path.abspath("app_icon.png")
-            shutil.copy2(default_icon, icon_path)
-            return icon_path
-
-        except Exception as e:
-            logging.error(f"İkon indirme hatası: {str(e)}")
-            return os.path.abspath("app_icon.png")
+    def closeEvent(self, event):
+        # Toplu işlem yarıda kesilirse dosyalar ve kayıt tutarsız kalır; bitmesi beklenir
+        if self.bulk_worker and self.bulk_worker.isRunning():
+            QMessageBox.information(self, "Bilgi", "Süren işlem bitmeden pencere kapatılamaz.")
+            event.ignore()
+            return
+        # Çalışan bir QThread yok edilirse Qt süreci sonlandırır; önce bitmelerini bekle.
+        # İndirme iptal edilir, .part dosyası sonraki indirmede sürdürülür.
+        if self.download_worker and self.download_worker.isRunning():
+            self.download_worker.cancel()
+            self.download_worker.wait()
+        if self.service:
+            self.service.unsubscribe()
+            self.service_worker.wait()
+        if self.gc_worker:
+            self.gc_worker.wait()
+        super().closeEvent(event)
 
     def load_installed_apps(self):
-        apps_file = os.path.expanduser("~/.local/share/appimages/installed_apps.json")
-        if os.path.exists(apps_file):
-            try:
-                with open(apps_file, 'r') as f:
-                    self.installed_apps = json.load(f)
-            except Exception as e:
-                logging.error(f"Yüklü uygulamalar yüklenirken hata: {str(e)}")
-                self.installed_apps = {}
+        self.installed_apps = self.backend.load_installed_apps()
 
     def save_installed_apps(self):
-        apps_file = os.path.expanduser("~/.local/share/appimages/installed_apps.json")
-        apps_dir = os.path.dirname(apps_file)
-        os.makedirs(apps_dir, exist_ok=True)
-        try:
-            with open(apps_file, 'w') as f:
-                json.dump(self.installed_apps, f, indent=2)
-        except Exception as e:
-            logging.error(f"Yüklü uygulamalar kaydedilirken hata: {str(e)}")
+        self.backend.save_installed_apps(self.installed_apps)
+
+    def on_registry_changed(self):
+        # Kendi toplu işlemimiz sürerken liste işlem bitince yenilenir
+        if self.progress_bar.isVisible():
+            return
+        self.load_installed_apps()
+        self.update_app_list()
 
     def update_app_list(self):
+        # Kayıt değişti; eski çöp raporu artık güvenilir değil
+        self.garbage_report = None
+        if self.gc_busy():
+            self.gc_rescan_pending = True
+        # Yalnızca değişen uygulamalar yeniden dizinlenir
+        self.search_index.update(self.installed_apps)
+        self.refresh_app_list()
+
+    def refresh_app_list(self):
+        # Her tuş vuruşunda çağrılır; kayıt değil yalnızca dizin taranır
+        selected = set(self.selected_app_names())
         self.app_list.clear()
-        for app_name in sorted(self.installed_apps.keys()):
-            self.app_list.addItem(app_name)
+        for app_name in self.search_index.search(self.search_edit.text(), self.sort_combo.currentData()):
+            item = QListWidgetItem(app_name)
+            item.setToolTip(self.installed_apps[app_name].get('comment', ''))
+            self.app_list.addItem(item)
+            item.setSelected(app_name in selected)
 
     def on_selection_changed(self):
         has_selection = bool(self.app_list.selectedItems())
         self.edit_button.setEnabled(has_selection)
         self.remove_button.setEnabled(has_selection)
+        self.versions_button.setEnabled(len(self.app_list.selectedItems()) == 1)
 
     def select_file(self):
         file_path, _ = QFileDialog.getOpenFileName(
@@ -639,223 +664,302 @@ class AppImageInstaller(QMainWindow):
         if file_path:
             self.install_appimage(file_path)
 
-    def edit_selected_app(self):
-        selected_items = self.app_list.selectedItems()
-        if not selected_items:
+    def select_url(self):
+        url, ok = QInputDialog.getText(self, "URL'den Yükle", "AppImage adresi:")
+        url = url.strip()
+        if not ok or not url:
+            return
+        checksum, ok = QInputDialog.getText(
+            self,
+            "URL'den Yükle",
+            "SHA-256 özeti (isteğe bağlı, boş bırakılırsa yayımlanmış özet aranır):"
+        )
+        if not ok:
             return
         
-        app_name = selected_items[0].text()
-        app_info = self.installed_apps.get(app_name)
-        if not app_info:
+        self.set_busy(True)
+        self.url_button.setEnabled(False)
+        self.progress_bar.setRange(0, 0)
+        self.status_label.setText("İndiriliyor...")
+        self.download_worker = DownloadWorker(url, checksum.strip() or None, self.service)
+        self.download_worker.progress.connect(self.on_download_progress)
+        self.download_worker.download_completed.connect(self.on_download_completed)
+        self.download_worker.download_cancelled.connect(self.on_download_cancelled)
+        self.download_worker.error_occurred.connect(self.on_download_error)
+        self.cancel_download_button.setEnabled(True)
+        self.cancel_download_button.setVisible(True)
+        self.download_worker.start()
+
+    def cancel_download(self):
+        if self.download_worker and self.download_worker.isRunning():
+            self.cancel_download_button.setEnabled(False)
+            self.status_label.setText("İndirme iptal ediliyor...")
+            self.download_worker.cancel()
+
+    def on_download_progress(self, downloaded, total):
+        if total:
+            # QProgressBar int sınırını aşmamak için KB cinsinden
+            self.progress_bar.setRange(0, total // 1024)
+            self.progress_bar.setValue(downloaded // 1024)
+        self.status_label.setText(f"İndiriliyor... {downloaded / (1024 * 1024):.1f} MB")
+
+    def finish_download(self):
+        self.set_busy(False)
+        self.url_button.setEnabled(True)
+        self.cancel_download_button.setVisible(False)
+
+    def on_download_completed(self, file_path):
+        self.finish_download()
+        self.install_appimage(file_path, move=True)
+
+    def on_download_cancelled(self):
+        self.finish_download()
+        self.status_label.setText("İndirme iptal edildi.")
+
+    def on_download_error(self, error_message):
+        self.finish_download()
+        self.status_label.setText("İndirme başarısız!")
+        QMessageBox.critical(self, "Hata", f"İndirme sırasında bir hata oluştu:\n{error_message}")
+
+    def selected_app_names(self):
+        return [item.text() for item in self.app_list.selectedItems()
+                if item.text() in self.installed_apps]
+
+    def edit_selected_app(self):
+        app_names = self.selected_app_names()
+        if not app_names:
             return
         
-        dialog = EditAppDialog(app_name, app_info, self)
-        if dialog.exec_() == QDialog.Accepted:
+        if len(app_names) == 1:
+            app_name = app_names[0]
+            dialog = EditAppDialog(app_name, self.installed_apps[app_name], self)
+            if dialog.exec_() != QDialog.Accepted:
+                return
             new_info = dialog.get_new_info()
-            if new_info['name']:
-                try:
-                    # İkon güncelleme
-                    if 'new_icon_path' in new_info:
-                        icon_dir = os.path.expanduser("~/.local/share/icons/hicolor/128x128/apps")
-                        os.makedirs(icon_dir, exist_ok=True)
-                        new_icon_path = os.path.join(icon_dir, f"{new_info['name']}.png")
-                        
-                        # Yeni ikonu kopyala ve boyutlandır
-                        pixmap = QPixmap(new_info['new_icon_path'])
-                        scaled_pixmap = pixmap.scaled(128, 128, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                        scaled_pixmap.save(new_icon_path, "PNG")
-                        
-                        # Eski ikonu sil
-                        if 'icon' in app_info and os.path.exists(app_info['icon']):
-                            os.remove(app_info['icon'])
-                        
-                        app_info['icon'] = new_icon_path
-                    
-                    # Masaüstü ve menü dosyalarını güncelle
-                    self.update_desktop_files(app_name, new_info)
-                    
-                    # Yüklü uygulamalar listesini güncelle
-                    if new_info['name'] != app_name:
-                        app_info = self.installed_apps.pop(app_name)
-                    app_info.update({
-                        'comment': new_info['comment']
-                    })
-                    self.installed_apps[new_info['name']] = app_info
-                    self.save_installed_apps()
-                    self.update_app_list()
-                    
-                    logging.info(f"Uygulama güncellendi: {app_name} -> {new_info['name']}")
-                    QMessageBox.information(self, "Başarılı", "Uygulama başarıyla güncellendi!")
-                    
-                except Exception as e:
-                    logging.error(f"Uygulama düzenlenirken hata: {str(e)}")
-                    QMessageBox.critical(self, "Hata", f"Uygulama düzenlenirken bir hata oluştu:\n{str(e)}")
-
-    def update_desktop_files(self, old_name, new_info):
-        # Masaüstü dosyasını güncelle
-        desktop_path = os.path.expanduser(f"~/Desktop/{old_name}.desktop")
-        new_desktop_path = os.path.expanduser(f"~/Desktop/{new_info['name']}.desktop")
-        
-        # Uygulamalar menüsü dosyasını güncelle
-        apps_dir = os.path.expanduser("~/.local/share/applications")
-        old_desktop_file = os.path.join(apps_dir, f"{old_name}.desktop")
-        new_desktop_file = os.path.join(apps_dir, f"{new_info['name']}.desktop")
-        
-        for old_path, new_path in [(desktop_path, new_desktop_path), (old_desktop_file, new_desktop_file)]:
-            if os.path.exists(old_path):
-                with open(old_path, 'r') as f:
-                    content = f.read()
-                
-                content = content.replace(f"Name={old_name}", f"Name={new_info['name']}")
-                if new_info.get('comment'):
-                    if "Comment=" in content:
-                        content = content.replace(content[content.find("Comment="):content.find("\n", content.find("Comment="))],
-                                               f"Comment={new_info['comment']}")
-                    else:
-                        content = content.replace("[Desktop Entry]", f"[Desktop Entry]\nComment={new_info['comment']}")
-                
-                with open(new_path, 'w') as f:
-                    f.write(content)
-                
-                if old_path != new_path:
-                    os.remove(old_path)
+            if not new_info['name']:
+                return
+            edits = {app_name: new_info}
+        else:
+            # Çoklu seçimde ortak açıklama uygulanır
+            comment, ok = QInputDialog.getText(
+                self,
+                "Uygulamaları Düzenle",
+                f"{len(app_names)} uygulama için yeni açıklama:"
+            )
+            if not ok:
+                return
+            edits = {app_name: {'name': app_name, 'comment': comment} for app_name in app_names}
+        
+        self.run_bulk_operation(self.backend.edit_apps, edits, "güncellendi")
 
     def remove_selected_app(self):
-        selected_items = self.app_list.selectedItems()
-        if not selected_items:
+        app_names = self.selected_app_names()
+        if not app_names:
             return
         
-        app_name = selected_items[0].text()
+        if len(app_names) == 1:
+            question = f"{app_names[0]} uygulamasını kaldırmak istediğinizden emin misiniz?"
+        else:
+            question = f"{len(app_names)} uygulamayı kaldırmak istediğinizden emin misiniz?\n\n" + "\n".join(app_names)
         reply = QMessageBox.question(
             self,
             "Uygulama Kaldır",
-            f"{app_name} uygulamasını kaldırmak istediğinizden emin misiniz?",
+            question,
             QMessageBox.Yes | QMessageBox.No,
             QMessageBox.No
         )
         
         if reply == QMessageBox.Yes:
+            self.run_bulk_operation(self.backend.remove_apps, app_names, "kaldırıldı")
+
+    def run_bulk_operation(self, operation, targets, verb):
+        """Dosya işlemlerini arka planda yürütür ve sonunda tek özet gösterir"""
+        self.set_busy(True)
+        self.progress_bar.setRange(0, len(targets))
+        self.progress_bar.setValue(0)
+        self.progress_bar.setVisible(True)
+        
+        self.bulk_worker = BulkOperationWorker(operation, self.installed_apps, targets)
+        self.bulk_worker.progress.connect(self.on_bulk_progress)
+        self.bulk_worker.finished_ok.connect(lambda apps: self.on_bulk_finished(apps, targets, verb))
+        self.bulk_worker.failed.connect(self.on_bulk_failed)
+        self.bulk_worker.start()
+
+    def on_bulk_progress(self, done, total, app_name):
+        self.progress_bar.setValue(done)
+        self.status_label.setText(f"{app_name} ({done}/{total})")
+
+    def on_bulk_finished(self, installed_apps, targets, verb):
+        self.installed_apps = installed_apps
+        self.update_app_list()
+        self.set_busy(False)
+        self.status_label.setText(f"{len(targets)} uygulama {verb}.")
+        if len(targets) == 1:
+            message = f"{next(iter(targets))} başarıyla {verb}!"
+        else:
+            message = f"{len(targets)} uygulama başarıyla {verb}:\n\n" + "\n".join(targets)
+        QMessageBox.information(self, "Başarılı", message)
+
+    def on_bulk_failed(self, error_message):
+        self.set_busy(False)
+        self.status_label.setText("İşlem geri alındı.")
+        QMessageBox.critical(
+            self,
+            "Hata",
+            f"İşlem sırasında bir hata oluştu, hiçbir değişiklik yapılmadı:\n{error_message}"
+        )
+
+    def set_busy(self, busy):
+        self.progress_bar.setVisible(busy)
+        self.select_button.setEnabled(not busy)
+        self.app_list.setEnabled(not busy)
+        has_selection = not busy and bool(self.app_list.selectedItems())
+        self.edit_button.setEnabled(has_selection)
+        self.remove_button.setEnabled(has_selection)
+        self.versions_button.setEnabled(not busy and len(self.app_list.selectedItems()) == 1)
+
+    def show_versions(self):
+        app_names = self.selected_app_names()
+        if len(app_names) != 1:
+            return
+        
+        app_name = app_names[0]
+        app_info = self.installed_apps[app_name]
+        try:
+            # Eski kurulumları ilk açılışta sürüm düzenine taşı
+            if not app_info.get('versions'):
+                self.backend.migrate_to_versions(app_name, app_info)
+                self.save_installed_apps()
+        except Exception as e:
+            logging.error(f"Sürüm düzenine taşıma hatası: {str(e)}")
+            QMessageBox.critical(self, "Hata", f"Sürümler okunamadı:\n{str(e)}")
+            return
+        
+        dialog = VersionsDialog(app_name, app_info, self)
+        if dialog.exec_() == QDialog.Accepted and dialog.selected_version:
+            if dialog.selected_version == app_info.get('active_version'):
+                return
             try:
-                app_info = self.installed_apps.get(app_name)
-                if app_info:
-                    # AppImage dosyasını kaldır
-                    if os.path.exists(app_info['path']):
-                        os.remove(app_info['path'])
-                    
-                    # İkonu kaldır
-                    if 'icon' in app_info and os.path.exists(app_info['icon']):
-                        os.remove(app_info['icon'])
-                    
-                    # Masaüstü kısayolunu kaldır
-                    desktop_path = os.path.expanduser(f"~/Desktop/{app_name}.desktop")
-                    if os.path.exists(desktop_path):
-                        os.remove(desktop_path)
-                    
-                    # Uygulamalar menüsü girişini kaldır
-                    apps_dir = os.path.expanduser("~/.local/share/applications")
-                    desktop_file = os.path.join(apps_dir, f"{app_name}.desktop")
-                    if os.path.exists(desktop_file):
-                        os.remove(desktop_file)
-                    
-                    # Listeden kaldır
-                    del self.installed_apps[app_name]
-                    self.save_installed_apps()
-                    self.update_app_list()
-                    logging.info(f"Uygulama kaldırıldı: {app_name}")
-                    
-                    QMessageBox.information(
-                        self,
-                        "Başarılı",
-                        f"{app_name} başarıyla kaldırıldı!"
-                    )
-                
+                self.backend.switch_version(self.installed_apps, app_name, dialog.selected_version)
+                self.status_label.setText(f"{app_name}: {dialog.selected_version} sürümü etkin.")
             except Exception as e:
-                logging.error(f"Uygulama kaldırılırken hata: {str(e)}")
-                QMessageBox.critical(self, "Hata", f"Uygulama kaldırılırken bir hata oluştu:\n{str(e)}")
+                logging.error(f"Sürüm değiştirme hatası: {str(e)}")
+                QMessageBox.critical(self, "Hata", f"Sürüm değiştirilemedi:\n{str(e)}")
 
-    def install_appimage(self, file_path):
+    def gc_busy(self):
+        return self.gc_worker is not None and self.gc_worker.isRunning()
+
+    def start_garbage_scan(self):
+        if self.gc_busy():
+            # Çalışan QThread'in yerine yenisi konursa Qt süreci sonlandırır
+            self.gc_rescan_pending = True
+            return
+        self.gc_rescan_pending = False
+        self.gc_worker = GarbageScanWorker(service=self.service)
+        self.gc_worker.report_ready.connect(self.on_garbage_report)
+        self.gc_worker.finished.connect(self.on_garbage_worker_finished)
+        self.gc_worker.start()
+
+    def on_garbage_worker_finished(self):
+        if self.sender() is not self.gc_worker:
+            return  # Yerine yenisi başlamış eski bir iş parçacığının geç gelen sinyali
+        self.cleanup_button.setEnabled(True)
+        if self.gc_rescan_pending:
+            self.start_garbage_scan()
+
+    def on_garbage_report(self, report):
+        import appimage_gc
+
+        if self.gc_rescan_pending:
+            return  # Tarama sürerken kayıt değişti; kuyruktaki tarama sonucu bekle
+        self.garbage_report = report
+        if report.reclaimable_size and not self.status_label.text():
+            self.status_label.setText(
+                f"{appimage_gc.format_size(report.reclaimable_size)} gereksiz dosya temizlenebilir."
+            )
+
+    def show_garbage_report(self):
+        import appimage_gc
+
+        if self.garbage_report is None or self.gc_busy():
+            # Süren tarama ya da temizlik bitince rapor kendiliğinden güncellenir
+            self.status_label.setText("Disk kullanımı analiz ediliyor...")
+            if not self.gc_busy():
+                self.start_garbage_scan()
+            return
+        
+        report = self.garbage_report
+        box = QMessageBox(self)
+        box.setWindowTitle("Disk Temizliği")
+        box.setText(f"Geri kazanılabilir alan: {appimage_gc.format_size(report.reclaimable_size)}")
+        box.setDetailedText(report.format())
+        if report.reclaimable_size:
+            box.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
+            box.setInformativeText("Gereksiz dosyalar silinsin mi?")
+        else:
+            box.setStandardButtons(QMessageBox.Ok)
+        
+        if box.exec_() == QMessageBox.Yes:
+            if self.gc_busy():
+                self.status_label.setText("Disk kullanımı analiz ediliyor, temizlik sonra yapılabilir.")
+                return
+            self.garbage_report = None
+            self.cleanup_button.setEnabled(False)
+            self.gc_worker = GarbageScanWorker(reclaim_report=report, service=self.service)
+            self.gc_worker.reclaimed.connect(self.on_garbage_reclaimed)
+            self.gc_worker.finished.connect(self.on_garbage_worker_finished)
+            self.gc_worker.start()
+
+    def on_garbage_reclaimed(self, freed, count):
+        import appimage_gc
+
+        self.status_label.setText(f"{count} öğe silindi, {appimage_gc.format_size(freed)} yer açıldı.")
+        # Sinyal iş parçacığı bitmeden gelir; yeni tarama bitişte başlatılır
+        self.start_garbage_scan()
+
+    def install_appimage(self, file_path, move=False):
         try:
             # Dosya türünü kontrol et
-            file_type = magic.from_file(file_path)
-            if "executable" not in file_type.lower():
-                logging.warning(f"Geçersiz dosya türü: {file_type}")
-                QMessageBox.warning(self, "Hata", "Seçilen dosya çalıştırılabilir bir dosya değil!")
+            invalid_type = core.check_appimage_file(file_path)
+            if invalid_type:
+                logging.warning(f"Geçersiz dosya türü: {invalid_type}")
+                QMessageBox.warning(self, "Hata", f"Seçilen dosya geçerli bir AppImage değil!\n{invalid_type}")
                 return
 
-            # Dosya adını al
+            # Dosya adını al (yeniden adlandırılmış uygulamalar sabit yollarından bulunur)
             file_name = os.path.basename(file_path)
-            app_name = os.path.splitext(file_name)[0]
+            app_name = (core.find_app_by_file_name(self.installed_apps, file_name)
+                        or os.path.splitext(file_name)[0])
 
-            # Eğer aynı isimde uygulama varsa kullanıcıya sor
+            # Eğer aynı isimde uygulama varsa yeni sürüm olarak eklenir
             if app_name in self.installed_apps:
                 reply = QMessageBox.question(
                     self,
                     "Uygulama Zaten Var",
-                    f"{app_name} zaten yüklü. Üzerine yazmak ister misiniz?",
+                    f"{app_name} zaten yüklü. Yeni sürüm olarak ekleyip etkinleştirmek ister misiniz?\n"
+                    f"(Önceki sürüme \"Sürümler\" penceresinden dönebilirsiniz)",
                     QMessageBox.Yes | QMessageBox.No,
                     QMessageBox.No
                 )
                 if reply == QMessageBox.No:
                     return
+                no_sandbox = True  # Mevcut .desktop dosyaları korunur
+            else:
+                # Sandbox uyarısı
+                sandbox_reply = QMessageBox.question(
+                    self,
+                    "Sandbox Modu",
+                    "Uygulamayı sandbox modunda çalıştırmak ister misiniz?\n(Daha güvenli ama bazı uygulamalar çalışmayabilir)",
+                    QMessageBox.Yes | QMessageBox.No,
+                    QMessageBox.Yes
+                )
+                no_sandbox = sandbox_reply == QMessageBox.Yes
 
-            # AppImages klasörü oluştur
-            appimages_dir = os.path.expanduser("~/.local/share/appimages")
-            os.makedirs(appimages_dir, exist_ok=True)
-
-            # AppImage dosyasını kopyala
-            target_path = os.path.join(appimages_dir, file_name)
-            shutil.copy2(file_path, target_path)
-            os.chmod(target_path, 0o755)
-
-            # Sandbox uyarısı
-            sandbox_reply = QMessageBox.question(
-                self,
-                "Sandbox Modu",
-                "Uygulamayı sandbox modunda çalıştırmak ister misiniz?\n(Daha güvenli ama bazı uygulamalar çalışmayabilir)",
-                QMessageBox.Yes | QMessageBox.No,
-                QMessageBox.Yes
-            )
-            sandbox_param = "" if sandbox_reply == QMessageBox.No else "--no-sandbox"
-
-            # İkon yolu al
-            icon_path = self.get_icon_path(app_name)
-
-            # Desktop dosyası oluştur
-            desktop_file_content = f"""[Desktop Entry]
-Version=1.0
-Name={app_name}
-Comment=AppImage uygulaması
-Exec={target_path} {sandbox_param}
-Icon={icon_path}
-Terminal=false
-Type=Application
-Categories=Utility;Application;
-"""
-            # Applications klasörü oluştur ve desktop dosyasını kaydet
-            apps_dir = os.path.expanduser("~/.local/share/applications")
-            os.makedirs(apps_dir, exist_ok=True)
-            desktop_file_path = os.path.join(apps_dir, f"{app_name}.desktop")
-            with open(desktop_file_path, "w") as f:
-                f.write(desktop_file_content)
-            os.chmod(desktop_file_path, 0o755)
-
-            # Masaüstüne kısayol oluştur
-            desktop_dir = os.path.expanduser("~/Desktop")
-            desktop_shortcut = os.path.join(desktop_dir, f"{app_name}.desktop")
-            shutil.copy2(desktop_file_path, desktop_shortcut)
-            os.chmod(desktop_shortcut, 0o755)
-
-            # Yüklü uygulamalar listesine ekle
-            self.installed_apps[app_name] = {
-                'path': target_path,
-                'icon': icon_path,
-                'install_date': datetime.now().isoformat(),
-                'comment': 'AppImage uygulaması'
-            }
+            # Sürümü ekle, .desktop girdilerini oluştur ve kayda ekle
+            self.backend.install_appimage(file_path, self.installed_apps, no_sandbox=no_sandbox, move=move)
             self.save_installed_apps()
             self.update_app_list()
 
-            logging.info(f"Uygulama yüklendi: {app_name}")
             QMessageBox.information(
                 self,
                 "Başarılı",
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""AppImage Yükleyici'nin .desktop girdilerinden çağrılan başlatıcısı.
+
+Kullanım: appimage_launch.py <sabit AppImage yolu> [argümanlar...]
+
+Uygulamanın son çalıştırma zamanını kayda (servis çalışıyorsa servise) yazar
+ve AppImage'ı aynı süreçte çalıştırır. Kayıt yazılamazsa uygulama yine açılır.
+"""
+import os
+import sys
+import logging
+
+# Servis meşgulse açılış bu kadar saniyeden fazla beklemez
+SERVICE_TIMEOUT = 2.0
+
+
+def record_launch(app_path):
+    import appimage_core as core
+    import appimage_service
+
+    backend = appimage_service.connect_if_running() or core
+    if backend is not core:
+        backend.timeout = SERVICE_TIMEOUT
+    installed_apps = backend.load_installed_apps()
+    if backend.record_launch(installed_apps, app_path):
+        backend.write_installed_apps(installed_apps)
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Kullanım: appimage_launch.py <AppImage> [argümanlar...]", file=sys.stderr)
+        return 2
+    app_path = sys.argv[1]
+    try:
+        record_launch(app_path)
+    except Exception as e:
+        logging.error(f"Son çalıştırma zamanı kaydedilemedi ({app_path}): {str(e)}")
+    os.execv(app_path, [app_path] + sys.argv[2:])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""Yüklü uygulamalar için bellek içi arama dizini.
+
+Ad, açıklama, kategoriler ve AppImage'dan okunan gömülü meta veriler
+(GenericName, Keywords) kelimelerine bölünür; her kelimenin trigramları bir
+ters dizine yazılır. Sorgu yalnızca kendi trigramlarının listelerini dolaşır,
+kaydı yeniden taramaz. Kelime başı trigramları kullanıldığı için yazılırken
+önek eşleşmesi, eksik trigramlara izin verildiği için küçük yazım hataları da
+tolere edilir.
+
+update() kayıttaki değişiklikleri uygulama bazında karşılaştırır; yalnızca
+değişen uygulamaların girdileri yeniden dizinlenir.
+"""
+import os
+import re
+from collections import defaultdict
+
+import appimage_core as core
+
+# Alan ağırlıkları: ad eşleşmeleri açıklama eşleşmelerinden önce gelir
+FIELD_WEIGHTS = {
+    "name": 3.0,
+    "generic_name": 2.0,
+    "keywords": 2.0,
+    "categories": 1.0,
+    "comment": 1.0,
+}
+NAME_PREFIX_BONUS = 10.0
+
+SORT_RELEVANCE = "relevance"
+SORT_NAME = "name"
+SORT_INSTALL_DATE = "install_date"
+SORT_SIZE = "size"
+SORT_LAST_LAUNCH = "last_launch"
+SORT_LABELS = {
+    SORT_RELEVANCE: "İlgililik",
+    SORT_NAME: "Ad",
+    SORT_INSTALL_DATE: "Yükleme tarihi",
+    SORT_SIZE: "Boyut",
+    SORT_LAST_LAUNCH: "Son çalıştırma",
+}
+
+
+def tokenize(text):
+    return re.findall(r"\w+", text.casefold()) if text else []
+
+
+def word_grams(word):
+    """Kelimenin dizine yazılacak parçaları: tek harflik önek ve trigramlar"""
+    padded = f" {word} "
+    return {padded[:2]} | {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def query_grams(token):
+    """Sorgu kelimesinin aranacak parçaları; sondaki boşluk olmadığı için önek de eşleşir"""
+    padded = f" {token}"
+    if len(padded) < 3:
+        return [padded]
+    return [padded[i:i + 3] for i in range(len(padded) - 2)]
+
+
+def _desktop_fields(app_name):
+    """Yüklü .desktop dosyasındaki kategori ve anahtar kelimeler (eski kurulumlar için)"""
+    fields = {}
+    desktop_path = core.desktop_file_paths(app_name)[1]
+    try:
+        with open(desktop_path, "r", errors="replace") as f:
+            for line in f:
+                key, sep, value = line.strip().partition("=")
+                if sep and key in ("Categories", "Keywords", "GenericName"):
+                    fields[key] = value
+    except OSError:
+        pass
+    return fields
+
+
+def app_fields(app_name, app_info):
+    """Dizinlenecek metin alanları"""
+    metadata = app_info.get('metadata') or _desktop_fields(app_name)
+    return {
+        "name": app_name,
+        "comment": app_info.get('comment', ''),
+        "categories": metadata.get('Categories', '').replace(";", " "),
+        "keywords": metadata.get('Keywords', '').replace(";", " "),
+        "generic_name": metadata.get('GenericName', ''),
+    }
+
+
+def app_size(app_info):
+    versions = app_info.get('versions')
+    if versions:
+        return sum(version.get('size', 0) for version in versions)
+    try:
+        return os.path.getsize(app_info['path'])
+    except OSError:
+        return 0
+
+
+class SearchIndex:
+    def __init__(self, installed_apps=None):
+        self.postings = defaultdict(dict)   # {parça: {uygulama: en yüksek alan ağırlığı}}
+        self.doc_grams = {}                 # {uygulama: parça kümesi}
+        self.doc_keys = {}                  # {uygulama: kayıttaki ilgili alanlar} değişiklik denetimi için
+        self.apps = {}
+        if installed_apps:
+            self.update(installed_apps)
+
+    def __len__(self):
+        return len(self.doc_grams)
+
+    def add(self, app_name, app_info):
+        self.remove(app_name)
+        fields = app_fields(app_name, app_info)
+        grams = {}
+        for field, text in fields.items():
+            weight = FIELD_WEIGHTS[field]
+            for word in tokenize(text):
+                for gram in word_grams(word):
+                    if grams.get(gram, 0) < weight:
+                        grams[gram] = weight
+        for gram, weight in grams.items():
+            self.postings[gram][app_name] = weight
+        self.doc_grams[app_name] = set(grams)
+        self.apps[app_name] = app_info
+        self.doc_keys[app_name] = self._doc_key(app_name, app_info)
+
+    def remove(self, app_name):
+        for gram in self.doc_grams.pop(app_name, ()):
+            posting = self.postings[gram]
+            posting.pop(app_name, None)
+            if not posting:
+                del self.postings[gram]
+        self.apps.pop(app_name, None)
+        self.doc_keys.pop(app_name, None)
+
+    def _doc_key(self, app_name, app_info):
+        return (app_info.get('comment'), app_info.get('metadata'), app_info.get('install_date'),
+                app_info.get('active_version'), len(app_info.get('versions', [])))
+
+    def update(self, installed_apps):
+        """Kayıtla eşitler; eklenen, silinen ve değişen uygulama sayısını döndürür"""
+        changed = 0
+        for app_name in list(self.doc_grams):
+            if app_name not in installed_apps:
+                self.remove(app_name)
+                changed += 1
+        for app_name, app_info in installed_apps.items():
+            if self.doc_keys.get(app_name) != self._doc_key(app_name, app_info):
+                self.add(app_name, app_info)
+                changed += 1
+            else:
+                self.apps[app_name] = app_info
+        return changed
+
+    def _match_token(self, token):
+        """{uygulama: puan}; trigramların çoğu eşleşmeyen uygulamalar elenir"""
+        grams = query_grams(token)
+        # Yazım hatalarına izin ver: tek bir eksik/yanlış harf iki trigramı bozar
+        required = max(1, len(grams) - max(0, len(token) - 2) // 2)
+        hits = defaultdict(int)
+        weights = defaultdict(float)
+        for gram in grams:
+            for app_name, weight in self.postings.get(gram, {}).items():
+                hits[app_name] += 1
+                weights[app_name] += weight
+        return {app_name: weights[app_name] / len(grams)
+                for app_name, count in hits.items() if count >= required}
+
+    def search(self, query="", sort=None, reverse=None):
+        """Sorguya uyan uygulama adlarını sıralı döndürür; boş sorgu hepsini döndürür"""
+        tokens = tokenize(query)
+        if tokens:
+            scores = None
+            for token in sorted(tokens, key=len, reverse=True):
+                matches = self._match_token(token)
+                if scores is None:
+                    scores = matches
+                else:
+                    scores = {app_name: scores[app_name] + score
+                              for app_name, score in matches.items() if app_name in scores}
+                if not scores:
+                    return []
+            needle = query.strip().casefold()
+            for app_name in scores:
+                if app_name.casefold().startswith(needle):
+                    scores[app_name] += NAME_PREFIX_BONUS
+        else:
+            scores = dict.fromkeys(self.doc_grams, 0.0)
+
+        sort = sort or (SORT_RELEVANCE if tokens else SORT_NAME)
+        names = sorted(scores, key=str.casefold)
+        if sort == SORT_NAME:
+            return names[::-1] if reverse else names
+        if sort == SORT_RELEVANCE:
+            key = scores.__getitem__
+        elif sort == SORT_INSTALL_DATE:
+            key = lambda app_name: self.apps[app_name].get('install_date', '')
+        elif sort == SORT_SIZE:
+            key = lambda app_name: app_size(self.apps[app_name])
+        elif sort == SORT_LAST_LAUNCH:
+            # appimage_launch.py'nin kayda yazdığı zaman; hiç çalıştırılmamışlar sonda
+            key = lambda app_name: self.apps[app_name].get('last_launch', '')
+        else:
+            raise ValueError(f"Bilinmeyen sıralama: {sort}")
+        # Ad dışındaki ölçütlerde varsayılan büyükten küçüğe (en yeni/en büyük önce)
+        return sorted(names, key=key, reverse=True if reverse is None else reverse)
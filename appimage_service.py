@@ -0,0 +1,675 @@
+#!/usr/bin/env python3
+"""Kullanıcı başına isteğe bağlı AppImage Yükleyici servisi.
+
+Servis bir Unix soketi üzerinden satır başına bir JSON mesajı ile konuşur:
+
+    istek:  {"id": 1, "method": "remove", "params": {"names": ["a"]}}
+    olay:   {"id": 1, "event": "progress", "args": [1, 1, "a"]}
+    yanıt:  {"id": 1, "result": {...}}  veya  {"id": 1, "error": "..."}
+
+Kayıt, ikon arama önbelleği ve doğrulayıcı önbelleği servis sürecinde
+tutulur. HTTP oturumları paylaşılmaz; her indirme ve ikon araması kendi
+oturumunu açıp kapatır. Uzun işler türlerine göre ayrı öncelikli kuyruklara
+alınır; her tür kendi eşzamanlılık sınırında yer açıldıkça kuyruğundan en
+öncelikli işi başlatır, böylece bekleyen indirmeler kayıt işlerini tıkamaz.
+GUI ve CLI, servis çalışıyorsa ServiceClient üzerinden ince istemci olarak
+çalışır; çalışmıyorsa her şey eskisi gibi yerel olarak yapılır.
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import socket
+import logging
+import argparse
+import itertools
+import threading
+import subprocess
+
+# /tmp herkese yazılabilir; XDG_RUNTIME_DIR yoksa soket kullanıcıya özel bir dizinde durur
+SOCKET_DIR = os.environ.get("XDG_RUNTIME_DIR") or os.path.join("/tmp", f"appimage-installer-{os.getuid()}")
+SOCKET_PATH = os.path.join(SOCKET_DIR, f"appimage-installer-{os.getuid()}.sock")
+ICON_CACHE_DIR = os.path.expanduser("~/.cache/appimage_installer/service_icons")
+ICON_CACHE_TERMS = 64
+ICON_CACHE_TTL = 60 * 60
+
+# Tür başına aynı anda çalışabilecek iş sayısı
+CONCURRENCY = {
+    "registry": 1,     # Kaydı değiştiren işler sırayla yürür
+    "download": 3,
+    "icon_search": 2,
+    "scan": 1,
+}
+# Tür kuyruğu içindeki varsayılan sıra; küçük sayı önce çalışır
+PRIORITY = {
+    "registry": 10,
+    "icon_search": 20,
+    "download": 30,
+    "scan": 50,
+}
+
+
+class ServiceError(Exception):
+    pass
+
+
+class InstallerService:
+    def __init__(self, socket_path=SOCKET_PATH):
+        import appimage_core as core
+
+        self.core = core
+        self.socket_path = socket_path
+        core.recover_transactions()
+        self.installed_apps = core.load_installed_apps()
+        self.registry_stamp = self._registry_stamp()
+        self.subscribers = set()
+        self.icon_cache = {}       # {terim: (zaman, IconResultStore)}
+        self.icon_searches = {}    # {terim: asyncio.Event} süren aramalar
+        self.job_ids = itertools.count(1)
+        self.running = {}
+        self.handlers = {
+            "install": ("registry", self.job_install),
+            "install_url": ("download", self.job_install_url),
+            "download": ("download", self.job_download),
+            "remove": ("registry", self.job_remove),
+            "edit": ("registry", self.job_edit),
+            "switch": ("registry", self.job_switch),
+            "rollback": ("registry", self.job_rollback),
+            "migrate": ("registry", self.job_migrate),
+            "prune": ("registry", self.job_prune),
+            "icon_search": ("icon_search", self.job_icon_search),
+            "gc_analyze": ("scan", self.job_gc_analyze),
+            "gc_reclaim": ("registry", self.job_gc_reclaim),
+            "scan": ("scan", self.job_scan),
+            "import": ("registry", self.job_import),
+            "launch": ("registry", self.job_launch),
+        }
+
+    # Kayıt
+
+    def _registry_stamp(self):
+        try:
+            st = os.stat(self.core.APPS_FILE)
+            return (st.st_mtime_ns, st.st_size)
+        except OSError:
+            return None
+
+    def _reload_if_changed(self):
+        # Servis dışından (ör. eski bir istemciyle) yazıldıysa yeniden oku
+        if self._registry_stamp() != self.registry_stamp:
+            logging.info("Kayıt dışarıdan değişmiş, yeniden yükleniyor")
+            self.installed_apps = self.core.load_installed_apps()
+            self.registry_stamp = self._registry_stamp()
+
+    async def mutate_registry(self, fn):
+        """fn(kopya) -> (yeni kayıt, sonuç) iş parçacığında çalışır; başarılıysa kayıt değişir"""
+        # URL'den yükleme indirme türünde çalışır ama kayda yine bu kilitle yazar
+        async with self.registry_lock:
+            self._reload_if_changed()
+            snapshot = json.loads(json.dumps(self.installed_apps))
+            installed_apps, result = await self.in_thread(fn, snapshot)
+            self.installed_apps = installed_apps
+            self.registry_stamp = self._registry_stamp()
+        self.broadcast({"event": "registry_changed"})
+        return result
+
+    async def in_thread(self, fn, *args):
+        return await self.loop.run_in_executor(None, fn, *args)
+
+    # İşler
+
+    async def job_install(self, params, emit):
+        def install(installed_apps):
+            app_name = self.core.install_appimage(params["file_path"], installed_apps,
+                                                  no_sandbox=params.get("no_sandbox", True),
+                                                  move=params.get("move", False),
+                                                  keep=params.get("keep", self.core.KEEP_VERSIONS))
+            self.core.write_installed_apps(installed_apps)
+            return installed_apps, {"app_name": app_name, "installed_apps": installed_apps}
+
+        invalid_reason = await self.in_thread(self.core.check_appimage_file, params["file_path"])
+        if invalid_reason:
+            raise ServiceError(f"Geçerli bir AppImage değil: {invalid_reason}")
+        return await self.mutate_registry(install)
+
+    async def job_download(self, params, emit):
+        import appimage_download
+
+        def progress(*args):
+            # İstemci bağlantıyı kapatırsa (iptal) indirme durur; .part dosyası korunur
+            if not emit("progress", *args):
+                download.cancel()
+
+        download = appimage_download.Download(params["url"], params.get("checksum"),
+                                              params.get("connections", appimage_download.CONNECTIONS),
+                                              progress=progress)
+        return {"path": await self.in_thread(download.run)}
+
+    async def job_install_url(self, params, emit):
+        result = await self.job_download(params, emit)
+        return await self.job_install(dict(params, file_path=result["path"], move=True), emit)
+
+    async def job_remove(self, params, emit):
+        def remove(installed_apps):
+            new_apps = self.core.remove_apps(installed_apps, params["names"],
+                                             lambda *args: emit("progress", *args))
+            return new_apps, {"installed_apps": new_apps}
+
+        return await self.mutate_registry(remove)
+
+    async def job_edit(self, params, emit):
+        def edit(installed_apps):
+            new_apps = self.core.edit_apps(installed_apps, params["edits"],
+                                           lambda *args: emit("progress", *args))
+            return new_apps, {"installed_apps": new_apps}
+
+        return await self.mutate_registry(edit)
+
+    async def job_switch(self, params, emit):
+        def switch(installed_apps):
+            version = self.core.switch_version(installed_apps, params["name"], params["version"])
+            return installed_apps, {"version": version, "installed_apps": installed_apps}
+
+        return await self.mutate_registry(switch)
+
+    async def job_rollback(self, params, emit):
+        def rollback(installed_apps):
+            version = self.core.rollback_version(installed_apps, params["name"])
+            return installed_apps, {"version": version, "installed_apps": installed_apps}
+
+        return await self.mutate_registry(rollback)
+
+    async def job_migrate(self, params, emit):
+        def migrate(installed_apps):
+            self.core.migrate_to_versions(params["name"], installed_apps[params["name"]])
+            self.core.write_installed_apps(installed_apps)
+            return installed_apps, {"installed_apps": installed_apps}
+
+        return await self.mutate_registry(migrate)
+
+    async def job_prune(self, params, emit):
+        def prune(installed_apps):
+            removed = self.core.prune_versions(params["name"], installed_apps[params["name"]],
+                                               params.get("keep", self.core.KEEP_VERSIONS))
+            self.core.write_installed_apps(installed_apps)
+            return installed_apps, {"removed": removed, "installed_apps": installed_apps}
+
+        return await self.mutate_registry(prune)
+
+    async def job_icon_search(self, params, emit):
+        import asyncio
+        from appimage_icons import IconSearcher, IconResultStore
+
+        term = params["term"].strip()
+        key = term.lower()
+        # Aynı terim zaten aranıyorsa sonucunu bekle; iki arama aynı girdiyi yazmasın
+        while key in self.icon_searches:
+            await self.icon_searches[key].wait()
+
+        cached = self.icon_cache.get(key)
+        if cached and time.time() - cached[0] < ICON_CACHE_TTL and all(os.path.exists(r.path) for r in cached[1].results):
+            for result in cached[1].results:
+                emit("icon", result.url, result.source, result.path)
+            return {"count": len(cached[1]), "cached": True}
+
+        done = self.icon_searches[key] = asyncio.Event()
+        try:
+            if cached:
+                await self.in_thread(self.icon_cache.pop(key)[1].clear)
+            store = IconResultStore(ICON_CACHE_DIR)
+            await IconSearcher(term, store,
+                               lambda result: emit("icon", result.url, result.source, result.path)).search_icons()
+            self.icon_cache[key] = (time.time(), store)
+            while len(self.icon_cache) > ICON_CACHE_TERMS:
+                # Önbellekten çıkan terimin dosyaları da silinir
+                oldest = min(self.icon_cache, key=lambda term_key: self.icon_cache[term_key][0])
+                await self.in_thread(self.icon_cache.pop(oldest)[1].clear)
+            return {"count": len(store), "cached": False}
+        finally:
+            del self.icon_searches[key]
+            done.set()
+
+    async def job_gc_analyze(self, params, emit):
+        import appimage_gc
+
+        report = await self.in_thread(appimage_gc.analyze, json.loads(json.dumps(self.installed_apps)))
+        return report.to_dict()
+
+    async def job_gc_reclaim(self, params, emit):
+        import appimage_gc
+
+        def reclaim(installed_apps):
+            # Yalnızca istemcinin onayladığı ve taze analizde hâlâ gereksiz olan yollar silinir
+            report = appimage_gc.analyze(installed_apps)
+            freed, removed = appimage_gc.reclaim(report, params.get("budget"), paths=params["paths"],
+                                                 installed_apps=installed_apps)
+            return installed_apps, {"freed": freed, "removed": removed}
+
+        return await self.mutate_registry(reclaim)
+
+    async def job_launch(self, params, emit):
+        def launch(installed_apps):
+            app_name = self.core.record_launch(installed_apps, params["path"])
+            if app_name:
+                self.core.write_installed_apps(installed_apps)
+            return installed_apps, {"app_name": app_name}
+
+        return await self.mutate_registry(launch)
+
+    async def job_import(self, params, emit):
+        import appimage_archive
+
+        def do_import(installed_apps):
+            # import_library kaydı diskten okuyup yazar; kilit altında disk ile bellek aynıdır
+            with open(params["path"], "rb") as f:
+                stats = appimage_archive.import_library(f, lambda *args: emit("progress", *args))
+            return self.core.load_installed_apps(), stats.to_dict()
+
+        return await self.mutate_registry(do_import)
+
+    async def job_scan(self, params, emit):
+        import appimage_validator
+
+        infos = await self.in_thread(appimage_validator.scan_directory, params["directory"],
+                                     params.get("verify", False))
+        return [info._asdict() for info in infos]
+
+    # Kuyruk
+
+    async def dispatch(self, kind):
+        """Tür sınırında yer açıldıkça kuyruğundaki en öncelikli işi başlatır"""
+        import asyncio
+
+        queue, limit = self.queues[kind], self.limits[kind]
+        while True:
+            # İş, yeri hazır olmadan kuyruktan alınmaz; sınırda bekleyen bir
+            # indirme başka türlerin işlerini bekletmez
+            await limit.acquire()
+            try:
+                _, _, job = await queue.get()
+            except BaseException:
+                limit.release()
+                raise
+            task = asyncio.create_task(self.run_job(job))
+            self.tasks.add(task)
+            task.add_done_callback(self.tasks.discard)
+            task.add_done_callback(lambda _: limit.release())
+
+    async def run_job(self, job):
+        _, handler = self.handlers[job["method"]]
+        self.running[job["job_id"]] = job
+        # Yanıt da olaylar gibi döngü kuyruğundan gönderilir; önce yayılan olayları geçemez
+        try:
+            result = await handler(job["params"], job["emit"])
+            self.loop.call_soon(self.send, job["writer"], {"id": job["id"], "result": result})
+        except Exception as e:
+            logging.error(f"Servis işi başarısız ({job['method']}): {str(e)}")
+            self.loop.call_soon(self.send, job["writer"], {"id": job["id"], "error": str(e)})
+        finally:
+            self.running.pop(job["job_id"], None)
+
+    def enqueue(self, writer, request):
+        method = request["method"]
+        kind, _ = self.handlers[method]
+        request_id = request.get("id")
+
+        def emit(event, *args):
+            # İş parçacıklarından da çağrılabilir; istemci bağlantıyı kapattıysa False döner
+            if writer.is_closing():
+                return False
+            self.loop.call_soon_threadsafe(self.send, writer,
+                                           {"id": request_id, "event": event, "args": list(args)})
+            return True
+
+        job_id = next(self.job_ids)
+        priority = request.get("priority", PRIORITY[kind])
+        self.queues[kind].put_nowait((priority, job_id, {
+            "job_id": job_id, "id": request_id, "method": method,
+            "params": request.get("params") or {}, "writer": writer, "emit": emit,
+        }))
+
+    # Bağlantılar
+
+    def send(self, writer, message):
+        if writer.is_closing():
+            return
+        try:
+            writer.write(json.dumps(message).encode() + b"\n")
+        except Exception:
+            pass
+
+    def broadcast(self, message):
+        for writer in list(self.subscribers):
+            self.send(writer, message)
+
+    def status(self):
+        return {
+            "pid": os.getpid(),
+            "queued": sum(queue.qsize() for queue in self.queues.values()),
+            "running": [{"job_id": job_id, "method": job["method"]} for job_id, job in self.running.items()],
+            "apps": len(self.installed_apps),
+            "icon_cache_terms": len(self.icon_cache),
+        }
+
+    async def handle_client(self, reader, writer):
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                    method = request["method"]
+                except (ValueError, KeyError, TypeError):
+                    self.send(writer, {"id": None, "error": "Geçersiz istek"})
+                    continue
+
+                request_id = request.get("id")
+                if method == "ping":
+                    self.send(writer, {"id": request_id, "result": "pong"})
+                elif method == "list":
+                    self._reload_if_changed()
+                    self.send(writer, {"id": request_id, "result": self.installed_apps})
+                elif method == "status":
+                    self.send(writer, {"id": request_id, "result": self.status()})
+                elif method == "subscribe":
+                    self.subscribers.add(writer)
+                    self.send(writer, {"id": request_id, "result": "ok"})
+                elif method == "shutdown":
+                    self.send(writer, {"id": request_id, "result": "ok"})
+                    self.stopping.set()
+                elif method in self.handlers:
+                    self.enqueue(writer, request)
+                else:
+                    self.send(writer, {"id": request_id, "error": f"Bilinmeyen yöntem: {method}"})
+                await writer.drain()
+        except (ConnectionError, OSError):
+            pass
+        finally:
+            self.subscribers.discard(writer)
+            writer.close()
+
+    async def serve(self):
+        import asyncio
+
+        self.loop = asyncio.get_running_loop()
+        self.queues = {kind: asyncio.PriorityQueue() for kind in CONCURRENCY}
+        self.limits = {kind: asyncio.Semaphore(limit) for kind, limit in CONCURRENCY.items()}
+        self.registry_lock = asyncio.Lock()
+        self.tasks = set()
+        # Önceki çalışmadan kalan ikonları hiçbir önbellek girdisi göstermiyor
+        shutil.rmtree(ICON_CACHE_DIR, ignore_errors=True)
+        self.stopping = asyncio.Event()
+
+        socket_dir = os.path.dirname(os.path.abspath(self.socket_path))
+        os.makedirs(socket_dir, mode=0o700, exist_ok=True)
+        if os.stat(socket_dir).st_uid not in (os.getuid(), 0):
+            raise ServiceError(f"Soket dizini başka bir kullanıcıya ait: {socket_dir}")
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+        old_umask = os.umask(0o177)
+        try:
+            server = await asyncio.start_unix_server(self.handle_client, path=self.socket_path)
+        finally:
+            os.umask(old_umask)
+
+        dispatchers = [asyncio.create_task(self.dispatch(kind)) for kind in CONCURRENCY]
+        logging.info(f"Servis başladı: {self.socket_path}")
+        try:
+            async with server:
+                await self.stopping.wait()
+        finally:
+            for task in dispatchers + list(self.tasks):
+                task.cancel()
+            if os.path.exists(self.socket_path):
+                os.remove(self.socket_path)
+            logging.info("Servis durdu")
+
+
+class ServiceClient:
+    """Servis için engelleyici istemci.
+
+    Kayıt işlemleri appimage_core ile aynı imzalara sahiptir; böylece GUI ve
+    CLI, servis çalışırken çekirdek modül yerine bu nesneyi kullanabilir.
+    """
+
+    def __init__(self, socket_path=SOCKET_PATH, timeout=None):
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self._subscription = None
+        self._subscription_lock = threading.Lock()
+        self._unsubscribed = False
+        self._calls = set()
+        self._aborted = False
+
+    def _connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        sock.connect(self.socket_path)
+        return sock
+
+    def call(self, method, params=None, on_event=None, priority=None):
+        request = {"id": 1, "method": method, "params": params or {}}
+        if priority is not None:
+            request["priority"] = priority
+        sock = self._connect()
+        with self._subscription_lock:
+            if self._aborted:
+                sock.close()
+                raise ServiceError("İptal edildi")
+            self._calls.add(sock)
+        try:
+            with sock, sock.makefile("rwb") as stream:
+                stream.write(json.dumps(request).encode() + b"\n")
+                stream.flush()
+                for line in stream:
+                    message = json.loads(line)
+                    if "event" in message:
+                        if on_event:
+                            on_event(message["event"], *message.get("args", []))
+                    elif "error" in message:
+                        raise ServiceError(message["error"])
+                    else:
+                        return message["result"]
+        except OSError:
+            if not self._aborted:
+                raise
+        finally:
+            with self._subscription_lock:
+                self._calls.discard(sock)
+        raise ServiceError("İptal edildi" if self._aborted else "Servis bağlantısı kapandı")
+
+    def abort(self):
+        """Süren ve sonraki call() çağrılarını keser; servis bağlantısı kapanan indirmeyi durdurur"""
+        with self._subscription_lock:
+            self._aborted = True
+            for sock in self._calls:
+                try:
+                    sock.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+
+    def subscribe(self, on_event):
+        """Kayıt değişikliği olaylarını bağlantı kapanana ya da unsubscribe() çağrılana kadar dinler"""
+        sock = self._connect()
+        with self._subscription_lock:
+            if self._unsubscribed:
+                sock.close()
+                return
+            self._subscription = sock
+        try:
+            with sock, sock.makefile("rwb") as stream:
+                stream.write(json.dumps({"id": 1, "method": "subscribe"}).encode() + b"\n")
+                stream.flush()
+                for line in stream:
+                    message = json.loads(line)
+                    if "event" in message:
+                        on_event(message["event"], *message.get("args", []))
+        except OSError:
+            if not self._unsubscribed:
+                raise
+        finally:
+            self._subscription = None
+
+    def unsubscribe(self):
+        """Başka bir iş parçacığında süren subscribe() çağrısını bitirir"""
+        with self._subscription_lock:
+            self._unsubscribed = True
+            if self._subscription:
+                try:
+                    self._subscription.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+
+    def ping(self):
+        return self.call("ping") == "pong"
+
+    # appimage_core ile uyumlu arayüz
+
+    def load_installed_apps(self):
+        return self.call("list")
+
+    def save_installed_apps(self, installed_apps):
+        # Servis kaydı her işten sonra kendisi yazar
+        pass
+
+    write_installed_apps = save_installed_apps
+
+    def check_appimage_file(self, file_path):
+        import appimage_core as core
+
+        return core.check_appimage_file(file_path)
+
+    def find_app_by_file_name(self, installed_apps, file_name):
+        import appimage_core as core
+
+        return core.find_app_by_file_name(installed_apps, file_name)
+
+    @staticmethod
+    def _progress_event(progress):
+        def on_event(event, *args):
+            if event == "progress" and progress:
+                progress(*args)
+        return on_event
+
+    @staticmethod
+    def _replace(installed_apps, new_apps):
+        installed_apps.clear()
+        installed_apps.update(new_apps)
+
+    def install_appimage(self, file_path, installed_apps, no_sandbox=True, move=False, keep=None):
+        params = {"file_path": os.path.abspath(file_path), "no_sandbox": no_sandbox, "move": move}
+        if keep is not None:
+            params["keep"] = keep
+        result = self.call("install", params)
+        self._replace(installed_apps, result["installed_apps"])
+        return result["app_name"]
+
+    def install_from_url(self, url, installed_apps, checksum=None, connections=None,
+                         no_sandbox=True, progress=None):
+        params = {"url": url, "checksum": checksum, "no_sandbox": no_sandbox}
+        if connections:
+            params["connections"] = connections
+        result = self.call("install_url", params, self._progress_event(progress))
+        self._replace(installed_apps, result["installed_apps"])
+        return result["app_name"]
+
+    def download(self, url, checksum=None, progress=None):
+        return self.call("download", {"url": url, "checksum": checksum}, self._progress_event(progress))["path"]
+
+    def remove_apps(self, installed_apps, names, progress=None):
+        return self.call("remove", {"names": list(names)}, self._progress_event(progress))["installed_apps"]
+
+    def edit_apps(self, installed_apps, edits, progress=None):
+        return self.call("edit", {"edits": edits}, self._progress_event(progress))["installed_apps"]
+
+    def switch_version(self, installed_apps, app_name, version_id):
+        result = self.call("switch", {"name": app_name, "version": version_id})
+        self._replace(installed_apps, result["installed_apps"])
+        return result["version"]
+
+    def rollback_version(self, installed_apps, app_name):
+        result = self.call("rollback", {"name": app_name})
+        self._replace(installed_apps, result["installed_apps"])
+        return result["version"]
+
+    def prune_versions(self, app_name, app_info, keep):
+        result = self.call("prune", {"name": app_name, "keep": keep})
+        self._replace(app_info, result["installed_apps"][app_name])
+        return result["removed"]
+
+    def record_launch(self, installed_apps, app_path):
+        return self.call("launch", {"path": app_path}, priority=0)["app_name"]
+
+    def import_library(self, path, progress=None):
+        return self.call("import", {"path": os.path.abspath(path)}, self._progress_event(progress))
+
+    def migrate_to_versions(self, app_name, app_info):
+        result = self.call("migrate", {"name": app_name})
+        self._replace(app_info, result["installed_apps"][app_name])
+
+    def icon_search(self, term, on_found):
+        def on_event(event, *args):
+            if event == "icon":
+                on_found(*args)
+        return self.call("icon_search", {"term": term}, on_event)
+
+
+def connect_if_running(socket_path=SOCKET_PATH):
+    """Servis yanıt veriyorsa bir istemci, vermiyorsa None döndürür"""
+    try:
+        owner = os.stat(socket_path).st_uid
+    except OSError:
+        return None
+    if owner != os.getuid():
+        # Başka bir kullanıcı aynı yola soket koyup servis gibi davranabilir
+        logging.warning(f"Soket başka bir kullanıcıya ait, yok sayılıyor: {socket_path}")
+        return None
+    try:
+        client = ServiceClient(socket_path, timeout=0.5)
+        if client.ping():
+            return ServiceClient(socket_path)
+    except (OSError, ValueError, ServiceError):
+        pass
+    return None
+
+
+def start_service(socket_path=SOCKET_PATH, wait=5.0):
+    """Servisi arka planda başlatır ve hazır olana kadar bekler"""
+    client = connect_if_running(socket_path)
+    if client:
+        return client
+    subprocess.Popen([sys.executable, os.path.abspath(__file__), "--socket", socket_path],
+                     stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                     start_new_session=True)
+    deadline = time.monotonic() + wait
+    while time.monotonic() < deadline:
+        client = connect_if_running(socket_path)
+        if client:
+            return client
+        time.sleep(0.05)
+    raise ServiceError("Servis başlatılamadı")
+
+
+def main():
+    import asyncio
+
+    parser = argparse.ArgumentParser(description="AppImage Yükleyici servisi")
+    parser.add_argument("--socket", default=SOCKET_PATH)
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        filename='appimage_installer.log',
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+    if connect_if_running(args.socket):
+        print(f"Servis zaten çalışıyor: {args.socket}", file=sys.stderr)
+        return 1
+    asyncio.run(InstallerService(args.socket).serve())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
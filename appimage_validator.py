@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""libmagic gerektirmeyen hızlı AppImage doğrulayıcı.
+
+Dosya mmap ile açılır ve yalnızca ELF başlığı, bölüm tablosu ve yük
+başlangıcındaki sayfalar okunur. Sonuçlar (aygıt, inode) anahtarıyla
+önbelleğe alınır ve dosyanın mtime/boyutu değişince geçersiz sayılır.
+"""
+import os
+import mmap
+import shutil
+import struct
+import hashlib
+import logging
+import tempfile
+import threading
+import subprocess
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+ELF_MAGIC = b"\x7fELF"
+APPIMAGE_MAGIC_OFFSET = 8
+APPIMAGE_TYPE1_MAGIC = b"AI\x01"
+APPIMAGE_TYPE2_MAGIC = b"AI\x02"
+SQUASHFS_MAGIC = b"hsqs"
+ISO9660_MAGIC_OFFSET = 32769
+ISO9660_MAGIC = b"CD001"
+
+# Tip 2 imza ve özet bölümleri
+SIGNATURE_SECTION = ".sha256_sig"
+SIGNATURE_KEY_SECTION = ".sig_key"
+DIGEST_SECTION = ".digest_md5"
+# Dosyada yer kaplamayan bölüm türü (.bss); offset/boyutu dosyaya göre denetlenmez
+SHT_NOBITS = 8
+
+HASH_BLOCK_SIZE = 1024 * 1024
+CACHE_SIZE = 4096
+
+AppImageInfo = namedtuple("AppImageInfo", [
+    "path",            # Doğrulanan dosya
+    "valid",           # Geçerli bir AppImage mi
+    "reason",          # Geçersizse nedeni
+    "appimage_type",   # 1 veya 2
+    "payload_offset",  # Gömülü dosya sisteminin başlangıcı
+    "sections",        # {bölüm adı: (offset, boyut)}
+    "signed",          # Gömülü imza var mı
+    "digest_ok",       # .digest_md5 eşleşmesi (doğrulanmadıysa None)
+    "signature_ok",    # GPG imza doğrulaması (doğrulanmadıysa None)
+])
+
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _invalid(path, reason, appimage_type=None):
+    return AppImageInfo(path, False, reason, appimage_type, None, {}, False, None, None)
+
+
+def _read_section_table(mm, is_64, endian):
+    """ELF bölüm tablosunu okur; (yük başlangıcı, {ad: (offset, boyut)}) döndürür"""
+    if is_64:
+        e_shoff, = struct.unpack_from(endian + "Q", mm, 0x28)
+        e_shentsize, e_shnum, e_shstrndx = struct.unpack_from(endian + "HHH", mm, 0x3A)
+        section_format = endian + "IIQQQQ"
+    else:
+        e_shoff, = struct.unpack_from(endian + "I", mm, 0x20)
+        e_shentsize, e_shnum, e_shstrndx = struct.unpack_from(endian + "HHH", mm, 0x2E)
+        section_format = endian + "IIIIII"
+
+    payload_offset = e_shoff + e_shentsize * e_shnum
+    if not e_shoff or payload_offset > len(mm):
+        raise ValueError("ELF bölüm tablosu dosya sınırları dışında")
+
+    headers = []
+    for index in range(e_shnum):
+        name, section_type, _, _, offset, size = struct.unpack_from(section_format, mm,
+                                                                    e_shoff + index * e_shentsize)
+        if section_type == SHT_NOBITS:
+            size = 0
+        elif offset + size > len(mm):
+            raise ValueError("ELF bölümü dosya sınırları dışında")
+        headers.append((name, offset, size))
+
+    sections = {}
+    if e_shstrndx < len(headers):
+        _, strtab_offset, strtab_size = headers[e_shstrndx]
+        strtab = mm[strtab_offset:strtab_offset + strtab_size]
+        for name, offset, size in headers:
+            end = strtab.find(b"\0", name)
+            section_name = strtab[name:end if end >= 0 else None].decode("ascii", "replace")
+            if section_name:
+                sections[section_name] = (offset, size)
+    return payload_offset, sections
+
+
+def _section_bytes(mm, sections, name):
+    offset, size = sections.get(name, (0, 0))
+    return bytes(mm[offset:offset + size]).rstrip(b"\0")
+
+
+def _hash_with_zeroed(mm, hash_obj, zeroed):
+    """Verilen aralıkları sıfırlanmış sayarak tüm dosyanın özetini hesaplar"""
+    zeroed = sorted(zeroed)
+    position = 0
+    for offset, size in zeroed + [(len(mm), 0)]:
+        while position < offset:
+            end = min(offset, position + HASH_BLOCK_SIZE)
+            hash_obj.update(mm[position:end])
+            position = end
+        if size:
+            end = offset + size
+            while position < end:
+                step = min(end - position, HASH_BLOCK_SIZE)
+                hash_obj.update(bytes(step))
+                position += step
+    return hash_obj.hexdigest()
+
+
+def _verify_signature(digest_hex, signature, key):
+    """Ayrık GPG imzasını gömülü anahtarla geçici bir anahtarlıkta doğrular"""
+    gpg = shutil.which("gpg") or shutil.which("gpg2")
+    if not gpg:
+        logging.warning("gpg bulunamadı, AppImage imzası doğrulanamadı")
+        return None
+
+    with tempfile.TemporaryDirectory(prefix="appimage_gpg_") as gnupg_home:
+        env = dict(os.environ, GNUPGHOME=gnupg_home)
+        data_path = os.path.join(gnupg_home, "digest")
+        sig_path = os.path.join(gnupg_home, "digest.sig")
+        with open(data_path, "w") as f:
+            f.write(digest_hex)
+        with open(sig_path, "wb") as f:
+            f.write(signature)
+        try:
+            if key:
+                subprocess.run([gpg, "--batch", "--import"], input=key, env=env,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=30)
+            result = subprocess.run([gpg, "--batch", "--verify", sig_path, data_path], env=env,
+                                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=30)
+            return result.returncode == 0
+        except Exception as e:
+            logging.error(f"İmza doğrulama hatası: {str(e)}")
+            return False
+
+
+def _inspect(path, verify):
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < 64:
+            return _invalid(path, "Dosya bir ELF başlığı için çok küçük")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if mm[:4] != ELF_MAGIC:
+                return _invalid(path, "ELF başlığı bulunamadı")
+
+            magic = mm[APPIMAGE_MAGIC_OFFSET:APPIMAGE_MAGIC_OFFSET + 3]
+            if magic == APPIMAGE_TYPE2_MAGIC:
+                appimage_type = 2
+            elif magic == APPIMAGE_TYPE1_MAGIC:
+                appimage_type = 1
+            else:
+                return _invalid(path, "AppImage imzası (offset 8) bulunamadı")
+
+            ei_class, ei_data = mm[4], mm[5]
+            if ei_class not in (1, 2) or ei_data not in (1, 2):
+                return _invalid(path, "Desteklenmeyen ELF sınıfı", appimage_type)
+            endian = "<" if ei_data == 1 else ">"
+
+            try:
+                payload_offset, sections = _read_section_table(mm, ei_class == 2, endian)
+            except (ValueError, struct.error) as e:
+                return _invalid(path, str(e), appimage_type)
+
+            if appimage_type == 2:
+                if mm[payload_offset:payload_offset + 4] != SQUASHFS_MAGIC:
+                    return _invalid(path, "squashfs yükü bulunamadı", appimage_type)
+            else:
+                # Tip 1 dosyanın tamamı, ELF'i sistem alanında taşıyan bir ISO 9660 görüntüsüdür
+                payload_offset = 0
+                if mm[ISO9660_MAGIC_OFFSET:ISO9660_MAGIC_OFFSET + 5] != ISO9660_MAGIC:
+                    return _invalid(path, "ISO 9660 yükü bulunamadı", appimage_type)
+
+            signature = _section_bytes(mm, sections, SIGNATURE_SECTION)
+            digest_ok = signature_ok = None
+            if verify and appimage_type == 2:
+                embedded_digest = _section_bytes(mm, sections, DIGEST_SECTION)
+                signing_ranges = [sections[name] for name in (SIGNATURE_SECTION, SIGNATURE_KEY_SECTION)
+                                  if name in sections]
+                if embedded_digest:
+                    digest_ranges = signing_ranges + [sections[DIGEST_SECTION]]
+                    computed = _hash_with_zeroed(mm, hashlib.md5(), digest_ranges)
+                    digest_ok = bytes.fromhex(computed) == embedded_digest.ljust(16, b"\0")[:16]
+                if signature:
+                    sha256_hex = _hash_with_zeroed(mm, hashlib.sha256(), signing_ranges)
+                    signature_ok = _verify_signature(sha256_hex, signature,
+                                                     _section_bytes(mm, sections, SIGNATURE_KEY_SECTION))
+
+            return AppImageInfo(path, True, None, appimage_type, payload_offset, sections,
+                                bool(signature), digest_ok, signature_ok)
+
+
+def validate_appimage(path, verify=False):
+    """Dosyanın AppImage olup olmadığını başlık baytlarından denetler.
+
+    verify=True ise gömülü MD5 özeti ve GPG imzası da doğrulanır; bu işlem
+    tüm dosyayı okur. Sonuçlar (inode, mtime) başına önbelleğe alınır.
+    """
+    try:
+        st = os.stat(path)
+    except OSError as e:
+        return _invalid(path, str(e))
+
+    key = (st.st_dev, st.st_ino)
+    stamp = (st.st_mtime_ns, st.st_size)
+    with _cache_lock:
+        cached = _cache.get(key)
+        if cached and cached[0] == stamp and cached[1].path == path and (cached[2] or not verify):
+            _cache.move_to_end(key)
+            return cached[1]
+
+    try:
+        info = _inspect(path, verify)
+    except (OSError, ValueError) as e:
+        info = _invalid(path, str(e))
+
+    with _cache_lock:
+        _cache[key] = (stamp, info, verify)
+        _cache.move_to_end(key)
+        while len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+    return info
+
+
+def clear_cache():
+    with _cache_lock:
+        _cache.clear()
+
+
+def scan_directory(directory, verify=False, max_workers=8):
+    """Bir dizindeki tüm normal dosyaları paralel olarak doğrular"""
+    try:
+        with os.scandir(directory) as entries:
+            paths = [entry.path for entry in entries if entry.is_file(follow_symlinks=True)]
+    except OSError as e:
+        logging.error(f"Dizin taranamadı ({directory}): {str(e)}")
+        return []
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(lambda p: validate_appimage(p, verify), paths))
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Kütüphane dışa/içe aktarma ölçümü: sıkıştırma iş parçacığı sayısına göre verim.
+
+Geçici bir ev dizininde sahte bir kütüphane (AppImage benzeri, büyük ölçüde
+sıkıştırılamaz veri) oluşturulur. Komut satırı arayüzü ayrı süreçlerde farklı
+HOME ile çalıştırılır: önce tek ve çok iş parçacığıyla dışa aktarılır, sonra
+boş bir ev dizinine ve aynı dizine ikinci kez (atlanan dosyalar) içe aktarılır.
+Alt süreçlerin en yüksek bellek kullanımı da raporlanır.
+
+Kullanım:
+    python3 benchmarks/bench_archive.py [--size-mb 2048] [--apps 8] [--workers 4] [--level 6]
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import resource
+import tempfile
+import subprocess
+
+CLI = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "appimage_cli.py")
+WRITE_BLOCK = 4 * 1024 * 1024
+
+
+def build_library(home, size_mb, app_count):
+    appimages_dir = os.path.join(home, ".local/share/appimages")
+    applications_dir = os.path.join(home, ".local/share/applications")
+    os.makedirs(applications_dir)
+    installed_apps = {}
+    per_app = size_mb * 1024 * 1024 // app_count
+    for index in range(app_count):
+        app_name = f"Bench{index}"
+        version_dir = os.path.join(appimages_dir, "versions", app_name)
+        os.makedirs(version_dir)
+        version_path = os.path.join(version_dir, "1.AppImage")
+        with open(version_path, "wb") as f:
+            f.write(b"\x7fELF\x02\x01\x01\x00AI\x02")
+            written = 11
+            while written < per_app:
+                size = min(WRITE_BLOCK, per_app - written)
+                # squashfs yükü gibi çoğunlukla sıkıştırılamaz, arada boş bölgeler
+                block = os.urandom(size) if (written // WRITE_BLOCK) % 4 else bytes(size)
+                f.write(block)
+                written += size
+        stable_path = os.path.join(appimages_dir, f"{app_name}.AppImage")
+        os.symlink(os.path.relpath(version_path, appimages_dir), stable_path)
+        with open(os.path.join(applications_dir, f"{app_name}.desktop"), "w") as f:
+            f.write(f"[Desktop Entry]\nName={app_name}\nExec={stable_path}\nType=Application\n")
+        installed_apps[app_name] = {
+            "path": stable_path,
+            "versions": [{"id": "1", "path": version_path, "file_name": f"{app_name}.AppImage",
+                          "size": per_app}],
+            "active_version": "1",
+        }
+    with open(os.path.join(appimages_dir, "installed_apps.json"), "w") as f:
+        json.dump(installed_apps, f)
+
+
+def run_cli(home, *args):
+    env = dict(os.environ, HOME=home)
+    started = time.perf_counter()
+    result = subprocess.run([sys.executable, CLI, "--local", *args, "--quiet"], env=env, cwd=home,
+                            stderr=subprocess.PIPE, text=True)
+    elapsed = time.perf_counter() - started
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr)
+    return elapsed, result.stderr.strip().splitlines()[-1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size-mb", type=int, default=2048)
+    parser.add_argument("--apps", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--level", type=int, default=6)
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix="bench_archive_")
+    source_home = os.path.join(work_dir, "source")
+    target_home = os.path.join(work_dir, "target")
+    archive = os.path.join(work_dir, "library.tar.gz")
+    os.makedirs(target_home)
+    try:
+        build_library(source_home, args.size_mb, args.apps)
+        print(f"Kütüphane: {args.apps} uygulama, {args.size_mb} MB")
+
+        for workers in dict.fromkeys((1, args.workers)):
+            elapsed, summary = run_cli(source_home, "export", archive,
+                                       "--workers", str(workers), "--level", str(args.level))
+            print(f"Dışa aktarma, {workers} iş parçacığı: {elapsed:.2f} sn, "
+                  f"{args.size_mb / elapsed:.1f} MB/s ({summary})")
+
+        elapsed, summary = run_cli(target_home, "import", archive)
+        print(f"İçe aktarma (boş hedef): {elapsed:.2f} sn, {args.size_mb / elapsed:.1f} MB/s ({summary})")
+        elapsed, summary = run_cli(target_home, "import", archive)
+        print(f"İçe aktarma (aynı içerik): {elapsed:.2f} sn, {args.size_mb / elapsed:.1f} MB/s ({summary})")
+
+        with open(os.path.join(target_home, ".local/share/appimages/installed_apps.json")) as f:
+            installed_apps = json.load(f)
+        if any(not info["path"].startswith(target_home) for info in installed_apps.values()):
+            print("HATA: kayıttaki yollar yeni ev dizinine göre yazılmamış")
+            return 1
+
+        max_rss = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024
+        print(f"En yüksek bellek kullanımı (alt süreçler): {max_rss:.0f} MB")
+        return 0
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
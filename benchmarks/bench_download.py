@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""URL'den indirme ölçümü: paralel aralık istekleri ile tek akış karşılaştırması.
+
+Yerel bir HTTP sunucusu (Range destekli, bağlantı başına hız sınırı
+ayarlanabilir) sahte bir AppImage sunar. Ölçümden önce sürdürme ve özet
+doğrulaması da bu sunucuya karşı denetlenir.
+
+Kullanım:
+    python3 benchmarks/bench_download.py [--size-mb 256] [--rate-mb 50] [--connections 4]
+"""
+import os
+import re
+import sys
+import time
+import shutil
+import hashlib
+import argparse
+import tempfile
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import appimage_download  # noqa: E402
+
+
+class RangeHandler(BaseHTTPRequestHandler):
+    payload = b""
+    rate = 0          # Bağlantı başına bayt/sn, 0 = sınırsız
+    fail_from = None   # Bu konumdan sonra başlayan istekleri yarıda kes
+    served = 0
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        if self.path.endswith(".sha256"):
+            body = (hashlib.sha256(self.payload).hexdigest() + "  Bench.AppImage\n").encode()
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        if not self.path.endswith(".AppImage"):
+            self.send_error(404)
+            return
+
+        size = len(self.payload)
+        start, end = 0, size - 1
+        match = re.match(r"bytes=(\d+)-(\d*)", self.headers.get("Range", ""))
+        if match:
+            start = int(match.group(1))
+            end = min(int(match.group(2)) if match.group(2) else size - 1, size - 1)
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+        else:
+            self.send_response(200)
+        self.send_header("Content-Length", str(end - start + 1))
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("ETag", '"bench"')
+        self.end_headers()
+
+        position = start
+        block = 64 * 1024
+        began = time.perf_counter()
+        cut_at = (start + end) // 2 if self.fail_from is not None and start >= self.fail_from else None
+        try:
+            while position <= end:
+                if cut_at is not None and position >= cut_at:
+                    return
+                data = self.payload[position:min(position + block, end + 1)]
+                self.wfile.write(data)
+                position += len(data)
+                RangeHandler.served += len(data)
+                if self.rate:
+                    delay = (position - start) / self.rate - (time.perf_counter() - began)
+                    if delay > 0:
+                        time.sleep(delay)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+
+def fake_appimage(size):
+    header = bytearray(b"\x7fELF\x02\x01\x01\x00AI\x02")
+    return bytes(header) + os.urandom(size - len(header))
+
+
+def timed_download(url, connections, dest_dir, checksum=None):
+    shutil.rmtree(dest_dir, ignore_errors=True)
+    download = appimage_download.Download(url, checksum, connections=connections, dest_dir=dest_dir)
+    started = time.perf_counter()
+    # Sahte yük gerçek bir squashfs içermediği için son doğrulama atlanır
+    path = download.run(validate=False)
+    return path, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size-mb", type=int, default=256)
+    parser.add_argument("--rate-mb", type=float, default=50, help="Bağlantı başına hız sınırı (0 = sınırsız)")
+    parser.add_argument("--connections", type=int, default=4)
+    args = parser.parse_args()
+
+    RangeHandler.payload = fake_appimage(args.size_mb * 1024 * 1024)
+    expected = hashlib.sha256(RangeHandler.payload).hexdigest()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), RangeHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/Bench.AppImage"
+    work_dir = tempfile.mkdtemp(prefix="bench_download_")
+    dest_dir = os.path.join(work_dir, "downloads")
+
+    try:
+        # Sürdürme: ilk denemede dosyanın ikinci yarısındaki parçalar yarıda kesilir
+        size = len(RangeHandler.payload)
+        RangeHandler.fail_from = size // 2
+        download = appimage_download.Download(url, connections=args.connections, dest_dir=dest_dir)
+        try:
+            download.run(validate=False)
+            print("HATA: kesilen indirme başarılı görünüyor")
+            return 1
+        except appimage_download.DownloadError:
+            pass
+        RangeHandler.fail_from = None
+        RangeHandler.served = 0
+        path = appimage_download.Download(url, connections=args.connections, dest_dir=dest_dir).run(validate=False)
+        with open(path, "rb") as f:
+            if hashlib.sha256(f.read()).hexdigest() != expected:
+                print("HATA: sürdürülen indirmenin içeriği bozuk")
+                return 1
+        print(f"Sürdürme: ikinci denemede {RangeHandler.served / size:.0%} yeniden indirildi; "
+              f"yayımlanmış özet doğrulandı")
+
+        # Yanlış özet reddedilmeli
+        try:
+            timed_download(url, args.connections, dest_dir, checksum="sha256:" + "0" * 64)
+            print("HATA: yanlış özet kabul edildi")
+            return 1
+        except appimage_download.DownloadError:
+            print("Yanlış özet reddi: tamam")
+
+        # Verim
+        RangeHandler.rate = args.rate_mb * 1024 * 1024
+        results = {}
+        for connections in (1, args.connections):
+            _, elapsed = timed_download(url, connections, dest_dir, checksum=expected)
+            results[connections] = args.size_mb / elapsed
+            print(f"{connections} bağlantı: {elapsed:.2f} sn, {results[connections]:.1f} MB/s")
+        print(f"Hızlanma: {results[args.connections] / results[1]:.2f}x")
+        return 0
+    finally:
+        server.shutdown()
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
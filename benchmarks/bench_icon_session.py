@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""İkon arama oturumunun bellek ölçümü (tracemalloc ve en yüksek RSS).
+
+Yerel bir HTTP sunucusu çok sayıda PNG adayı sunar; IconSearcher bunları
+gerçek fetch_icon yoluyla indirir. Üç durum ölçülür:
+
+1. Yalnızca sonuç deposu (Qt olmadan)
+2. Düzenleme penceresi: adaylar listeye eklenir ve liste baştan sona
+   kaydırılarak her küçük resim en az bir kez çizilir (PyQt5 gerekir,
+   ekran olmadan `offscreen` ile çalışır)
+3. Karşılaştırma için eski davranış: her gövde bayt olarak bellekte tutulur
+
+tracemalloc yalnızca Python ayırmalarını görür; QPixmap verisi için RSS de
+raporlanır.
+
+Kullanım:
+    python3 benchmarks/bench_icon_session.py [--candidates 240] [--icon-px 256] [--max-peak-mb N]
+"""
+import os
+import sys
+import zlib
+import struct
+import shutil
+import argparse
+import resource
+import tempfile
+import threading
+import tracemalloc
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+from appimage_icons import IconSearcher, IconResultStore  # noqa: E402
+
+DISTINCT_PAYLOADS = 16
+
+
+def make_png(size):
+    """Sıkıştırılamayan gürültüden geçerli bir RGBA PNG üretir"""
+    raw = b"".join(b"\x00" + os.urandom(size * 4) for _ in range(size))
+
+    def chunk(tag, data):
+        return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data) & 0xffffffff)
+
+    return (b"\x89PNG\r\n\x1a\n"
+            + chunk(b"IHDR", struct.pack(">IIBBBBB", size, size, 8, 6, 0, 0, 0))
+            + chunk(b"IDAT", zlib.compress(raw, 1))
+            + chunk(b"IEND", b""))
+
+
+class IconHandler(BaseHTTPRequestHandler):
+    payloads = []
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        try:
+            index = int(self.path.rsplit("/", 1)[-1].split(".")[0])
+        except ValueError:
+            self.send_error(404)
+            return
+        body = self.payloads[index % len(self.payloads)]
+        self.send_response(200)
+        self.send_header("Content-Type", "image/png")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class LocalIconSearcher(IconSearcher):
+    """Ağ kaynakları yerine yerel sunucudaki adayları indirir"""
+
+    def __init__(self, base_url, count, store, on_found):
+        super().__init__("bench", store, on_found)
+        self.base_url = base_url
+        self.count = count
+
+    async def search_icons(self):
+        import asyncio
+        import aiohttp
+
+        async with aiohttp.ClientSession() as session:
+            await asyncio.gather(*(self.fetch_icon(session, f"{self.base_url}/icon/{i}.png", "Bench")
+                                   for i in range(self.count)))
+
+
+def max_rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def measure(label, run):
+    tracemalloc.reset_peak()
+    before = tracemalloc.get_traced_memory()[0]
+    result = run()
+    peak = (tracemalloc.get_traced_memory()[1] - before) / (1024 * 1024)
+    print(f"{label}: tracemalloc tepe {peak:.1f} MB, en yüksek RSS {max_rss_mb():.0f} MB")
+    return peak, result
+
+
+def run_dialog(base_url, count, store_dir):
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt5.QtWidgets import QApplication
+    import appimage_installer
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    dialog = appimage_installer.EditAppDialog("Bench", {})
+    dialog.icon_store = IconResultStore(store_dir)
+    dialog.show()
+    app.processEvents()
+
+    def search_and_scroll():
+        # Gerçek pencerede sinyal ile gelen çağrı burada doğrudan yapılır
+        LocalIconSearcher(base_url, count, dialog.icon_store,
+                          lambda r: dialog.add_icon_to_list(r.url, r.source, r.path)).run()
+        icons = dialog.found_icons_list
+        for row in range(icons.count()):
+            icons.scrollToItem(icons.item(row))
+            if row % 8 == 0:
+                icons.viewport().repaint()
+                app.processEvents()
+        return icons.count(), len(dialog.thumbnails.keys)
+
+    peak, (shown, cached) = measure("Düzenleme penceresi", search_and_scroll)
+    print(f"  {shown} aday listede, önbellekte {cached} küçük resim "
+          f"(sınır {appimage_installer.THUMBNAIL_CACHE_ENTRIES})")
+    dialog.cleanup_temp_icons()
+    dialog.close()
+    return peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--candidates", type=int, default=240)
+    parser.add_argument("--icon-px", type=int, default=256, help="Aday PNG'lerin kenar uzunluğu")
+    parser.add_argument("--max-peak-mb", type=float, help="Pencere ölçümünde izin verilen tracemalloc tepesi")
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix="bench_icons_")
+    # Pencere ~/.cache altına yazar ve çalışma dizinine log bırakır
+    os.environ["HOME"] = work_dir
+    os.chdir(work_dir)
+
+    IconHandler.payloads = [make_png(args.icon_px) for _ in range(DISTINCT_PAYLOADS)]
+    server = ThreadingHTTPServer(("127.0.0.1", 0), IconHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+    total_mb = args.candidates * len(IconHandler.payloads[0]) / (1024 * 1024)
+    print(f"{args.candidates} aday, her biri {len(IconHandler.payloads[0]) // 1024} KB (toplam {total_mb:.0f} MB)")
+
+    # Modül yüklemesi oturum belleği değildir; ölçüme girmesin
+    import asyncio  # noqa: F401
+    import aiohttp  # noqa: F401
+
+    tracemalloc.start()
+    try:
+        store = IconResultStore(os.path.join(work_dir, "store"))
+        measure("Sonuç deposu", lambda: LocalIconSearcher(base_url, args.candidates, store, lambda r: None).run())
+        print(f"  {len(store)} sonuç diskte ({store.total_bytes / (1024 * 1024):.0f} MB)")
+
+        dialog_peak = None
+        try:
+            dialog_peak = run_dialog(base_url, args.candidates, os.path.join(work_dir, "dialog"))
+        except ImportError as e:
+            print(f"Pencere ölçümü atlandı: {e}")
+
+        # Eski davranış: her gövde sinyal ile bayt olarak taşınıp bellekte tutuluyordu
+        bodies = []
+        baseline = IconResultStore(os.path.join(work_dir, "baseline"))
+
+        def keep_bytes(result):
+            with open(result.path, "rb") as f:
+                bodies.append(f.read())
+
+        measure("Karşılaştırma (gövdeler bellekte)",
+                lambda: LocalIconSearcher(base_url, args.candidates, baseline, keep_bytes).run())
+
+        if args.max_peak_mb is not None and dialog_peak is not None and dialog_peak > args.max_peak_mb:
+            print(f"HATA: pencere tepe belleği {dialog_peak:.1f} MB > {args.max_peak_mb} MB")
+            return 1
+        return 0
+    finally:
+        tracemalloc.stop()
+        server.shutdown()
+        os.chdir("/")
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
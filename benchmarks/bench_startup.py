@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""Başlangıç süresi ölçümü: `-X importtime` ve ilk çizime kadar geçen süre.
+
+Kullanım:
+    python3 benchmarks/bench_startup.py [--max-import-ms N] [--max-paint-ms N]
+
+Eşikler aşılırsa veya ağır modüller açılışta yüklenirse sıfırdan farklı
+bir çıkış koduyla biter; böylece gerilemeler yakalanır.
+"""
+import os
+import re
+import sys
+import argparse
+import subprocess
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Ana liste gösterilmeden önce yüklenmemesi gereken modüller
+LAZY_MODULES = ("aiohttp", "asyncio", "requests", "cairosvg")
+
+PAINT_SNIPPET = r"""
+import sys, time
+start = time.perf_counter()
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import QTimer
+import appimage_installer
+
+app = QApplication(sys.argv)
+window = appimage_installer.AppImageInstaller()
+
+def first_paint():
+    elapsed = (time.perf_counter() - start) * 1000
+    loaded = [m for m in %r if m in sys.modules]
+    print(f"PAINT {elapsed:.1f} {','.join(loaded)}")
+    app.quit()
+
+window.show()
+QTimer.singleShot(0, first_paint)
+app.exec_()
+"""
+
+
+def run_python(args, env=None):
+    return subprocess.run([sys.executable] + args, cwd=REPO_DIR, env=env,
+                          capture_output=True, text=True, check=True)
+
+
+def measure_import(module):
+    """`-X importtime` çıktısından toplam süreyi ve yüklenen modülleri döndürür"""
+    result = run_python(["-X", "importtime", "-c", f"import {module}"])
+    total_us = 0
+    loaded = set()
+    for line in result.stderr.splitlines():
+        match = re.match(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)", line)
+        if not match:
+            continue
+        loaded.add(match.group(4).split(".")[0])
+        if match.group(3) == " ":
+            total_us += int(match.group(2))
+    return total_us / 1000, loaded
+
+
+def measure_first_paint():
+    env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen"))
+    result = run_python(["-c", PAINT_SNIPPET % (LAZY_MODULES,)], env=env)
+    for line in result.stdout.splitlines():
+        if line.startswith("PAINT "):
+            _, elapsed, loaded = (line.split(" ", 2) + [""])[:3]
+            return float(elapsed), set(filter(None, loaded.split(",")))
+    raise RuntimeError("İlk çizim süresi okunamadı")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--max-import-ms", type=float, default=None)
+    parser.add_argument("--max-paint-ms", type=float, default=None)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    failures = []
+
+    core_ms, core_loaded = min(measure_import("appimage_core") for _ in range(args.repeat))
+    print(f"appimage_core içe aktarma: {core_ms:.1f} ms")
+    if "PyQt5" in core_loaded:
+        failures.append("appimage_core PyQt5'i içe aktarıyor")
+
+    gui_ms, gui_loaded = min(measure_import("appimage_installer") for _ in range(args.repeat))
+    print(f"appimage_installer içe aktarma: {gui_ms:.1f} ms")
+    eager = sorted(gui_loaded.intersection(LAZY_MODULES))
+    if eager:
+        failures.append(f"Açılışta yüklenen ağır modüller: {', '.join(eager)}")
+    if args.max_import_ms is not None and gui_ms > args.max_import_ms:
+        failures.append(f"İçe aktarma {gui_ms:.1f} ms > {args.max_import_ms} ms")
+
+    try:
+        paint_ms, paint_loaded = min(measure_first_paint() for _ in range(args.repeat))
+    except subprocess.CalledProcessError as e:
+        print(f"İlk çizim ölçülemedi:\n{e.stderr}")
+        return 1
+    print(f"İlk çizime kadar: {paint_ms:.1f} ms")
+    if paint_loaded:
+        failures.append(f"İlk çizimden önce yüklenen modüller: {', '.join(sorted(paint_loaded))}")
+    if args.max_paint_ms is not None and paint_ms > args.max_paint_ms:
+        failures.append(f"İlk çizim {paint_ms:.1f} ms > {args.max_paint_ms} ms")
+
+    for failure in failures:
+        print(f"GERİLEME: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,28 @@
+"""Testler için ortak yardımcılar"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import appimage_core as core  # noqa: E402
+
+
+def _use_home(monkeypatch, home):
+    """Çekirdeğin içe aktarılırken hesapladığı dizinleri verilen ev dizinine taşır"""
+    monkeypatch.setenv("HOME", home)
+    appimages_dir = os.path.join(home, ".local/share/appimages")
+    monkeypatch.setattr(core, "APPIMAGES_DIR", appimages_dir)
+    monkeypatch.setattr(core, "APPS_FILE", os.path.join(appimages_dir, "installed_apps.json"))
+    monkeypatch.setattr(core, "VERSIONS_DIR", os.path.join(appimages_dir, "versions"))
+    monkeypatch.setattr(core, "APPLICATIONS_DIR", os.path.join(home, ".local/share/applications"))
+    monkeypatch.setattr(core, "ICON_DIR", os.path.join(home, ".local/share/icons/hicolor/128x128/apps"))
+    monkeypatch.setattr(core, "DESKTOP_DIR", os.path.join(home, "Desktop"))
+    monkeypatch.setattr(core, "refresh_desktop_databases", lambda: None)
+
+
+@pytest.fixture
+def use_home(monkeypatch):
+    """Ev dizinini değiştiren işlev; çağrıldığı testin sonunda geri alınır"""
+    return lambda home: _use_home(monkeypatch, home)
@@ -0,0 +1,157 @@
+"""appimage_archive: yol yeniden yazma ve güvensiz arşiv üyeleri"""
+import io
+import os
+import sys
+import json
+import tarfile
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import appimage_core as core  # noqa: E402
+import appimage_archive as archive  # noqa: E402
+
+
+def build_library(home):
+    version_path = os.path.join(core.VERSIONS_DIR, "Foo", "1.AppImage")
+    os.makedirs(os.path.dirname(version_path))
+    with open(version_path, "wb") as f:
+        f.write(b"\x7fELF\x02\x01\x01\x00AI\x02" + bytes(1000))
+    stable_path = os.path.join(core.APPIMAGES_DIR, "Foo.AppImage")
+    os.symlink(os.path.relpath(version_path, core.APPIMAGES_DIR), stable_path)
+    content = core.build_desktop_entry("Foo", stable_path, core.DEFAULT_ICON)
+    core.write_desktop_files("Foo", content)
+    core.write_installed_apps({"Foo": {
+        "path": stable_path,
+        "icon": core.DEFAULT_ICON,
+        "versions": [{"id": "1", "path": version_path, "file_name": "Foo.AppImage", "size": 1011}],
+        "active_version": "1",
+    }})
+
+
+def crafted_archive(members, apps=None):
+    """Verilen (TarInfo, veri) üyeleri ve kayıtla geçerli manifest'li bir arşiv"""
+    manifest = json.dumps({
+        "format": archive.FORMAT_VERSION,
+        "roots": archive.library_roots(),
+        "default_icon": core.DEFAULT_ICON,
+        "apps": apps or {},
+    }).encode()
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as tar:
+        info = tarfile.TarInfo(archive.MANIFEST_NAME)
+        info.size = len(manifest)
+        tar.addfile(info, io.BytesIO(manifest))
+        for info, data in members:
+            tar.addfile(info, io.BytesIO(data) if data is not None else None)
+    buffer.seek(0)
+    return buffer
+
+
+def file_member(name, data):
+    info = tarfile.TarInfo(name)
+    info.size = len(data)
+    return info, data
+
+
+def symlink_member(name, target):
+    info = tarfile.TarInfo(name)
+    info.type = tarfile.SYMTYPE
+    info.linkname = target
+    return info, None
+
+
+def test_rewrite_text_prefix_sharing_home():
+    mapping = sorted([("/home/user/.local/share/appimages", "/home/user2/.local/share/appimages"),
+                      ("/home/user", "/home/user2")], key=lambda item: -len(item[0]))
+    text = ("Exec=/home/user/.local/share/appimages/X.AppImage %U\n"
+            "Icon=/home/user/icon.png\n"
+            "Path=/home/username/keep\n")
+    assert archive._rewrite_text(text, mapping) == (
+        "Exec=/home/user2/.local/share/appimages/X.AppImage %U\n"
+        "Icon=/home/user2/icon.png\n"
+        "Path=/home/username/keep\n")
+
+
+def test_round_trip_to_prefix_sharing_home(tmp_path, use_home):
+    source_home = str(tmp_path / "user")
+    target_home = str(tmp_path / "user2")
+    use_home(source_home)
+    build_library(source_home)
+    exported = io.BytesIO()
+    archive.export_library(exported)
+
+    use_home(target_home)
+    exported.seek(0)
+    archive.import_library(exported)
+
+    stable_path = os.path.join(core.APPIMAGES_DIR, "Foo.AppImage")
+    assert core.load_installed_apps()["Foo"]["path"] == stable_path
+    with open(core.desktop_file_paths("Foo")[1]) as f:
+        assert f"Exec=python3 {core.LAUNCHER} {stable_path} " in f.read()
+    assert os.path.isfile(stable_path)
+
+
+def test_symlink_out_of_library_rejected(tmp_path, use_home):
+    use_home(str(tmp_path / "home"))
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    source = crafted_archive([symlink_member("appimages/evil", str(outside)),
+                              file_member("appimages/evil/pwned", b"x")])
+    with pytest.raises(archive.ArchiveError):
+        archive.import_library(source)
+    assert not (outside / "pwned").exists()
+
+
+@pytest.mark.parametrize("name, target", [
+    ("appimages/Foo.AppImage", "../../../../outside"),
+    ("appimages/versions/Foo/link", "1.AppImage"),
+    ("icons/Foo.png", "/etc/passwd"),
+])
+def test_unexpected_symlinks_rejected(tmp_path, use_home, name, target):
+    use_home(str(tmp_path / "home"))
+    with pytest.raises(archive.ArchiveError):
+        archive.import_library(crafted_archive([symlink_member(name, target)]))
+
+
+def test_existing_symlink_out_of_root_rejected(tmp_path, use_home):
+    use_home(str(tmp_path / "home"))
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    os.makedirs(core.ICON_DIR)
+    os.symlink(str(outside), os.path.join(core.ICON_DIR, "sub"))
+    with pytest.raises(archive.ArchiveError):
+        archive.import_library(crafted_archive([file_member("icons/sub/x.png", b"x")]))
+    assert not (outside / "x.png").exists()
+
+
+def test_home_member_rejected(tmp_path, use_home):
+    home = tmp_path / "home"
+    use_home(str(home))
+    with pytest.raises(archive.ArchiveError):
+        archive.import_library(crafted_archive([file_member("home/.bashrc", b"evil")]))
+    assert not (home / ".bashrc").exists()
+
+
+@pytest.mark.parametrize("field", ["path", "version", "icon", "name"])
+def test_registry_paths_outside_library_rejected(tmp_path, use_home, field):
+    use_home(str(tmp_path / "home"))
+    victim = str(tmp_path / "victim" / "sub")
+    app_info = {
+        "path": os.path.join(core.APPIMAGES_DIR, "Evil.AppImage"),
+        "icon": core.DEFAULT_ICON,
+        "versions": [{"id": "1", "path": os.path.join(core.VERSIONS_DIR, "Evil", "1.AppImage")}],
+    }
+    app_name = "Evil"
+    if field == "path":
+        app_info["path"] = os.path.join(victim, "Evil.AppImage")
+    elif field == "version":
+        app_info["versions"][0]["path"] = os.path.join(core.VERSIONS_DIR, "..", "..", "x.AppImage")
+    elif field == "icon":
+        app_info["icon"] = os.path.join(victim, "icon.png")
+    else:
+        app_name = "../../victim"
+    with pytest.raises(archive.ArchiveError):
+        archive.import_library(crafted_archive([], {app_name: app_info}))
+    assert app_name not in core.load_installed_apps()
@@ -0,0 +1,86 @@
+"""appimage_core: sürüm dizinleri ve kaldırma"""
+import os
+
+import appimage_core as core
+
+
+def fake_appimage(path):
+    with open(path, "wb") as f:
+        f.write(b"\x7fELF\x02\x01\x01\x00AI\x02" + bytes(100))
+    return path
+
+
+def add_app(installed_apps, app_name, source):
+    app_info = {"path": os.path.join(core.APPIMAGES_DIR, os.path.basename(source)),
+                "icon": core.DEFAULT_ICON, "comment": core.DEFAULT_COMMENT}
+    version = core.add_version(app_name, app_info, source)
+    core.activate_version(app_name, app_info, version['id'])
+    core.write_desktop_files(app_name, core.build_desktop_entry(app_name, app_info['path'], app_info['icon']))
+    installed_apps[app_name] = app_info
+    return app_info
+
+
+def test_remove_keeps_versions_of_app_sharing_old_directory(tmp_path, use_home):
+    use_home(str(tmp_path / "home"))
+    apps = {}
+    add_app(apps, "Foo", fake_appimage(str(tmp_path / "Foo.AppImage")))
+    add_app(apps, "Bar", fake_appimage(str(tmp_path / "Bar.AppImage")))
+    apps = core.edit_apps(apps, {"Foo": {"name": "Qux"}})
+    apps = core.edit_apps(apps, {"Bar": {"name": "Foo"}})
+    # Foo (eski Bar) güncellenince yeni sürüm Qux'un eski dizinine, versions/Foo'ya düşer
+    core.install_appimage(fake_appimage(str(tmp_path / "Bar.AppImage")), apps)
+    foo_active = next(v['path'] for v in apps["Foo"]["versions"]
+                      if v['id'] == apps["Foo"]["active_version"])
+    assert os.path.dirname(foo_active) == os.path.dirname(apps["Qux"]["versions"][0]['path'])
+
+    apps = core.remove_apps(apps, ["Qux"])
+
+    assert os.path.isfile(foo_active)
+    assert os.path.isfile(apps["Foo"]["path"])
+
+
+def test_remove_deletes_empty_version_directory(tmp_path, use_home):
+    use_home(str(tmp_path / "home"))
+    apps = {}
+    add_app(apps, "Foo", fake_appimage(str(tmp_path / "Foo.AppImage")))
+    apps = core.remove_apps(apps, ["Foo"])
+    assert not os.path.exists(core.version_dir("Foo"))
+    assert not os.path.lexists(os.path.join(core.APPIMAGES_DIR, "Foo.AppImage"))
+
+
+def interrupted_removal(apps, app_name):
+    """Kaldırmayı kayıt yazıldıktan sonra, onaylanmadan bırakır (süreç ölmüş gibi)"""
+    transaction = core.FileTransaction()
+    new_apps = dict(apps)
+    core.remove_app_files(app_name, new_apps.pop(app_name), transaction)
+    transaction.keep(core.APPS_FILE)
+    core.write_installed_apps(new_apps)
+    os.close(transaction.lock_fd)
+    os.utime(transaction.backup_dir, (0, 0))
+    return transaction.backup_dir
+
+
+def test_recover_rolls_back_interrupted_transaction(tmp_path, use_home):
+    use_home(str(tmp_path / "home"))
+    apps = {}
+    add_app(apps, "Foo", fake_appimage(str(tmp_path / "Foo.AppImage")))
+    core.write_installed_apps(apps)
+    backup_dir = interrupted_removal(apps, "Foo")
+    assert "Foo" not in core.load_installed_apps()
+
+    assert core.recover_transactions() == 1
+
+    assert "Foo" in core.load_installed_apps()
+    assert os.path.isfile(apps["Foo"]["path"])
+    assert os.path.isfile(core.desktop_file_paths("Foo")[1])
+    assert not os.path.exists(backup_dir)
+
+
+def test_recover_skips_transaction_in_progress(tmp_path, use_home):
+    use_home(str(tmp_path / "home"))
+    transaction = core.FileTransaction()
+    os.utime(transaction.backup_dir, (0, 0))
+    assert core.recover_transactions() == 0
+    assert os.path.isdir(transaction.backup_dir)
+    transaction.commit()
+    assert not os.path.exists(transaction.backup_dir)
@@ -0,0 +1,36 @@
+"""appimage_gc: eskimiş raporla temizlik"""
+import os
+
+import appimage_core as core
+import appimage_gc
+
+from test_core import add_app, fake_appimage
+
+
+def test_reclaim_skips_orphan_registered_since_analysis(tmp_path, use_home):
+    use_home(str(tmp_path / "home"))
+    os.makedirs(core.APPIMAGES_DIR)
+    orphan = fake_appimage(os.path.join(core.APPIMAGES_DIR, "Foo.AppImage"))
+    report = appimage_gc.analyze()
+    assert [c.path for c in report.candidates if c.kind == appimage_gc.ORPHAN_APPIMAGE] == [orphan]
+
+    # Rapor onaylanmadan önce aynı dosya kaydedilir
+    apps = {}
+    add_app(apps, "Foo", orphan)
+    core.write_installed_apps(apps)
+
+    freed, removed = appimage_gc.reclaim(report)
+    assert orphan not in removed
+    assert os.path.isfile(apps["Foo"]["path"])
+
+
+def test_stale_desktop_entry_resolved_through_launcher(tmp_path, use_home):
+    use_home(str(tmp_path / "home"))
+    apps = {}
+    add_app(apps, "Foo", fake_appimage(str(tmp_path / "Foo.AppImage")))
+    add_app(apps, "Bar", fake_appimage(str(tmp_path / "Bar.AppImage")))
+    core.write_installed_apps(apps)
+    os.remove(apps["Bar"]["path"])
+
+    stale = [c.path for c in appimage_gc.analyze().candidates if c.kind == appimage_gc.STALE_DESKTOP]
+    assert stale == [core.desktop_file_paths("Bar")[1]]
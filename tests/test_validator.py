@@ -0,0 +1,37 @@
+"""appimage_validator: bozuk bölüm tabloları"""
+import struct
+
+import pytest
+
+import appimage_validator as validator
+
+
+def build_appimage(path, digest_size):
+    """Bölüm tablosu ve squashfs yükü olan en küçük 64 bit tip 2 AppImage"""
+    strtab = b"\0.shstrtab\0.digest_md5\0".ljust(32, b"\0")
+    shoff = 64 + len(strtab)
+    header = bytearray(64)
+    header[:16] = b"\x7fELF\x02\x01\x01\x00AI\x02".ljust(16, b"\0")
+    struct.pack_into("<Q", header, 0x28, shoff)
+    struct.pack_into("<HHH", header, 0x3A, 64, 3, 1)
+    sections = [
+        struct.pack("<IIQQQQ", 0, 0, 0, 0, 0, 0).ljust(64, b"\0"),
+        struct.pack("<IIQQQQ", 1, 3, 0, 0, 64, len(strtab)).ljust(64, b"\0"),
+        struct.pack("<IIQQQQ", 11, 1, 0, 0, 64, digest_size).ljust(64, b"\0"),
+    ]
+    with open(path, "wb") as f:
+        f.write(bytes(header) + strtab + b"".join(sections) + b"hsqs" + bytes(1000))
+    return str(path)
+
+
+def test_valid_section_table(tmp_path):
+    info = validator.validate_appimage(build_appimage(tmp_path / "ok.AppImage", 16), verify=True)
+    assert info.valid
+    assert info.sections[".digest_md5"] == (64, 16)
+
+
+@pytest.mark.parametrize("digest_size", [10 ** 6, 2 ** 62])
+def test_section_outside_file_rejected(tmp_path, digest_size):
+    info = validator.validate_appimage(build_appimage(tmp_path / "bad.AppImage", digest_size), verify=True)
+    assert not info.valid
+    assert "sınırları dışında" in info.reason